@@ -0,0 +1,132 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : bench_renderers.py
+
+Benchmark of the report artifacts on their own.  The report data is built by
+generate_report_data.py instead of being collected, then each requested
+format is created from it.  The time per inventory row and the size of the
+file created are printed for each size and format.
+
+With --history the results are appended to a JSON Lines file along with the
+report version so the cost of each format can be followed across releases,
+the change from the last recorded run of the same size is shown.  --profile
+runs a format under cProfile and prints the most expensive functions.
+
+Requires the common submodule (git submodule update --init) for the branding
+used by the html and xlsx reports.
+
+    python benchmarks/bench_renderers.py
+    python benchmarks/bench_renderers.py --sizes 500:200000 --branching 1 --history renderer_history.jsonl
+    python benchmarks/bench_renderers.py --sizes 50:20000 --formats html --profile
+'''
+import os, sys, gc, json, time, argparse, tempfile, cProfile, pstats, platform
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+import generate_report_data
+
+import _version
+import report_artifacts
+
+#----------------------------------------------------------------------------------------#
+def create_artifact(reportFormat, reportData, profileOutput):
+    artifactGenerator = report_artifacts.get_artifact_generator(reportFormat)
+
+    gc.collect()  # Don't charge one format for the garbage of the one before it
+
+    if profileOutput:
+        artifactProfile = cProfile.Profile()
+        startTime = time.perf_counter()
+        artifactFiles = artifactProfile.runcall(artifactGenerator, reportData)
+        elapsedSeconds = time.perf_counter() - startTime
+        pstats.Stats(artifactProfile, stream=profileOutput).sort_stats("cumulative").print_stats(25)
+    else:
+        startTime = time.perf_counter()
+        artifactFiles = artifactGenerator(reportData)
+        elapsedSeconds = time.perf_counter() - startTime
+
+    # Some formats create several files (parquet) or none when an optional module is missing
+    if not isinstance(artifactFiles, list):
+        artifactFiles = [artifactFiles]
+
+    return elapsedSeconds, sum(os.path.getsize(artifactFile) for artifactFile in artifactFiles)
+
+#----------------------------------------------------------------------------------------#
+def load_history(historyFile):
+    # Last recorded result for each size, shape and format
+    previousResults = {}
+    if historyFile and os.path.exists(historyFile):
+        with open(historyFile) as historyPtr:
+            for historyLine in historyPtr:
+                if historyLine.strip():
+                    historyEntry = json.loads(historyLine)
+                    previousResults[get_result_key(historyEntry)] = historyEntry
+    return previousResults
+
+#----------------------------------------------------------------------------------------#
+def get_result_key(benchmarkResult):
+    return (benchmarkResult["numProjects"], benchmarkResult["numItems"], benchmarkResult["branchingFactor"], benchmarkResult["cvssVersion"], benchmarkResult["reportFormat"])
+
+#----------------------------------------------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark each report format from generated report data")
+    parser.add_argument("--sizes", default="1:1000,50:20000,500:200000", help="Comma separated projects:items pairs to run")
+    parser.add_argument("--formats", default="html,xlsx", help="Report formats to create")
+    parser.add_argument("--branching", type=int, default=10, help="Child projects under each project, 1 for a deep chain")
+    parser.add_argument("--cvss", default="3.x", choices=["2.0", "3.x"])
+    parser.add_argument("--threshold", type=int, default=10000, help="largeReportThreshold option")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs of each format, the fastest is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile", action="store_true", help="Print a cProfile summary of each format")
+    parser.add_argument("--history", help="JSON Lines file the results are appended to")
+    parser.add_argument("--output", default=os.path.join(tempfile.gettempdir(), "project_inventory_bench", "renderers"), help="Where the report artifacts are written")
+    args = parser.parse_args()
+
+    historyFile = os.path.abspath(args.history) if args.history else None
+    os.makedirs(args.output, exist_ok=True)
+    os.chdir(args.output)  # The report artifacts are written to the working directory
+
+    reportFormats = [reportFormat.strip() for reportFormat in args.formats.split(",")]
+    previousResults = load_history(historyFile)
+
+    print("%8s %8s %8s %10s %12s %12s  %s" %("projects", "items", "format", "seconds", "us per row", "file size", "change"))
+
+    for sizePair in args.sizes.split(","):
+        numProjects, numItems = [int(sizeValue) for sizeValue in sizePair.split(":")]
+
+        reportData = generate_report_data.generate_report_data(numProjects, numItems, args.branching, args.cvss, True, args.threshold, args.seed)
+
+        for reportFormat in reportFormats:
+            profileOutput = sys.stdout if args.profile else None
+            runs = [create_artifact(reportFormat, reportData, profileOutput) for runNumber in range(args.repeat)]
+            elapsedSeconds = min(run[0] for run in runs)
+            fileBytes = runs[-1][1]
+
+            benchmarkResult = {"reportVersion" : _version.__version__, "recordedOn" : time.strftime("%Y-%m-%dT%H:%M:%S"), "python" : platform.python_version(),
+                                "numProjects" : numProjects, "numItems" : numItems, "branchingFactor" : args.branching, "cvssVersion" : args.cvss,
+                                "reportFormat" : reportFormat, "seconds" : round(elapsedSeconds, 4), "microsecondsPerRow" : round(elapsedSeconds / numItems * 1000000, 2),
+                                "fileBytes" : fileBytes}
+
+            # Compare against the last recorded run of the same benchmark
+            previousResult = previousResults.get(get_result_key(benchmarkResult))
+            if previousResult:
+                change = "%+.1f%% time %+.1f%% size vs %s" %((benchmarkResult["seconds"] / previousResult["seconds"] - 1) * 100,
+                                                            (fileBytes / max(previousResult["fileBytes"], 1) - 1) * 100, previousResult["reportVersion"])
+            else:
+                change = ""
+
+            print("%8s %8s %8s %10.2f %12.2f %9.1f MB  %s" %(numProjects, numItems, reportFormat, elapsedSeconds, benchmarkResult["microsecondsPerRow"], fileBytes / (1024 * 1024), change))
+
+            if historyFile:
+                with open(historyFile, "a") as historyPtr:
+                    historyPtr.write(json.dumps(benchmarkResult) + "\n")
+
+        del reportData
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
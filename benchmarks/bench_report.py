@@ -0,0 +1,262 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : bench_report.py
+
+End to end benchmark of the report without a Code Insight server.  For each
+size a fixture is generated (see generate_fixtures.py), served by the stub
+server (see stub_server.py) and the report is run against it in a fresh
+process: gather_data_for_report followed by each requested report format.
+Wall time, API calls and the peak RSS of the report process are printed.
+
+Requires the common submodule (git submodule update --init) since the real
+API modules are what get measured.  Before each run every API call the report
+makes is sent once through the common modules and the fields the report reads
+are checked in what comes back, so the benchmark stops rather than measuring
+a stub that has drifted from those modules.  If the stub server logs "No
+route for" a path, the routes in stub_server.py need that path added.
+
+    python benchmarks/bench_report.py
+    python benchmarks/bench_report.py --sizes 1:1000,50:20000,500:200000 --latency 0.02
+'''
+import os, sys, json, time, argparse, tempfile, subprocess
+import urllib.request
+
+benchmarkDirectory = os.path.dirname(os.path.realpath(__file__))
+repositoryDirectory = os.path.join(benchmarkDirectory, "..")
+
+sys.path.insert(0, benchmarkDirectory)
+import generate_fixtures
+
+#----------------------------------------------------------------------------------------#
+def start_stub_server(fixtureDirectory, latency):
+    stubProcess = subprocess.Popen([sys.executable, os.path.join(benchmarkDirectory, "stub_server.py"), "--fixtures", fixtureDirectory, "--latency", str(latency)],
+                                    stdout=subprocess.PIPE, text=True)
+
+    listeningLine = stubProcess.stdout.readline()
+    if not listeningLine.startswith("Listening on "):
+        stubProcess.kill()
+        raise RuntimeError("Stub server failed to start for %s" %fixtureDirectory)
+
+    return stubProcess, listeningLine.split("Listening on ")[1].strip()
+
+#----------------------------------------------------------------------------------------#
+def get_stub_stats(baseURL):
+    with urllib.request.urlopen(baseURL + "/_stub/stats") as response:
+        return json.load(response)
+
+#----------------------------------------------------------------------------------------#
+def reset_stub_stats(baseURL):
+    urllib.request.urlopen(urllib.request.Request(baseURL + "/_stub/reset", data=b"", method="POST")).close()
+
+#----------------------------------------------------------------------------------------#
+def run_size(args, numProjects, numItems):
+
+    fixtureDirectory = os.path.join(args.fixtures_root, "p%s-i%s-s%s" %(numProjects, numItems, args.seed))
+    generateStartTime = time.perf_counter()
+    generate_fixtures.generate_fixtures(fixtureDirectory, numProjects, numItems, seed=args.seed)
+    generateSeconds = time.perf_counter() - generateStartTime
+
+    stubProcess, baseURL = start_stub_server(fixtureDirectory, args.latency)
+    try:
+        # Each run gets its own process so the peak RSS is for that size alone
+        runCommand = [sys.executable, os.path.realpath(__file__), "--run-one", "--url", baseURL, "--formats", args.formats,
+                        "--cvss", args.cvss, "--concurrency", str(args.concurrency), "--rate", str(args.rate), "--output", os.path.join(args.output, "p%s-i%s" %(numProjects, numItems))]
+        runProcess = subprocess.run(runCommand, stdout=subprocess.PIPE, text=True)
+        if runProcess.returncode != 0:
+            raise RuntimeError("Report run failed for %s projects and %s items" %(numProjects, numItems))
+
+        runResult = json.loads(runProcess.stdout.strip().splitlines()[-1])
+        runResult["serverCalls"] = get_stub_stats(baseURL)
+    finally:
+        stubProcess.terminate()
+        stubProcess.wait()
+
+    runResult["generateSeconds"] = generateSeconds
+    return runResult
+
+#----------------------------------------------------------------------------------------#
+def check_stub_shapes(baseURL, cvssVersion):
+    # Call each API the report uses through the common modules, as the report does, and check the
+    # fields report_data reads are there.  Returns a list of problems, empty if everything matched
+    import common.api.system.release
+    import common.api.project.get_child_projects
+    import common.api.project.get_project_information
+    import common.api.license.license_lookup
+    import common.api.component.get_component_details
+    import report_inventory_pages
+
+    problems = []
+
+    def check_fields(description, payload, fieldNames):
+        if not isinstance(payload, dict):
+            problems.append("%s returned %s" %(description, type(payload).__name__))
+            return False
+        missingFields = [fieldName for fieldName in fieldNames if fieldName not in payload]
+        if missingFields:
+            problems.append("%s is missing %s" %(description, ", ".join(missingFields)))
+        return not missingFields
+
+    def call(description, apiFunction, *args):
+        try:
+            return apiFunction(*args)
+        except Exception as error:
+            problems.append("%s failed: %s" %(description, error))
+            return None
+
+    releaseDetails = call("Release details", common.api.system.release.get_release_details, baseURL, "benchmark")
+    check_fields("Release details", releaseDetails, ["fnci.release.name"])
+
+    projectHierarchy = call("Project hierarchy", common.api.project.get_child_projects.get_child_projects_recursively, baseURL, "1", "benchmark")
+    if not check_fields("Project hierarchy", projectHierarchy, ["id", "name", "childProject"]):
+        return problems
+
+    projectInformation = call("Project information", common.api.project.get_project_information.get_project_information_summary, baseURL, projectHierarchy["id"], "benchmark")
+    if check_fields("Project information", projectInformation, ["licenses", "vulnerabilities"]):
+        check_fields("Project information licenses", projectInformation["licenses"], ["P1", "P2", "P3", "Unknown"])
+        vulnerabilitySummary = "CvssV3" if cvssVersion == "3.x" else "CvssV2"
+        if check_fields("Project information vulnerabilities", projectInformation["vulnerabilities"], [vulnerabilitySummary]):
+            check_fields("Project information %s" %vulnerabilitySummary, projectInformation["vulnerabilities"][vulnerabilitySummary],
+                            ["Critical", "High", "Medium", "Low", "None"] if cvssVersion == "3.x" else ["High", "Medium", "Low", "Unknown"])
+
+    # The inventory is read a page at a time outside of the common modules, compare its first page with theirs
+    inventoryPage = call("Inventory summary page", report_inventory_pages.get_inventory_summary_page, baseURL, projectHierarchy["id"], "benchmark", cvssVersion, 1)
+    getInventorySummary = common.api.project.get_inventory_summary.get_project_inventory_with_v3_summary if cvssVersion == "3.x" else common.api.project.get_inventory_summary.get_project_inventory_with_v2_summary
+    inventorySummary = call("Inventory summary", getInventorySummary, baseURL, projectHierarchy["id"], "benchmark")
+    if inventoryPage is None or inventorySummary is None:
+        return problems
+    if inventorySummary[:len(inventoryPage[0])] != inventoryPage[0]:
+        problems.append("The first inventory summary page does not match the start of the inventory from the common module")
+    if not inventoryPage[0]:
+        problems.append("The inventory summary of project %s is empty" %projectHierarchy["id"])
+        return problems
+
+    inventoryItem = inventoryPage[0][0]
+    check_fields("Inventory item", inventoryItem, ["id", "name", "componentName", "componentId", "priority", "componentVersionName", "selectedLicenseId",
+                                                    "selectedLicenseSPDXIdentifier", "url", "reviewStatus", "vulnerabilitySummary"])
+
+    licenseInformation = call("License lookup", common.api.license.license_lookup.get_license_details, baseURL, inventoryItem["selectedLicenseId"], "benchmark")
+    check_fields("License lookup", licenseInformation, ["url", "spdxIdentifier", "priority", "shortName"])
+
+    componentDetails = call("Component details", common.api.component.get_component_details.get_component_details_v3_summary, baseURL, inventoryItem["componentId"], "benchmark")
+    if check_fields("Component details", componentDetails, ["data"]) and check_fields("Component details data", componentDetails["data"], ["versionList"]):
+        for versionDetails in componentDetails["data"]["versionList"][:1]:
+            check_fields("Component version", versionDetails, ["name"])
+
+    return problems
+
+#----------------------------------------------------------------------------------------#
+def run_one(args):
+    # Runs in its own process against a stub server that is already listening
+    os.makedirs(args.output, exist_ok=True)
+    os.chdir(args.output)  # The report artifacts are written to the working directory
+    sys.path.insert(0, repositoryDirectory)
+
+    import logging
+    logging.basicConfig(format='%(asctime)s,%(msecs)-3d  %(levelname)-8s [%(filename)-30s:%(lineno)-4d]  %(message)s', datefmt='%Y-%m-%d:%H:%M:%S',
+                        filename=os.path.join(args.output, "_bench_report.log"), filemode='w', level=logging.INFO)
+
+    try:
+        import create_report
+    except ImportError as error:
+        sys.stderr.write("Unable to import the report (%s), is the common submodule checked out?\n" %error)
+        sys.exit(1)
+
+    import resource
+    import report_data, report_artifacts, report_session, report_metrics, report_scheduler
+    import common.api.project.get_inventory_summary
+
+    # The same option strings the framework passes, the cache is off so every run is cold
+    reportOptions = {"includeChildProjects" : "true", "includeComplianceInformation" : "true", "maxVersionsBack" : "10", "cvssVersion" : args.cvss,
+                        "maxConcurrentRequests" : str(args.concurrency), "cacheExpirationHours" : "0", "cacheMaxEntries" : "0", "reportFormats" : args.formats,
+                        "maxRequestsPerSecond" : str(args.rate)}
+    reportOptions = create_report.verifyOptions(reportOptions)
+    if "errorMsg" in reportOptions:
+        sys.stderr.write("Invalid benchmark options: %s\n" %reportOptions["errorMsg"])
+        sys.exit(1)
+
+    apiSession = report_session.create_session(reportOptions["maxConcurrentRequests"])
+    report_session.install_session(apiSession)
+    report_scheduler.configure_scheduler(reportOptions["maxRequestsPerSecond"], reportOptions["maxConcurrentRequests"])
+
+    # The stub's payloads are shaped after what the report reads rather than a particular Code Insight
+    # release, so check them against the common modules before measuring anything
+    shapeProblems = check_stub_shapes(args.url, reportOptions["cvssVersion"])
+    unmatchedCalls = get_stub_stats(args.url).get("unmatched", 0)
+    if unmatchedCalls:
+        shapeProblems.append("%s calls did not match a stub route, see the stub server output" %unmatchedCalls)
+    if shapeProblems:
+        sys.stderr.write("The stub server does not match the common API modules:\n    %s\n" %"\n    ".join(shapeProblems))
+        sys.exit(1)
+    reset_stub_stats(args.url)
+    report_metrics.reportMetrics["apiCalls"].clear()
+
+    reportData = {}
+    reportData["projectID"] = "1"
+    reportData["reportName"] = "Project Inventory Report"
+    reportData["reportVersion"] = "benchmark"
+    reportData["reportOptions"] = reportOptions
+    reportData["releaseVersion"] = "BenchmarkStub"
+    reportData["fileNameTimeStamp"] = "benchmark"
+    reportData["reportTimeStamp"] = "benchmark"
+
+    runResult = {"formatSeconds" : {}}
+
+    startTime = time.perf_counter()
+    reportData = report_data.gather_data_for_report(args.url, "1", "benchmark", reportData)
+    runResult["gatherSeconds"] = time.perf_counter() - startTime
+    reportData["reportFileNameBase"] = "benchmark"
+
+    for reportFormat in reportOptions["reportFormats"]:
+        formatStartTime = time.perf_counter()
+        report_artifacts.get_artifact_generator(reportFormat)(reportData)
+        runResult["formatSeconds"][reportFormat] = time.perf_counter() - formatStartTime
+
+    runResult["totalSeconds"] = time.perf_counter() - startTime
+    runResult["numItems"] = reportData["totalInventoryCount"]
+    runResult["apiCalls"] = sum(timing["count"] for timing in report_metrics.reportMetrics["apiCalls"].values())
+
+    # ru_maxrss is in kilobytes on linux and bytes on macOS
+    peakRSS = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    runResult["peakRSSMB"] = peakRSS / (1024 * 1024) if sys.platform == "darwin" else peakRSS / 1024
+
+    print(json.dumps(runResult))
+
+#----------------------------------------------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the report against a local stand-in Code Insight server")
+    parser.add_argument("--sizes", default="1:1000,50:20000,500:200000", help="Comma separated projects:items pairs to run")
+    parser.add_argument("--formats", default="html,xlsx", help="Report formats to create after gathering the data")
+    parser.add_argument("--cvss", default="3.x", help="CVSS version option for the report")
+    parser.add_argument("--concurrency", type=int, default=4, help="maxConcurrentRequests option for the report")
+    parser.add_argument("--rate", type=int, default=0, help="maxRequestsPerSecond option for the report, 0 for no limit")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the stub server adds to every API call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures-root", default=os.path.join(tempfile.gettempdir(), "project_inventory_bench", "fixtures"), help="Where generated fixtures are kept for reuse")
+    parser.add_argument("--output", default=os.path.join(tempfile.gettempdir(), "project_inventory_bench", "output"), help="Where the report artifacts and logs are written")
+    parser.add_argument("--run-one", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        return run_one(args)
+
+    print("%8s %8s %10s %10s %s %8s %10s" %("projects", "items", "gather s", "total s", " ".join("%8s" %("%s s" %reportFormat) for reportFormat in args.formats.split(",")), "API calls", "peak RSS"))
+
+    for sizePair in args.sizes.split(","):
+        numProjects, numItems = [int(sizeValue) for sizeValue in sizePair.split(":")]
+        runResult = run_size(args, numProjects, numItems)
+
+        formatColumns = " ".join("%8.2f" %runResult["formatSeconds"][reportFormat] for reportFormat in runResult["formatSeconds"])
+        print("%8s %8s %10.2f %10.2f %s %9s %7.0f MB" %(numProjects, runResult["numItems"], runResult["gatherSeconds"], runResult["totalSeconds"],
+                formatColumns, runResult["apiCalls"], runResult["peakRSSMB"]))
+
+        # The server side counts show which endpoints the calls went to
+        print("%17s server calls: %s" %("", ", ".join("%s %s" %(endpoint, numCalls) for endpoint, numCalls in sorted(runResult["serverCalls"].items()))))
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : bench_version_sort.py
+
+Micro-benchmark for the component version sort keys.  Compares the original
+natural_sort implementation (uncompiled pattern, key rebuilt on every call)
+with report_versions.version_rank_key over version lists shaped like the
+linux kernel, vim-vim and typical npm packages.
+
+    python benchmarks/bench_version_sort.py
+'''
+import os, sys, re, random, timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+import report_versions
+
+#----------------------------------------------------------------------------------------#
+#  The original implementation from report_data.py for comparison
+def atoi(text):
+    return int(text) if text.isdigit() else text
+
+def natural_sort(text):
+    return [ atoi(c) for c in re.split('(\\d+)',text) ]
+
+def legacy_rank(componentVersions):
+    componentVersions.sort(key=natural_sort)
+    insertLocation = 0
+    for version in componentVersions:
+        if len(version) and version[0].isalpha():
+            componentVersions.remove(version)
+            componentVersions.insert(insertLocation , version)
+            insertLocation +=1
+    return componentVersions
+
+def clear_key_caches():
+    report_versions.natural_sort_key.cache_clear()
+    report_versions.version_rank_key.cache_clear()
+
+def current_rank(componentVersions):
+    componentVersions.sort(key=report_versions.version_rank_key)
+    return componentVersions
+
+#----------------------------------------------------------------------------------------#
+def kernel_versions():
+    versions = []
+    for minor in range(0, 40):
+        for patch in range(0, 120):
+            versions.append("2.6.%s.%s" %(minor, patch))
+    for major in range(3, 7):
+        for minor in range(0, 20):
+            versions.append("%s.%s" %(major, minor))
+            for rc in range(1, 8):
+                versions.append("%s.%s-rc%s" %(major, minor, rc))
+            for patch in range(1, 150):
+                versions.append("%s.%s.%s" %(major, minor, patch))
+    return versions
+
+def vim_versions():
+    versions = []
+    for major, numPatches in [(7, 1800), (8, 5100), (9, 2200)]:
+        for minor in range(0, 3):
+            for patch in range(0, numPatches // 3):
+                versions.append("v%s.%s.%04d" %(major, minor, patch))
+    return versions
+
+def npm_versions():
+    versions = []
+    for major in range(0, 12):
+        for minor in range(0, 25):
+            for patch in range(0, 8):
+                versions.append("%s.%s.%s" %(major, minor, patch))
+            for tag in ["alpha", "beta", "rc", "next"]:
+                for build in range(0, 3):
+                    versions.append("%s.%s.0-%s.%s" %(major, minor, tag, build))
+    versions += ["latest", "canary", "snapshot"]
+    return versions
+
+#----------------------------------------------------------------------------------------#
+def main():
+    repeat = 5
+
+    for listName, versionFunction in [("linux kernel", kernel_versions), ("vim-vim", vim_versions), ("npm package", npm_versions)]:
+        componentVersions = versionFunction()
+        random.Random(0).shuffle(componentVersions)
+
+        # Both implementations must produce the same ordering
+        if legacy_rank(list(componentVersions)) != current_rank(list(componentVersions)):
+            print("%s: ordering differs between implementations!" %listName)
+            sys.exit(1)
+
+        legacySeconds = min(timeit.repeat(lambda: legacy_rank(list(componentVersions)), number=1, repeat=repeat))
+
+        # Cold is the first sort of a list in a run, warm is any later one
+        coldSeconds = min(timeit.repeat(lambda: (clear_key_caches(), current_rank(list(componentVersions))), number=1, repeat=repeat))
+        warmSeconds = min(timeit.repeat(lambda: current_rank(list(componentVersions)), number=1, repeat=repeat))
+
+        print("%-14s %6s versions   legacy %8.2f ms   cold %8.2f ms (%5.1fx)   warm %8.2f ms (%5.1fx)" %(listName, len(componentVersions),
+                legacySeconds * 1000, coldSeconds * 1000, legacySeconds / coldSeconds, warmSeconds * 1000, legacySeconds / warmSeconds))
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : generate_fixtures.py
+
+Generates synthetic Code Insight responses for the benchmark stub server.  A
+fixture directory holds the data payload of each endpoint the report calls:
+
+    manifest.json            sizes and seed the fixture was generated with
+    hierarchy.json           project hierarchy starting at the top level project
+    project/<id>.json        project information (license and vulnerability rollups)
+    inventory/<id>.json      inventory summary items for the project
+    license/<id>.json        license details
+    component/<id>.json      component details with the list of versions
+
+Responses recorded from a real server can be saved in the same layout and
+replayed instead.
+
+    python benchmarks/generate_fixtures.py --projects 50 --items 20000 --output /tmp/fixtures
+'''
+import os, json, random, argparse
+
+branchingFactor = 10   # Child projects under each project
+reviewStatuses = ["Approved", "Rejected", "Draft"]
+inventoryPriorities = ["High", "Medium", "Low", "Undefined"]
+textVersions = ["snapshot", "latest", "unknown", "custom"]
+
+#----------------------------------------------------------------------------------------#
+def generate_fixtures(fixtureDirectory, numProjects, numItems, numComponents=None, numLicenses=200, versionsPerComponent=30, seed=0):
+
+    # Reuse a fixture that was already generated with the same settings
+    manifest = {"numProjects" : numProjects, "numItems" : numItems, "numComponents" : numComponents or max(50, numItems // 20),
+                "numLicenses" : numLicenses, "versionsPerComponent" : versionsPerComponent, "seed" : seed, "rootProjectID" : 1}
+
+    manifestFile = os.path.join(fixtureDirectory, "manifest.json")
+    if os.path.exists(manifestFile):
+        with open(manifestFile) as manifestPtr:
+            if json.load(manifestPtr) == manifest:
+                return manifest
+
+    randomGenerator = random.Random(seed)
+
+    for subDirectory in ["project", "inventory", "license", "component"]:
+        os.makedirs(os.path.join(fixtureDirectory, subDirectory), exist_ok=True)
+
+    licenses = generate_licenses(fixtureDirectory, manifest["numLicenses"], randomGenerator)
+    components = generate_components(fixtureDirectory, manifest["numComponents"], versionsPerComponent, randomGenerator)
+    write_json(os.path.join(fixtureDirectory, "hierarchy.json"), generate_hierarchy(1, numProjects))
+
+    # A few components are used by most of the items like in a real code base
+    componentWeights = [1.0 / (componentIndex + 1) for componentIndex in range(len(components))]
+
+    nextInventoryID = 1
+    for projectID in range(1, numProjects + 1):
+        numProjectItems = numItems // numProjects + (1 if projectID <= numItems % numProjects else 0)
+
+        inventoryItems = []
+        for componentID, componentVersions in randomGenerator.choices(components, weights=componentWeights, k=numProjectItems):
+            inventoryItems.append(generate_inventory_item(nextInventoryID, componentID, componentVersions, licenses, randomGenerator))
+            nextInventoryID += 1
+
+        write_json(os.path.join(fixtureDirectory, "inventory", "%s.json" %projectID), inventoryItems)
+        write_json(os.path.join(fixtureDirectory, "project", "%s.json" %projectID), generate_project_information(projectID, inventoryItems, licenses))
+
+    # Written last so a partially generated fixture is never reused
+    write_json(manifestFile, manifest)
+
+    return manifest
+
+#----------------------------------------------------------------------------------------#
+def generate_hierarchy(projectID, numProjects):
+    # Project IDs are assigned breadth first so the children of a project are consecutive
+    firstChildID = (projectID - 1) * branchingFactor + 2
+    childIDs = range(firstChildID, min(firstChildID + branchingFactor, numProjects + 1))
+
+    return {"id" : projectID, "name" : "Project %04d" %projectID, "childProject" : [generate_hierarchy(childID, numProjects) for childID in childIDs]}
+
+#----------------------------------------------------------------------------------------#
+def generate_licenses(fixtureDirectory, numLicenses, randomGenerator):
+    licenses = {}
+    for licenseID in range(1, numLicenses + 1):
+        licenseDetails = {"id" : licenseID, "shortName" : "License-%s" %licenseID, "spdxIdentifier" : "LicenseRef-%s" %licenseID,
+                            "url" : "https://licenses.example.com/%s" %licenseID, "priority" : randomGenerator.choice([1, 2, 2, 3, 3, 3])}
+        write_json(os.path.join(fixtureDirectory, "license", "%s.json" %licenseID), licenseDetails)
+        licenses[licenseID] = licenseDetails
+    return licenses
+
+#----------------------------------------------------------------------------------------#
+def generate_components(fixtureDirectory, numComponents, versionsPerComponent, randomGenerator):
+    components = []
+    for componentID in range(1, numComponents + 1):
+        numVersions = randomGenerator.randint(1, versionsPerComponent * 2)
+        componentVersions = ["%s.%s.%s" %(versionIndex // 25, (versionIndex // 5) % 5, versionIndex % 5) for versionIndex in range(numVersions)]
+        componentVersions += randomGenerator.sample(textVersions, randomGenerator.randint(0, 2))
+        randomGenerator.shuffle(componentVersions)  # The API does not return them in any order
+
+        write_json(os.path.join(fixtureDirectory, "component", "%s.json" %componentID), {"id" : componentID, "versionList" : [{"name" : versionName} for versionName in componentVersions]})
+        components.append((componentID, componentVersions))
+    return components
+
+#----------------------------------------------------------------------------------------#
+def generate_inventory_item(inventoryID, componentID, componentVersions, licenses, randomGenerator):
+
+    versionChoice = randomGenerator.random()
+    if versionChoice < 0.05:
+        componentVersionName = ""   # Unknown version
+    elif versionChoice < 0.08:
+        componentVersionName = "9.9.9-invalid"
+    else:
+        componentVersionName = randomGenerator.choice(componentVersions)
+
+    if randomGenerator.random() < 0.05:
+        selectedLicenseID = "N/A"
+        spdxIdentifier = "N/A"
+    else:
+        selectedLicenseID = randomGenerator.randint(1, len(licenses))
+        spdxIdentifier = licenses[selectedLicenseID]["spdxIdentifier"]
+
+    # Most items have no vulnerabilities
+    vulnerabilityCounts = [randomGenerator.choice([0, 0, 0, 0, 1, 2]) for severity in range(5)]
+    cvssV3 = dict(zip(["Critical", "High", "Medium", "Low", "None"], vulnerabilityCounts))
+    cvssV2 = {"High" : vulnerabilityCounts[0] + vulnerabilityCounts[1], "Medium" : vulnerabilityCounts[2], "Low" : vulnerabilityCounts[3], "Unknown" : vulnerabilityCounts[4]}
+
+    return {"id" : inventoryID, "name" : "component-%s-%s" %(componentID, componentVersionName or "unknown"),
+            "componentName" : "component-%s" %componentID, "componentId" : componentID, "componentVersionName" : componentVersionName,
+            "priority" : randomGenerator.choice(inventoryPriorities), "selectedLicenseId" : selectedLicenseID, "selectedLicenseSPDXIdentifier" : spdxIdentifier,
+            "url" : "https://components.example.com/%s" %componentID, "reviewStatus" : randomGenerator.choice(reviewStatuses),
+            "vulnerabilitySummary" : [{"CvssV3" : cvssV3, "CvssV2" : cvssV2}]}
+
+#----------------------------------------------------------------------------------------#
+def generate_project_information(projectID, inventoryItems, licenses):
+    # Roll the items up the way the server does for the project summary
+    licenseCounts = {"P1" : 0, "P2" : 0, "P3" : 0, "Unknown" : 0}
+    cvssV3 = {"Critical" : 0, "High" : 0, "Medium" : 0, "Low" : 0, "None" : 0}
+    cvssV2 = {"High" : 0, "Medium" : 0, "Low" : 0, "Unknown" : 0}
+
+    for inventoryItem in inventoryItems:
+        selectedLicenseID = inventoryItem["selectedLicenseId"]
+        if selectedLicenseID in licenses:
+            licenseCounts["P%s" %licenses[selectedLicenseID]["priority"]] += 1
+        else:
+            licenseCounts["Unknown"] += 1
+
+        vulnerabilitySummary = inventoryItem["vulnerabilitySummary"][0]
+        for severity in cvssV3:
+            cvssV3[severity] += vulnerabilitySummary["CvssV3"][severity]
+        for severity in cvssV2:
+            cvssV2[severity] += vulnerabilitySummary["CvssV2"][severity]
+
+    return {"id" : projectID, "name" : "Project %04d" %projectID, "licenses" : licenseCounts, "vulnerabilities" : {"CvssV3" : cvssV3, "CvssV2" : cvssV2}}
+
+#----------------------------------------------------------------------------------------#
+def write_json(fileName, data):
+    with open(fileName, "w") as filePtr:
+        json.dump(data, filePtr, separators=(",", ":"))
+
+#----------------------------------------------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Code Insight responses for the benchmark stub server")
+    parser.add_argument("--projects", type=int, default=50, help="Number of projects in the hierarchy")
+    parser.add_argument("--items", type=int, default=20000, help="Number of inventory items across all projects")
+    parser.add_argument("--components", type=int, default=None, help="Number of distinct components (default items/20)")
+    parser.add_argument("--licenses", type=int, default=200, help="Number of distinct licenses")
+    parser.add_argument("--versions", type=int, default=30, help="Average number of versions for each component")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True, help="Fixture directory to create")
+    args = parser.parse_args()
+
+    manifest = generate_fixtures(args.output, args.projects, args.items, args.components, args.licenses, args.versions, args.seed)
+    print("Fixture with %s projects and %s inventory items in %s" %(manifest["numProjects"], manifest["numItems"], args.output))
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : generate_report_data.py
+
+Builds a synthetic reportData dict shaped like the output of
+gather_data_for_report so the report artifacts can be benchmarked and
+profiled without collecting any data.  The hierarchy, project list, summary
+roll ups and review status roll up are built with the report's own functions
+from report_data so the shapes always match the release being measured.
+
+The branching factor controls the shape of the hierarchy: 1 is a single chain
+of nested projects (deep), a value at or above the number of projects puts
+every project directly below the top level project (wide).
+'''
+import os, sys, random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+import report_data
+import report_inventory
+
+baseURL = "https://codeinsight.example.com"
+
+# Rough mix seen across real portfolios
+reviewStatusWeights = {"Approved" : 60, "Draft" : 25, "Rejected" : 15}
+inventoryPriorityWeights = {"High" : 10, "Medium" : 30, "Low" : 40, "Undefined" : 20}
+licensePriorityWeights = {1 : 10, 2 : 30, 3 : 50, None : 10}   # None is an item without a selected license
+versionStateWeights = {"current" : 55, "old" : 25, "unknown" : 8, "notAnalyzed" : 7, "invalid" : 5}
+licenseNames = ["MIT", "Apache-2.0", "BSD-3-Clause", "BSD-2-Clause", "ISC", "GPL-2.0-only", "GPL-3.0-or-later", "LGPL-2.1-only",
+                "MPL-2.0", "EPL-2.0", "AGPL-3.0-only", "CDDL-1.0", "Unlicense", "Zlib", "Python-2.0", "Artistic-2.0"]
+componentWords = ["core", "util", "http", "json", "xml", "parser", "client", "server", "crypto", "logging", "async", "stream", "cache", "config", "test", "cli"]
+
+#----------------------------------------------------------------------------------------#
+def generate_report_data(numProjects, numItems, branchingFactor=10, cvssVersion="3.x", includeComplianceInformation=True, largeReportThreshold=10000, seed=0):
+
+    randomGenerator = random.Random(seed)
+
+    projectHierarchy = generate_hierarchy(1, numProjects, branchingFactor)
+
+    # The same top down, name sorted project list gather_data_for_report creates
+    projectList = [{"parent" : "#", "projectName" : projectHierarchy["name"], "projectID" : projectHierarchy["id"], "projectLink" : create_project_link(projectHierarchy["id"])}]
+    projectList = report_data.create_project_hierarchy(projectHierarchy, projectHierarchy["id"], projectList, baseURL)
+
+    licenses = generate_licenses(randomGenerator)
+    components = generate_components(max(50, numItems // 20), randomGenerator)
+    componentWeights = [1.0 / (componentIndex + 1) for componentIndex in range(len(components))]
+
+    inventoryData = report_inventory.create_inventory_store()
+    projectData = {}
+    projectInventoryCount = {}
+    projectReviewStatus = {}
+
+    nextInventoryID = 1
+    for projectIndex, project in enumerate(projectList):
+        projectName = project["projectName"]
+        projectID = project["projectID"]
+        numProjectItems = numItems // numProjects + (1 if projectIndex < numItems % numProjects else 0)
+
+        projectCounts = {"numApproved" : 0, "numRejected" : 0, "numDraft" : 0, "numP1Licenses" : 0, "numP2Licenses" : 0, "numP3Licenses" : 0, "numNALicenses" : 0}
+        vulnerabilityTotals = {}
+
+        for componentName, componentVersions in randomGenerator.choices(components, weights=componentWeights, k=numProjectItems):
+            inventoryItem = generate_inventory_item(project, componentName, componentVersions, licenses, cvssVersion, includeComplianceInformation, randomGenerator)
+            licensePriority = inventoryItem.pop("selectedLicensePriority")
+            report_inventory.add_inventory_item(inventoryData, nextInventoryID, inventoryItem)
+            nextInventoryID += 1
+
+            projectCounts["num%s" %inventoryItem["inventoryReviewStatus"]] += 1
+            projectCounts["numP%sLicenses" %licensePriority if licensePriority else "numNALicenses"] += 1
+
+            for severity, severityCount in inventoryItem["vulnerabilityData"].items():
+                if severity != "numTotalVulnerabilities":
+                    vulnerabilityTotals[severity] = vulnerabilityTotals.get(severity, 0) + severityCount
+
+        projectInventoryCount[projectName] = numProjectItems
+        projectData[projectName] = {**projectCounts, **vulnerabilityTotals, "projectLink" : project["projectLink"]}
+
+        if projectCounts["numRejected"] > 0:
+            projectReviewStatus[projectID] = "Rejected"
+        elif projectCounts["numDraft"] > 0:
+            projectReviewStatus[projectID] = "Draft"
+        else:
+            projectReviewStatus[projectID] = "Approved"
+
+    projectSummaryData = report_data.create_project_summary_data_dict(projectData)
+    projectSummaryData["includeComplianceInformation"] = includeComplianceInformation
+    projectSummaryData["cvssVersion"] = cvssVersion
+
+    reportData = {}
+    reportData["projectID"] = projectHierarchy["id"]
+    reportData["reportName"] = "Project Inventory Report"
+    reportData["reportVersion"] = "benchmark"
+    reportData["reportOptions"] = {"includeChildProjects" : "true", "includeComplianceInformation" : includeComplianceInformation, "cvssVersion" : cvssVersion,
+                                    "largeReportThreshold" : largeReportThreshold}
+    reportData["releaseVersion"] = "Benchmark"
+    reportData["fileNameTimeStamp"] = "benchmark"
+    reportData["reportTimeStamp"] = "benchmark"
+    reportData["reportFileNameBase"] = "benchmark"
+    reportData["topLevelProjectName"] = projectHierarchy["name"]
+    reportData["projectHierarchy"] = projectHierarchy
+    reportData["projectName"] = projectHierarchy["name"]
+    reportData["inventoryData"] = inventoryData
+    reportData["projectList"] = projectList
+    reportData["projectSummaryData"] = projectSummaryData
+    reportData["applicationSummaryData"] = report_data.create_application_summary_data_dict(projectSummaryData)
+    reportData["subtreeSummaryData"] = report_data.create_subtree_summary_data_dict(projectHierarchy, projectData)
+    reportData["projectInventoryCount"] = projectInventoryCount
+    reportData["totalInventoryCount"] = numItems
+    reportData["projectReviewStatus"] = report_data.roll_up_project_review_level(projectHierarchy, projectReviewStatus, 1)
+    reportData["degradedProjects"] = []
+
+    return reportData
+
+#----------------------------------------------------------------------------------------#
+def generate_hierarchy(projectID, numProjects, branchingFactor):
+    # Project IDs are assigned breadth first so the children of a project are consecutive
+    firstChildID = (projectID - 1) * branchingFactor + 2
+    childIDs = range(firstChildID, min(firstChildID + branchingFactor, numProjects + 1))
+
+    return {"id" : projectID, "name" : "Project %04d" %projectID, "childProject" : [generate_hierarchy(childID, numProjects, branchingFactor) for childID in childIDs]}
+
+#----------------------------------------------------------------------------------------#
+def create_project_link(projectID):
+    return baseURL + "/codeinsight/FNCI#myprojectdetails/?id=" + str(projectID) + "&tab=projectInventory"
+
+#----------------------------------------------------------------------------------------#
+def generate_licenses(randomGenerator):
+    licenses = []
+    for licensePriority, priorityWeight in licensePriorityWeights.items():
+        if licensePriority is None:
+            licenses.append(("", "", None, priorityWeight))
+            continue
+        for licenseName in randomGenerator.sample(licenseNames, 4):
+            licenses.append((licenseName, "https://spdx.org/licenses/%s.html" %licenseName, licensePriority, priorityWeight / 4))
+    return licenses
+
+#----------------------------------------------------------------------------------------#
+def generate_components(numComponents, randomGenerator):
+    components = []
+    for componentIndex in range(numComponents):
+        componentName = "%s-%s-%s" %(randomGenerator.choice(componentWords), randomGenerator.choice(componentWords), componentIndex)
+        componentVersions = ["%s.%s.%s" %(randomGenerator.randint(0, 12), randomGenerator.randint(0, 30), randomGenerator.randint(0, 20)) for versionIndex in range(randomGenerator.randint(1, 40))]
+        components.append((componentName, componentVersions))
+    return components
+
+#----------------------------------------------------------------------------------------#
+def generate_vulnerability_data(cvssVersion, randomGenerator):
+    # Most items have none, those that do have a long tail
+    severities = ["Critical", "High", "Medium", "Low", "None"] if cvssVersion == "3.x" else ["High", "Medium", "Low", "Unknown"]
+    vulnerabilities = {severity : 0 for severity in severities}
+
+    if randomGenerator.random() < 0.2:
+        for vulnerabilityIndex in range(min(int(randomGenerator.expovariate(0.3)) + 1, 60)):
+            vulnerabilities[randomGenerator.choice(severities)] += 1
+
+    return report_data.create_inventory_summary_dict(vulnerabilities, cvssVersion)
+
+#----------------------------------------------------------------------------------------#
+def generate_inventory_item(project, componentName, componentVersions, licenses, cvssVersion, includeComplianceInformation, randomGenerator):
+
+    selectedLicenseName, selectedLicenseUrl, selectedLicensePriority, priorityWeight = randomGenerator.choices(licenses, weights=[selectedLicense[3] for selectedLicense in licenses])[0]
+    inventoryReviewStatus = randomGenerator.choices(list(reviewStatusWeights), weights=list(reviewStatusWeights.values()))[0]
+    versionState = randomGenerator.choices(list(versionStateWeights), weights=list(versionStateWeights.values()))[0]
+    componentVersionName = "" if versionState == "unknown" else randomGenerator.choice(componentVersions)
+    vulnerabilityData = generate_vulnerability_data(cvssVersion, randomGenerator)
+
+    # The same checks gather_data_for_report makes, in the same order
+    complianceIssues = []
+    versionDetails = {}
+    if includeComplianceInformation:
+        if inventoryReviewStatus == "Rejected":
+            complianceIssues.append(report_inventory.ComplianceIssue.ITEM_REJECTED)
+        elif inventoryReviewStatus == "Draft":
+            complianceIssues.append(report_inventory.ComplianceIssue.ITEM_NOT_REVIEWED)
+        if vulnerabilityData["numTotalVulnerabilities"] > 0:
+            complianceIssues.append(report_inventory.ComplianceIssue.SECURITY_VULNERABILITIES)
+        if selectedLicensePriority == 1:
+            complianceIssues.append(report_inventory.ComplianceIssue.P1_LICENSE)
+        if versionState == "unknown":
+            complianceIssues.append(report_inventory.ComplianceIssue.UNKNOWN_VERSION)
+        elif versionState == "notAnalyzed":
+            complianceIssues.append(report_inventory.ComplianceIssue.VERSION_NOT_ANALYZED)
+        elif versionState == "old":
+            complianceIssues.append(report_inventory.ComplianceIssue.OLD_VERSION)
+            versionDetails["latestVersion"] = max(componentVersions)
+            versionDetails["numberVersionsBack"] = randomGenerator.randint(1, 25)
+        elif versionState == "invalid":
+            complianceIssues.append(report_inventory.ComplianceIssue.INVALID_VERSION)
+        if selectedLicenseName == "":
+            complianceIssues.append(report_inventory.ComplianceIssue.UNSPECIFIED_LICENSE)
+
+    return {
+        "projectName" : project["projectName"],
+        "inventoryItemName" : "%s - %s" %(componentName, componentVersionName or "unknown"),
+        "componentName" : componentName,
+        "componentVersionName" : componentVersionName,
+        "selectedLicenseName" : selectedLicenseName,
+        "selectedLicensePriority" : selectedLicensePriority,  # Removed once counted for the project
+        "vulnerabilityData" : vulnerabilityData,
+        "inventoryPriority" : randomGenerator.choices(list(inventoryPriorityWeights), weights=list(inventoryPriorityWeights.values()))[0],
+        "componentUrl" : "https://components.example.com/%s" %componentName,
+        "selectedLicenseUrl" : selectedLicenseUrl,
+        "inventoryReviewStatus" : inventoryReviewStatus,
+        "projectLink" : project["projectLink"],
+        "complianceIssues" : complianceIssues,
+        **versionDetails
+    }
@@ -0,0 +1,199 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : stub_server.py
+
+Local stand-in for the Code Insight REST API used by the benchmarks.  Serves
+the payloads of a fixture directory (see generate_fixtures.py) wrapped in the
+{"data" : ...} envelope the API returns and counts the calls made to each
+endpoint.  The inventory summary honours the offset/limit paging parameters
+and returns the Current-page and Number-of-pages headers.
+
+The payloads are shaped after the fields report_data reads rather than taken
+from a particular Code Insight release.  bench_report.py calls every API the
+report uses through the common modules before each run and stops if a field
+is missing or a call doesn't match a route, so drift shows up there.
+
+Requests are routed on the resource names in the URL path.  If the common
+API modules call an endpoint that is not matched the request is logged and a
+404 is returned, add its path pattern to the routes below.
+
+    python benchmarks/stub_server.py --fixtures /tmp/fixtures --port 8888
+
+GET /_stub/stats returns the call counts and POST /_stub/reset clears them.
+'''
+import os, sys, re, json, time, math, argparse, threading, functools
+import http.server
+import urllib.parse
+
+# Endpoint name and the path patterns that reach it, the first group that matched holds the ID
+routes = [
+    ("hierarchy", re.compile(r"/project/hierarchy/(\d+)$|/projects?/(\d+)/(?:children|childProjects|hierarchy)$")),
+    ("inventory", re.compile(r"/projects?/(\d+)/inventor(?:y|ies)Summary$")),
+    ("project", re.compile(r"/projects?/(\d+)(?:/summary|/information)?$")),
+    ("license", re.compile(r"/licenses?/(\d+)$")),
+    ("component", re.compile(r"/components?/(\d+)$")),
+    ("release", re.compile(r"/system/release$()")),
+]
+
+#----------------------------------------------------------------------------------------#
+class FixtureStore:
+
+    def __init__(self, fixtureDirectory):
+        self.fixtureDirectory = fixtureDirectory
+        self.projectNodes = {}
+
+        # Any project in the hierarchy can be the one the report is run against
+        with open(os.path.join(fixtureDirectory, "hierarchy.json")) as hierarchyFile:
+            self.index_hierarchy(json.load(hierarchyFile))
+
+    def index_hierarchy(self, projectNode):
+        self.projectNodes[str(projectNode["id"])] = projectNode
+        for childProject in projectNode["childProject"]:
+            self.index_hierarchy(childProject)
+
+    def load_payload(self, endpoint, resourceID):
+        payloadFile = os.path.join(self.fixtureDirectory, endpoint, "%s.json" %resourceID)
+        if not os.path.exists(payloadFile):
+            return None
+        with open(payloadFile) as payloadPtr:
+            return json.load(payloadPtr)
+
+    # A handful of the largest inventories are kept parsed for paged requests, on their own so
+    # the many small component payloads don't push them out between pages
+    @functools.lru_cache(maxsize=16)
+    def load_inventory(self, resourceID):
+        return self.load_payload("inventory", resourceID)
+
+    def get_payload(self, endpoint, resourceID):
+        if endpoint == "hierarchy":
+            return self.projectNodes.get(resourceID)
+        if endpoint == "release":
+            return {"fnci.release.name" : "Benchmark Stub", "fnci.release.version" : "0.0.0"}
+        if endpoint == "inventory":
+            return self.load_inventory(resourceID)
+        return self.load_payload(endpoint, resourceID)
+
+#----------------------------------------------------------------------------------------#
+class StubRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # Keep-alive so the report's connection pool is exercised
+    disable_nagle_algorithm = True  # Otherwise the separate header and body writes add a delayed ACK to every call
+
+    def do_GET(self):
+        requestURL = urllib.parse.urlsplit(self.path)
+
+        if requestURL.path == "/_stub/stats":
+            with self.server.statsLock:
+                return self.send_json(200, dict(self.server.callCounts))
+
+        endpoint, resourceID = match_route(requestURL.path)
+        self.server.count_call(endpoint or "unmatched")
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if endpoint is None:
+            self.log_message("No route for %s" %requestURL.path)
+            return self.send_json(404, {"error" : "No stub route for %s" %requestURL.path})
+
+        payload = self.server.fixtureStore.get_payload(endpoint, resourceID)
+        if payload is None:
+            return self.send_json(404, {"error" : "No %s fixture for %s" %(endpoint, resourceID)})
+
+        if endpoint == "inventory":
+            return self.send_inventory_page(payload, urllib.parse.parse_qs(requestURL.query))
+
+        self.send_json(200, {"data" : payload})
+
+    def do_POST(self):
+        requestURL = urllib.parse.urlsplit(self.path)
+
+        # Read the body so the connection can be reused
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        if requestURL.path == "/_stub/reset":
+            with self.server.statsLock:
+                self.server.callCounts.clear()
+        else:
+            self.server.count_call("upload")  # Report uploads are the only calls that post
+
+        self.send_json(200, {"data" : "OK"})
+
+    def send_inventory_page(self, inventoryItems, queryParameters):
+        # offset is the page number starting at 1 and limit the items on each page
+        if "limit" in queryParameters:
+            pageSize = max(int(queryParameters["limit"][0]), 1)
+            currentPage = max(int(queryParameters.get("offset", ["1"])[0]), 1)
+        else:
+            pageSize = max(len(inventoryItems), 1)
+            currentPage = 1
+
+        numberOfPages = max(math.ceil(len(inventoryItems) / pageSize), 1)
+        pageItems = inventoryItems[(currentPage - 1) * pageSize : currentPage * pageSize]
+
+        self.send_json(200, {"data" : pageItems}, {"Current-page" : str(currentPage), "Number-of-pages" : str(numberOfPages)})
+
+    def send_json(self, status, body, extraHeaders=None):
+        responseBody = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(responseBody)))
+        for headerName, headerValue in (extraHeaders or {}).items():
+            self.send_header(headerName, headerValue)
+        self.end_headers()
+        self.wfile.write(responseBody)
+
+    def log_message(self, format, *args):
+        if self.server.verbose or format.startswith("No route"):
+            sys.stderr.write("stub_server: %s\n" %(format %args))
+
+#----------------------------------------------------------------------------------------#
+class StubServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, serverAddress, fixtureDirectory, latency=0.0, verbose=False):
+        super().__init__(serverAddress, StubRequestHandler)
+        self.fixtureStore = FixtureStore(fixtureDirectory)
+        self.latency = latency
+        self.verbose = verbose
+        self.callCounts = {}
+        self.statsLock = threading.Lock()
+
+    def count_call(self, endpoint):
+        with self.statsLock:
+            self.callCounts[endpoint] = self.callCounts.get(endpoint, 0) + 1
+
+#----------------------------------------------------------------------------------------#
+def match_route(requestPath):
+    for endpoint, pathPattern in routes:
+        routeMatch = pathPattern.search(requestPath)
+        if routeMatch:
+            resourceID = next((group for group in routeMatch.groups() if group), "")
+            return endpoint, resourceID
+    return None, None
+
+#----------------------------------------------------------------------------------------#
+def main():
+    parser = argparse.ArgumentParser(description="Serve benchmark fixtures as a stand-in Code Insight server")
+    parser.add_argument("--fixtures", required=True, help="Fixture directory created by generate_fixtures.py")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default any free port)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every API call to mimic server time")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    stubServer = StubServer(("127.0.0.1", args.port), args.fixtures, args.latency, args.verbose)
+
+    # The benchmark harness reads the address from this line
+    print("Listening on http://127.0.0.1:%s" %stubServer.server_address[1], flush=True)
+
+    try:
+        stubServer.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,9 @@ import _version
 import report_data
 import report_artifacts
 import report_errors
+import report_session
+import report_metrics
+import report_scheduler
 import common.api.project.upload_reports
 import common.api.system.release
 import common.report_archive
@@ -30,6 +33,7 @@ else:
 propertiesFile = "../server_properties.json"  # Created by installer or manually
 propertiesFile =  os.path.dirname(os.path.realpath(__file__)) + "/" +  propertiesFile
 logfileName = os.path.dirname(os.path.realpath(__file__)) + "/_project_inventory_report.log"
+metricsFileName = os.path.dirname(os.path.realpath(__file__)) + "/_project_inventory_report_metrics.json"
 
 
 ###################################################################################
@@ -100,7 +104,24 @@ def main():
 	reportOptions = json.loads(reportOptions)
 	reportOptions = verifyOptions(reportOptions) 
 
-	releaseDetails = common.api.system.release.get_release_details(baseURL, authToken)
+	# Send all of the API calls for this run through one pooled session so connections are reused
+	if "errorMsg" in reportOptions.keys():
+		poolSize = 1
+		maxRequestsPerSecond = 0
+		maxApiErrors = 0
+	else:
+		poolSize = reportOptions["maxConcurrentRequests"]
+		maxRequestsPerSecond = reportOptions["maxRequestsPerSecond"]
+		maxApiErrors = reportOptions["maxApiErrors"]
+
+	apiSession = report_session.create_session(poolSize)
+	report_session.install_session(apiSession)
+	report_session.configure_retries(maxApiErrors)
+
+	# Pace the calls made through the session so the report doesn't overload the server
+	report_scheduler.configure_scheduler(maxRequestsPerSecond, poolSize)
+
+	releaseDetails = report_metrics.call_timed("get_release_details", common.api.system.release.get_release_details, baseURL, authToken)
 	releaseVersion = releaseDetails["fnci.release.name"].replace(" ", "")
 
 	logger.debug("Code Insight Release: %s" %releaseVersion)
@@ -133,7 +154,8 @@ def main():
 		print("    *** ERROR  ***  Error found validating report options")
 	else:
 		print("    Collect data for %s" %reportName)
-		reportData = report_data.gather_data_for_report(baseURL, projectID, authToken, reportData)
+		with report_metrics.phase_timer("Gather report data"):
+			reportData = report_data.gather_data_for_report(baseURL, projectID, authToken, reportData)
 		print("    Report data has been collected")
 		
 		projectName = reportData["topLevelProjectName"]
@@ -151,13 +173,16 @@ def main():
 			reports = report_errors.create_error_report(reportData)
 			print("    Error report artifacts have been created")
 		else:
-			reports = report_artifacts.create_report_artifacts(reportData)
+			with report_metrics.phase_timer("Create report artifacts"):
+				reports = report_artifacts.create_report_artifacts(reportData)
 			print("    Report artifacts have been created")
 
 	print("    Create report archive for upload")
-	uploadZipfile = common.report_archive.create_report_zipfile(reports, reportFileNameBase)
+	with report_metrics.phase_timer("Create report archive"):
+		uploadZipfile = common.report_archive.create_report_zipfile(reports, reportFileNameBase)
+	report_metrics.add_bytes("Report archive", os.path.getsize(uploadZipfile))
 	print("    Upload zip file creation completed")
-	common.api.project.upload_reports.upload_project_report_data(baseURL, projectID, reportID, authToken, uploadZipfile)
+	report_metrics.call_timed("upload_project_report_data", common.api.project.upload_reports.upload_project_report_data, baseURL, projectID, reportID, authToken, uploadZipfile)
 	print("    Report uploaded to Code Insight")
 
 
@@ -169,6 +194,16 @@ def main():
 		logger.error("Error removing %s" %uploadZipfile)
 		print("Error removing %s" %uploadZipfile)
 
+	report_session.log_session_statistics(apiSession)
+	report_scheduler.log_scheduler_statistics()
+
+	# Where the time went for this run, the metrics file has the call counts and latency histograms
+	report_metrics.write_metrics_file(metricsFileName)
+	print("    Metrics: %s" %(metricsFileName))
+	for summaryLine in report_metrics.get_metrics_summary():
+		logger.info("Metrics: %s" %summaryLine)
+		print("        %s" %summaryLine)
+
 	logger.info("Completed creating %s" %reportName)
 	print("Completed creating %s" %reportName)
 
@@ -178,6 +213,18 @@ def verifyOptions(reportOptions):
 	'''
 	Expected Options for report:
 		includeChildProjects - True/False
+		includeComplianceInformation - True/False
+		maxVersionsBack - Postive Int value
+		cvssVersion - 2.0/3.x
+		maxConcurrentRequests - Postive Int value
+		cacheExpirationHours - Int value (0 disables the cache)
+		cacheMaxEntries - Int value (0 disables the cache)
+		maxComponentVersions - Int value (0 for no limit)
+		largeReportThreshold - Int value (0 to disable)
+		incrementalReport - True/False
+		reportFormats - Comma separated list of report formats
+		maxRequestsPerSecond - Int value (0 for no limit)
+		maxApiErrors - Int value (0 for no limit)
 	'''
 	reportOptions["errorMsg"] = []
 	trueOptions = ["true", "t", "yes", "y"]
@@ -187,6 +234,15 @@ def verifyOptions(reportOptions):
 	includeComplianceInformation = reportOptions["includeComplianceInformation"]
 	maxVersionsBack = reportOptions["maxVersionsBack"]
 	cvssVersion = reportOptions["cvssVersion"]
+	maxConcurrentRequests = reportOptions.get("maxConcurrentRequests", "4")  # Not passed by older registrations
+	cacheExpirationHours = reportOptions.get("cacheExpirationHours", "24")
+	cacheMaxEntries = reportOptions.get("cacheMaxEntries", "10000")
+	maxComponentVersions = reportOptions.get("maxComponentVersions", "0")
+	largeReportThreshold = reportOptions.get("largeReportThreshold", "10000")
+	incrementalReport = reportOptions.get("incrementalReport", "false")
+	reportFormats = reportOptions.get("reportFormats", "html,xlsx")
+	maxRequestsPerSecond = reportOptions.get("maxRequestsPerSecond", "0")
+	maxApiErrors = reportOptions.get("maxApiErrors", "25")
 
 	if includeChildProjects.lower() in trueOptions:
 		reportOptions["includeChildProjects"] = "true"
@@ -214,6 +270,61 @@ def verifyOptions(reportOptions):
 		reportOptions["cvssVersion"]  = "3.x"
 	else:
 		reportOptions["errorMsg"].append("Invalid option for CVSS Version: <b>%s</b>.  Valid options are <b>2.0/3.x</b>" %cvssVersion)
+
+	if maxConcurrentRequests.isdigit() and int(maxConcurrentRequests) > 0:
+		reportOptions["maxConcurrentRequests"] = int(maxConcurrentRequests)
+	else:
+		reportOptions["errorMsg"].append("Invalid value for the maximum number of concurrent requests: <b>%s</b>.  A postive interger number is required" %maxConcurrentRequests)
+
+	if cacheExpirationHours.isdigit():
+		reportOptions["cacheExpirationHours"] = int(cacheExpirationHours)
+	else:
+		reportOptions["errorMsg"].append("Invalid value for the number of hours to cache data: <b>%s</b>.  An interger number is required (0 to disable)" %cacheExpirationHours)
+
+	if cacheMaxEntries.isdigit():
+		reportOptions["cacheMaxEntries"] = int(cacheMaxEntries)
+	else:
+		reportOptions["errorMsg"].append("Invalid value for the maximum number of cached entries: <b>%s</b>.  An interger number is required (0 to disable)" %cacheMaxEntries)
+
+	if maxComponentVersions.isdigit():
+		reportOptions["maxComponentVersions"] = int(maxComponentVersions)
+	else:
+		reportOptions["errorMsg"].append("Invalid value for the maximum number of component versions to analyze: <b>%s</b>.  An interger number is required (0 for no limit)" %maxComponentVersions)
+
+	if largeReportThreshold.isdigit():
+		reportOptions["largeReportThreshold"] = int(largeReportThreshold)
+	else:
+		reportOptions["errorMsg"].append("Invalid value for the large report threshold: <b>%s</b>.  An interger number is required (0 to disable)" %largeReportThreshold)
+
+	if incrementalReport.lower() in trueOptions:
+		reportOptions["incrementalReport"] = True
+	elif incrementalReport.lower() in falseOptions:
+		reportOptions["incrementalReport"] = False
+	else:
+		reportOptions["errorMsg"].append("Invalid option for incremental report: <b>%s</b>.  Valid options are <b>True/False</b>" %incrementalReport)
+
+	# Keep the requested order but only create each format once
+	requestedFormats = []
+	for reportFormat in reportFormats.split(","):
+		reportFormat = reportFormat.strip().lower()
+		if reportFormat and reportFormat not in requestedFormats:
+			requestedFormats.append(reportFormat)
+
+	invalidFormats = [reportFormat for reportFormat in requestedFormats if reportFormat not in report_artifacts.artifactFormats]
+	if invalidFormats or not requestedFormats:
+		reportOptions["errorMsg"].append("Invalid option for report formats: <b>%s</b>.  Valid options are a comma separated list of <b>%s</b>" %(reportFormats, ", ".join(report_artifacts.artifactFormats)))
+	else:
+		reportOptions["reportFormats"] = requestedFormats
+
+	if maxRequestsPerSecond.isdigit():
+		reportOptions["maxRequestsPerSecond"] = int(maxRequestsPerSecond)
+	else:
+		reportOptions["errorMsg"].append("Invalid value for the maximum number of API requests per second: <b>%s</b>.  An interger number is required (0 for no limit)" %maxRequestsPerSecond)
+
+	if maxApiErrors.isdigit():
+		reportOptions["maxApiErrors"] = int(maxApiErrors)
+	else:
+		reportOptions["errorMsg"].append("Invalid value for the maximum number of failed API calls to retry: <b>%s</b>.  An interger number is required (0 for no limit)" %maxApiErrors)
     
 
 	if not reportOptions["errorMsg"]:
@@ -9,12 +9,26 @@ File : report_artifacts.py
 '''
 
 import logging
+import os
+import gc
+import time
+import importlib
+import multiprocessing
 
-import report_artifacts_html
-import report_artifacts_xlsx
+import report_metrics
 
 logger = logging.getLogger(__name__)
 
+# The module and function that create each report format.  A module is only imported
+# when its format has been requested so unused formats cost nothing (xlsxwriter etc)
+artifactFormats = {
+    "html" : ("report_artifacts_html", "generate_html_report"),
+    "xlsx" : ("report_artifacts_xlsx", "generate_xlsx_report"),
+    "csv" : ("report_artifacts_csv", "generate_csv_report"),
+    "jsonl" : ("report_artifacts_jsonl", "generate_jsonl_report"),
+    "parquet" : ("report_artifacts_parquet", "generate_parquet_report"),
+}
+
 #--------------------------------------------------------------------------------#
 def create_report_artifacts(reportData):
     logger.info("Entering create_report_artifacts")
@@ -22,14 +36,124 @@ def create_report_artifacts(reportData):
     # Dict to hold the complete list of reports
     reports = {}
 
-    htmlFile = report_artifacts_html.generate_html_report(reportData)
-    xlsxFile = report_artifacts_xlsx.generate_xlsx_report(reportData)
+    reportFormats = reportData["reportOptions"]["reportFormats"]
+
+    artifactGenerators = [get_artifact_generator(reportFormat) for reportFormat in reportFormats]
+
+    artifactFiles = {}
+    for reportFormat, (artifactFile, elapsedSeconds) in zip(reportFormats, generate_artifacts(artifactGenerators, reportData)):
+        artifactFiles[reportFormat] = artifactFile
+        report_metrics.record_phase("Create %s report" %reportFormat, elapsedSeconds)
+
+    # A format may create several files (parquet) or none if an optional module is missing
+    allFormats = []
+    for artifactFile in artifactFiles.values():
+        if isinstance(artifactFile, list):
+            allFormats.extend(artifactFile)
+        else:
+            allFormats.append(artifactFile)
 
-    reports["viewable"] = htmlFile
-    reports["allFormats"] = [htmlFile, xlsxFile]
+    # The html report is the one shown within Code Insight if it was requested
+    if "html" in artifactFiles:
+        reports["viewable"] = artifactFiles["html"]
+    elif allFormats:
+        reports["viewable"] = allFormats[0]
+    else:
+        logger.error("    None of the requested report formats created a file")
+        reports["viewable"] = None
+    reports["allFormats"] = allFormats
+
+    for artifactFile in allFormats:
+        report_metrics.add_bytes("Report artifact %s" %os.path.basename(artifactFile), os.path.getsize(artifactFile))
 
     logger.info("Exiting create_report_artifacts")
     
-    return reports 
+    return reports
+
+#--------------------------------------------------------------------------------#
+def get_artifact_generator(reportFormat):
+
+    moduleName, functionName = artifactFormats[reportFormat]
+    logger.debug("    Loading %s for %s report" %(moduleName, reportFormat))
+
+    return getattr(importlib.import_module(moduleName), functionName)
+
+#--------------------------------------------------------------------------------#
+def generate_artifacts(artifactGenerators, reportData):
+    logger.info("Entering generate_artifacts")
+
+    # The artifacts only read the report data so each can be created in its own process
+    maxWorkers = min(len(artifactGenerators), os.cpu_count() or 1)
+
+    if maxWorkers > 1 and "fork" in multiprocessing.get_all_start_methods():
+        try:
+            artifactFiles = generate_artifacts_in_workers(artifactGenerators, reportData, maxWorkers)
+            logger.info("Exiting generate_artifacts")
+            return artifactFiles
+        except OSError as error:
+            logger.warning("    Unable to create the report artifacts in parallel (%s), creating them one at a time" %error)
+
+    # With a single core or no fork (Windows) create them one after the other
+    artifactFiles = [create_artifact(artifactGenerator, reportData) for artifactGenerator in artifactGenerators]
 
-    
\ No newline at end of file
+    logger.info("Exiting generate_artifacts")
+
+    return artifactFiles
+
+#--------------------------------------------------------------------------------#
+def generate_artifacts_in_workers(artifactGenerators, reportData, maxWorkers):
+
+    # Each worker is forked so it starts with the report data already in memory, nothing is copied
+    # or sent to it.  Only the file name and time are sent back
+    forkContext = multiprocessing.get_context("fork")
+    artifactFiles = [None] * len(artifactGenerators)
+
+    # Keep the garbage collector in the workers from writing to, and so copying, the inherited objects
+    gc.freeze()
+    try:
+        for batchStart in range(0, len(artifactGenerators), maxWorkers):
+            workers = []
+            for artifactIndex in range(batchStart, min(batchStart + maxWorkers, len(artifactGenerators))):
+                resultConnection, workerConnection = forkContext.Pipe(duplex=False)
+                worker = forkContext.Process(target=generate_artifact_in_worker, args=(artifactGenerators[artifactIndex], reportData, workerConnection))
+                worker.start()
+                workerConnection.close()
+                workers.append((artifactIndex, worker, resultConnection))
+
+            for artifactIndex, worker, resultConnection in workers:
+                try:
+                    artifactFiles[artifactIndex] = resultConnection.recv()
+                except EOFError:
+                    pass  # The worker died before sending its result
+                finally:
+                    resultConnection.close()
+                    worker.join()
+    finally:
+        gc.unfreeze()
+
+    # Anything that failed in a worker is created again here so its error is raised as usual
+    for artifactIndex, artifactFile in enumerate(artifactFiles):
+        if artifactFile is None:
+            logger.warning("    %s failed in a worker process, creating it here" %artifactGenerators[artifactIndex].__name__)
+            artifactFiles[artifactIndex] = create_artifact(artifactGenerators[artifactIndex], reportData)
+
+    return artifactFiles
+
+#--------------------------------------------------------------------------------#
+def generate_artifact_in_worker(artifactGenerator, reportData, resultConnection):
+    # Runs in a forked worker process
+    try:
+        artifactResult = create_artifact(artifactGenerator, reportData)
+    except Exception as error:
+        logger.error("    %s failed: %s" %(artifactGenerator.__name__, error))
+        artifactResult = None
+
+    resultConnection.send(artifactResult)
+    resultConnection.close()
+
+#--------------------------------------------------------------------------------#
+def create_artifact(artifactGenerator, reportData):
+    # The time is returned with the file since metrics recorded within a worker process are lost
+    startTime = time.perf_counter()
+    artifactFile = artifactGenerator(reportData)
+    return artifactFile, time.perf_counter() - startTime
@@ -0,0 +1,38 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_artifacts_csv.py
+'''
+import logging
+import csv
+
+import report_inventory
+
+logger = logging.getLogger(__name__)
+
+#------------------------------------------------------------------#
+def generate_csv_report(reportData):
+    logger.info("    Entering generate_csv_report")
+
+    reportFileNameBase = reportData["reportFileNameBase"]
+    inventoryData = reportData["inventoryData"]
+
+    csvFile = reportFileNameBase + ".csv"
+
+    # Each row is written as it is built so memory use does not grow with the inventory
+    with open(csvFile, "w", newline="", encoding="utf-8", buffering=1024*1024) as csv_ptr:
+        csvWriter = csv.writer(csv_ptr)
+        csvWriter.writerow(report_inventory.exportColumns)
+
+        complianceIssuesColumn = report_inventory.exportColumns.index("complianceIssues")
+
+        for exportRow in report_inventory.iter_export_rows(inventoryData):
+            exportRow[complianceIssuesColumn] = ";".join(exportRow[complianceIssuesColumn])
+            csvWriter.writerow(exportRow)
+
+    logger.info("    Exiting generate_csv_report")
+
+    return csvFile
@@ -9,9 +9,11 @@ File : report_artifacts_html.py
 '''
 import logging
 import os
+import json
 import base64
 
 import _version
+import report_inventory
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,8 @@ def generate_html_report(reportData):
     projectInventoryCount = reportData["projectInventoryCount"]
     totalInventoryCount = reportData["totalInventoryCount"]
     projectReviewStatus = reportData["projectReviewStatus"]
+    degradedProjects = reportData["degradedProjects"]
+    largeReportThreshold = reportData["reportOptions"]["largeReportThreshold"]
 
     cvssVersion = projectSummaryData["cvssVersion"]  # 2.0/3.x
     includeComplianceInformation = projectSummaryData["includeComplianceInformation"]  # True/False
@@ -41,6 +45,9 @@ def generate_html_report(reportData):
 
     htmlFile = reportFileNameBase + ".html"
 
+    # For large reports hand the inventory rows to the browser as data rather than as table markup
+    useInventoryTableData = largeReportThreshold > 0 and totalInventoryCount > largeReportThreshold
+
     #########################################################
     #  Encode the image files
     encodedLogoImage = encodeImage(logoImageFile)
@@ -50,7 +57,7 @@ def generate_html_report(reportData):
     # Create a simple HTML file to display
     #---------------------------------------------------------------------------------------------------
     try:
-        html_ptr = open(htmlFile, "w")
+        html_ptr = open(htmlFile, "w", buffering=1024*1024)
     except:
         logger.error("Failed to open htmlfile %s:" %htmlFile)
         raise
@@ -131,6 +138,12 @@ def generate_html_report(reportData):
     #---------------------------------------------------------------------------------------------------
     html_ptr.write("<!-- BEGIN BODY -->\n")  
 
+    # Let the reader know if some of the data could not be collected
+    if degradedProjects:
+        html_ptr.write("<div class='alert alert-warning' role='alert' style='width:90%'>\n")
+        html_ptr.write("    Data could not be collected from Code Insight for the following projects so this report is incomplete: <b>%s</b>\n" %", ".join(degradedProjects))
+        html_ptr.write("</div>\n")
+
     #######################################################################
     #  Create table to hold the application summary charts.
     #  js script itself is added later
@@ -237,116 +250,10 @@ def generate_html_report(reportData):
 
 
     ######################################################
-    # Cycle through the inventory to create the 
-    # table with the results
-    for inventoryID in sorted(inventoryData):
-
-        logger.debug("        Reporting for inventory item %s" %inventoryID)
-
-        projectName = inventoryData[inventoryID]["projectName"]
-        inventoryItemName = inventoryData[inventoryID]["inventoryItemName"]
-        componentName = inventoryData[inventoryID]["componentName"]
-        componentVersionName = inventoryData[inventoryID]["componentVersionName"]
-        inventoryPriority = inventoryData[inventoryID]["inventoryPriority"]
-        selectedLicenseName = inventoryData[inventoryID]["selectedLicenseName"]
-        vulnerabilityData = inventoryData[inventoryID]["vulnerabilityData"]
-        componentUrl = inventoryData[inventoryID]["componentUrl"]
-        selectedLicenseUrl = inventoryData[inventoryID]["selectedLicenseUrl"]
-        inventoryReviewStatus = inventoryData[inventoryID]["inventoryReviewStatus"]
-        inventoryLink = inventoryData[inventoryID]["inventoryLink"]
-        projectLink = inventoryData[inventoryID]["projectLink"]
-        complianceIssues = inventoryData[inventoryID]["complianceIssues"]
-
-        logger.debug("            Project Name:  %s   Inventory Name %s" %(projectName, inventoryItemName))
-
-        numTotalVulnerabilities = 0
-        numCriticalVulnerabilities = 0
-        numHighVulnerabilities = 0
-        numMediumVulnerabilities = 0
-        numLowVulnerabilities = 0
-        numNoneVulnerabilities = 0
-
-        try:
-            numTotalVulnerabilities = vulnerabilityData["numTotalVulnerabilities"]
-            if cvssVersion == "3.x":
-                numCriticalVulnerabilities = vulnerabilityData["numCriticalVulnerabilities"]
-            numHighVulnerabilities = vulnerabilityData["numHighVulnerabilities"]
-            numMediumVulnerabilities = vulnerabilityData["numMediumVulnerabilities"]
-            numLowVulnerabilities = vulnerabilityData["numLowVulnerabilities"]
-            numNoneVulnerabilities = vulnerabilityData["numNoneVulnerabilities"]
-        except:
-            logger.debug("    No vulnerability data")
-
-        html_ptr.write("        <tr> \n")
-        if len(projectList) > 1:
-            html_ptr.write("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(projectLink, projectName))
-        html_ptr.write("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(inventoryLink, inventoryItemName))
- 
-
-        if inventoryPriority == "High":
-            html_ptr.write("            <td data-sort='4' class='text-left text-nowrap'><span class='dot dot-red'></span>P1 - %s</td>\n" %(inventoryPriority))
-        elif inventoryPriority == "Medium":
-            html_ptr.write("            <td data-sort='3' class='text-left text-nowrap'><span class='dot dot-yellow'></span>P2 - %s</td>\n" %(inventoryPriority))
-        elif inventoryPriority == "Low":
-            html_ptr.write("            <td data-sort='2' class='text-left text-nowrap'><span class='dot dot-green'></span>P3 - %s</td>\n" %(inventoryPriority))
-        elif inventoryPriority == "Other":
-            html_ptr.write("            <td data-sort='1' class='text-left text-nowrap'><span class='dot dot-blue'></span>P4 - %s</td>\n" %(inventoryPriority))
-        else:
-            html_ptr.write("            <td class='text-left text-nowrap'><span class='dot dot-gray'></span>%s</td>\n" %(inventoryPriority))
-
-        
-        html_ptr.write("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(componentUrl, componentName))
-
-        # Highlight the version if it is old, not analyzed or invalid.
-        if "Old version" in complianceIssues.keys():
-            html_ptr.write("<td class='text-left' style='color:red;'><span title='%s'>%s</span></td>\n" %(complianceIssues["Old version"], componentVersionName))
-        elif "Version not analyzed" in complianceIssues.keys():
-            html_ptr.write("<td class='text-left' style='color:red;'><span title='%s'>%s</span></td>\n" %(complianceIssues["Version not analyzed"], componentVersionName))
-        elif "Invalid Version "  in complianceIssues.keys():
-            html_ptr.write("<td class='text-left' style='color:red;'><span title='%s'>%s</span></td>\n" %(complianceIssues["Invalid Version"], componentVersionName))
-        else:
-            html_ptr.write("            <td class='text-left'>%s</td>\n" %(componentVersionName))
-
-        html_ptr.write("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(selectedLicenseUrl, selectedLicenseName))
-       
-        # Write in single line to remove spaces between btn spans
-        if numTotalVulnerabilities > 0:
-            if cvssVersion == "3.x":
-                html_ptr.write("            <td class='text-center text-nowrap' data-sort='%s' >\n" %numCriticalVulnerabilities)
-                html_ptr.write("                <span class='btn btn-vuln btn-critical'>%s</span>\n" %(numCriticalVulnerabilities))
-            else:
-                html_ptr.write("            <td class='text-center text-nowrap' data-sort='%s' >\n" %numHighVulnerabilities)
-
-            html_ptr.write("                <span class='btn btn-vuln btn-high'>%s</span>\n" %(numHighVulnerabilities))
-            html_ptr.write("                <span class='btn btn-vuln btn-medium'>%s</span>\n" %(numMediumVulnerabilities))
-            html_ptr.write("                <span class='btn btn-vuln btn-low'>%s</span>\n" %(numLowVulnerabilities))
-            html_ptr.write("                <span class='btn btn-vuln btn-none'>%s</span>\n" %(numNoneVulnerabilities))
-        else:
-            html_ptr.write("            <td class='text-center text-nowrap' data-sort='-1' >\n" )
-            html_ptr.write("                <span class='btn btn-vuln btn-no-vulns'>None</span>\n")
-
-        if inventoryReviewStatus == "Approved":
-            html_ptr.write("            <td class='text-left text-nowrap' style='color:green;'>%s</td>\n" %(inventoryReviewStatus))
-        elif inventoryReviewStatus == "Rejected":
-            html_ptr.write("            <td class='text-left text-nowrap' style='color:red;'>%s</td>\n" %(inventoryReviewStatus))
-        elif inventoryReviewStatus == "Draft":
-            html_ptr.write("            <td class='text-left text-nowrap' style='color:gray;'>%s</td>\n" %(inventoryReviewStatus))
-        else:
-            html_ptr.write("            <td class='text-left text-nowrap'>%s</td>\n" %(inventoryReviewStatus))
-
-        if includeComplianceInformation:
-            if len(complianceIssues):
-                html_ptr.write("            <td class='text-left text-nowrap'>")
-                for issue in complianceIssues:
-                    html_ptr.write("<span class='dot dot-red'></span><span title='%s'>%s</span><br/>\n" %(complianceIssues[issue], issue))
-                html_ptr.write("</td>\n")
-            else:
-                html_ptr.write("            <td title='This item does not have any compliance issues.'><span class='dot dot-green'></span>None</td>\n")
-
-
-        html_ptr.write("            </td>\n")
-
-        html_ptr.write("        </tr>\n") 
+    # Write the inventory rows into the table unless
+    # they are being added as data within the javascript
+    if not useInventoryTableData:
+        write_inventory_table_rows(html_ptr, report_inventory.iter_inventory_rows(inventoryData), len(projectList) > 1, cvssVersion, includeComplianceInformation)
     html_ptr.write("    </tbody>\n")
 
 
@@ -385,7 +292,11 @@ def generate_html_report(reportData):
     html_ptr.write("<script>\n")
     
     # Logic for datatable for inventory details
-    add_inventory_datatable(html_ptr)
+    if useInventoryTableData:
+        write_inventory_table_data(html_ptr, report_inventory.iter_inventory_rows(inventoryData))
+        add_inventory_datatable_from_data(html_ptr, len(projectList) > 1, cvssVersion, includeComplianceInformation)
+    else:
+        add_inventory_datatable(html_ptr)
     # Add the common chartjs config
     add_default_chart_options(html_ptr)
     # Add the js for the application summary stacked bar charts
@@ -407,6 +318,130 @@ def generate_html_report(reportData):
     return htmlFile
 
 
+#----------------------------------------------------------------------------------------#
+def write_inventory_table_rows(html_ptr, inventoryRows, multipleProjects, cvssVersion, includeComplianceInformation):
+    logger.info("Entering write_inventory_table_rows")
+
+    # Build up the markup for a batch of rows and write it out in one go rather
+    # than making a separate write call for every cell
+    rowBuffer = []
+    rowsPerChunk = 500
+    numRows = 0
+
+    for inventoryRow in inventoryRows:
+
+        projectName = inventoryRow["projectName"]
+        inventoryItemName = inventoryRow["inventoryItemName"]
+        componentName = inventoryRow["componentName"]
+        componentVersionName = inventoryRow["componentVersionName"]
+        inventoryPriority = inventoryRow["inventoryPriority"]
+        selectedLicenseName = inventoryRow["selectedLicenseName"]
+        vulnerabilityData = inventoryRow["vulnerabilityData"]
+        componentUrl = inventoryRow["componentUrl"]
+        selectedLicenseUrl = inventoryRow["selectedLicenseUrl"]
+        inventoryReviewStatus = inventoryRow["inventoryReviewStatus"]
+        inventoryLink = inventoryRow["inventoryLink"]
+        projectLink = inventoryRow["projectLink"]
+        complianceIssues = inventoryRow["complianceIssues"]
+
+        numTotalVulnerabilities = 0
+        numCriticalVulnerabilities = 0
+        numHighVulnerabilities = 0
+        numMediumVulnerabilities = 0
+        numLowVulnerabilities = 0
+        numNoneVulnerabilities = 0
+
+        try:
+            numTotalVulnerabilities = vulnerabilityData["numTotalVulnerabilities"]
+            if cvssVersion == "3.x":
+                numCriticalVulnerabilities = vulnerabilityData["numCriticalVulnerabilities"]
+            numHighVulnerabilities = vulnerabilityData["numHighVulnerabilities"]
+            numMediumVulnerabilities = vulnerabilityData["numMediumVulnerabilities"]
+            numLowVulnerabilities = vulnerabilityData["numLowVulnerabilities"]
+            numNoneVulnerabilities = vulnerabilityData["numNoneVulnerabilities"]
+        except:
+            logger.debug("    No vulnerability data")
+
+        rowBuffer.append("        <tr> \n")
+        if multipleProjects:
+            rowBuffer.append("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(projectLink, projectName))
+        rowBuffer.append("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(inventoryLink, inventoryItemName))
+ 
+
+        if inventoryPriority == "High":
+            rowBuffer.append("            <td data-sort='4' class='text-left text-nowrap'><span class='dot dot-red'></span>P1 - %s</td>\n" %(inventoryPriority))
+        elif inventoryPriority == "Medium":
+            rowBuffer.append("            <td data-sort='3' class='text-left text-nowrap'><span class='dot dot-yellow'></span>P2 - %s</td>\n" %(inventoryPriority))
+        elif inventoryPriority == "Low":
+            rowBuffer.append("            <td data-sort='2' class='text-left text-nowrap'><span class='dot dot-green'></span>P3 - %s</td>\n" %(inventoryPriority))
+        elif inventoryPriority == "Other":
+            rowBuffer.append("            <td data-sort='1' class='text-left text-nowrap'><span class='dot dot-blue'></span>P4 - %s</td>\n" %(inventoryPriority))
+        else:
+            rowBuffer.append("            <td class='text-left text-nowrap'><span class='dot dot-gray'></span>%s</td>\n" %(inventoryPriority))
+
+    
+        rowBuffer.append("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(componentUrl, componentName))
+
+        # Highlight the version if it is old, not analyzed or invalid.
+        if "Old version" in complianceIssues.keys():
+            rowBuffer.append("<td class='text-left' style='color:red;'><span title='%s'>%s</span></td>\n" %(complianceIssues["Old version"], componentVersionName))
+        elif "Version not analyzed" in complianceIssues.keys():
+            rowBuffer.append("<td class='text-left' style='color:red;'><span title='%s'>%s</span></td>\n" %(complianceIssues["Version not analyzed"], componentVersionName))
+        elif "Invalid Version "  in complianceIssues.keys():
+            rowBuffer.append("<td class='text-left' style='color:red;'><span title='%s'>%s</span></td>\n" %(complianceIssues["Invalid Version"], componentVersionName))
+        else:
+            rowBuffer.append("            <td class='text-left'>%s</td>\n" %(componentVersionName))
+
+        rowBuffer.append("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(selectedLicenseUrl, selectedLicenseName))
+   
+        # Write in single line to remove spaces between btn spans
+        if numTotalVulnerabilities > 0:
+            if cvssVersion == "3.x":
+                rowBuffer.append("            <td class='text-center text-nowrap' data-sort='%s' >\n" %numCriticalVulnerabilities)
+                rowBuffer.append("                <span class='btn btn-vuln btn-critical'>%s</span>\n" %(numCriticalVulnerabilities))
+            else:
+                rowBuffer.append("            <td class='text-center text-nowrap' data-sort='%s' >\n" %numHighVulnerabilities)
+
+            rowBuffer.append("                <span class='btn btn-vuln btn-high'>%s</span>\n" %(numHighVulnerabilities))
+            rowBuffer.append("                <span class='btn btn-vuln btn-medium'>%s</span>\n" %(numMediumVulnerabilities))
+            rowBuffer.append("                <span class='btn btn-vuln btn-low'>%s</span>\n" %(numLowVulnerabilities))
+            rowBuffer.append("                <span class='btn btn-vuln btn-none'>%s</span>\n" %(numNoneVulnerabilities))
+        else:
+            rowBuffer.append("            <td class='text-center text-nowrap' data-sort='-1' >\n" )
+            rowBuffer.append("                <span class='btn btn-vuln btn-no-vulns'>None</span>\n")
+
+        if inventoryReviewStatus == "Approved":
+            rowBuffer.append("            <td class='text-left text-nowrap' style='color:green;'>%s</td>\n" %(inventoryReviewStatus))
+        elif inventoryReviewStatus == "Rejected":
+            rowBuffer.append("            <td class='text-left text-nowrap' style='color:red;'>%s</td>\n" %(inventoryReviewStatus))
+        elif inventoryReviewStatus == "Draft":
+            rowBuffer.append("            <td class='text-left text-nowrap' style='color:gray;'>%s</td>\n" %(inventoryReviewStatus))
+        else:
+            rowBuffer.append("            <td class='text-left text-nowrap'>%s</td>\n" %(inventoryReviewStatus))
+
+        if includeComplianceInformation:
+            if len(complianceIssues):
+                rowBuffer.append("            <td class='text-left text-nowrap'>")
+                for issue in complianceIssues:
+                    rowBuffer.append("<span class='dot dot-red'></span><span title='%s'>%s</span><br/>\n" %(complianceIssues[issue], issue))
+                rowBuffer.append("</td>\n")
+            else:
+                rowBuffer.append("            <td title='This item does not have any compliance issues.'><span class='dot dot-green'></span>None</td>\n")
+
+
+        rowBuffer.append("            </td>\n")
+
+        rowBuffer.append("        </tr>\n")
+
+        numRows += 1
+        if numRows % rowsPerChunk == 0:
+            html_ptr.write("".join(rowBuffer))
+            rowBuffer = []
+
+    html_ptr.write("".join(rowBuffer))
+
+    logger.info("    Wrote %s inventory rows" %numRows)
+
 ####################################################################
 def encodeImage(imageFile):
 
@@ -434,6 +469,223 @@ def add_inventory_datatable(html_ptr):
             });
         ''')    
 
+#----------------------------------------------------------------------------------------#
+def write_inventory_table_data(html_ptr, inventoryRows):
+    logger.info("Entering write_inventory_table_data")
+
+    # Project, license and compliance text repeat for many items so each row
+    # only holds an index into a lookup table for them
+    projects = {}
+    licenses = {}
+    complianceText = {}
+
+    rowBuffer = []
+    rowsPerChunk = 500
+    numRows = 0
+
+    html_ptr.write("var inventoryRows = [\n")
+
+    for inventoryRow in inventoryRows:
+
+        projectLink = inventoryRow["projectLink"]
+        inventoryLink = inventoryRow["inventoryLink"]
+        vulnerabilityData = inventoryRow["vulnerabilityData"]
+
+        projectIndex = projects.setdefault((inventoryRow["projectName"], projectLink), len(projects))
+        licenseIndex = licenses.setdefault((inventoryRow["selectedLicenseName"], inventoryRow["selectedLicenseUrl"]), len(licenses))
+
+        # The inventory link starts with the project link so only keep what is different
+        if inventoryLink.startswith(projectLink):
+            inventoryLink = inventoryLink[len(projectLink):]
+        else:
+            projectIndex = -1 - projectIndex  # Negative index flags a full link
+
+        complianceIssues = []
+        for issue, issueDetails in inventoryRow["complianceIssues"].items():
+            complianceIssues.append([complianceText.setdefault(issue, len(complianceText)), complianceText.setdefault(issueDetails, len(complianceText))])
+
+        vulnerabilities = [vulnerabilityData.get("numTotalVulnerabilities", 0), vulnerabilityData.get("numCriticalVulnerabilities", 0), 
+                            vulnerabilityData.get("numHighVulnerabilities", 0), vulnerabilityData.get("numMediumVulnerabilities", 0), 
+                            vulnerabilityData.get("numLowVulnerabilities", 0), vulnerabilityData.get("numNoneVulnerabilities", 0)]
+
+        rowData = [projectIndex, inventoryLink, inventoryRow["inventoryItemName"], inventoryRow["inventoryPriority"], inventoryRow["componentName"], 
+                    inventoryRow["componentUrl"], inventoryRow["componentVersionName"], licenseIndex, vulnerabilities, inventoryRow["inventoryReviewStatus"], complianceIssues]
+
+        rowBuffer.append(to_script_json(rowData) + ",\n")
+
+        numRows += 1
+        if numRows % rowsPerChunk == 0:
+            html_ptr.write("".join(rowBuffer))
+            rowBuffer = []
+
+    html_ptr.write("".join(rowBuffer))
+    html_ptr.write("];\n")
+
+    html_ptr.write("var inventoryProjects = %s;\n" %to_script_json(list(projects)))
+    html_ptr.write("var inventoryLicenses = %s;\n" %to_script_json(list(licenses)))
+    html_ptr.write("var complianceText = %s;\n" %to_script_json(list(complianceText)))
+
+    logger.info("    Wrote %s inventory rows as table data" %numRows)
+
+#----------------------------------------------------------------------------------------#
+def to_script_json(data):
+    # Compact json that is safe to place within a script block
+    return json.dumps(data, separators=(",", ":")).replace("</", "<\\/")
+
+#----------------------------------------------------------------------------------------#
+def add_inventory_datatable_from_data(html_ptr, multipleProjects, cvssVersion, includeComplianceInformation):
+    # Add the js for inventory datatable where the rows are built by the browser as needed
+    html_ptr.write('''
+
+            function escapeHtml(text) {
+                return String(text).replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;").replace(/'/g, "&#39;").replace(/"/g, "&quot;");
+            }
+
+            function textLink(link, text, type) {
+                if (type !== 'display') {
+                    return text;
+                }
+                return "<a href='" + escapeHtml(link) + "' target='_blank'>" + escapeHtml(text) + "</a>";
+            }
+
+            function findComplianceIssue(row, issue) {
+                for (var i = 0; i < row[10].length; i++) {
+                    if (complianceText[row[10][i][0]] === issue) {
+                        return complianceText[row[10][i][1]];
+                    }
+                }
+                return null;
+            }
+
+            var priorityDetails = {
+                "High": [4, "dot-red", "P1 - "],
+                "Medium": [3, "dot-yellow", "P2 - "],
+                "Low": [2, "dot-green", "P3 - "],
+                "Other": [1, "dot-blue", "P4 - "]
+            };
+            var reviewStatusColors = {"Approved": "green", "Rejected": "red", "Draft": "gray"};
+
+            var inventoryColumns = [];
+    ''')
+
+    if multipleProjects:
+        html_ptr.write('''
+            inventoryColumns.push({ data: 0, className: 'text-left', render: function (data, type, row) {
+                var project = inventoryProjects[data < 0 ? -1 - data : data];
+                return textLink(project[1], project[0], type);
+            }});
+        ''')
+
+    html_ptr.write('''
+            inventoryColumns.push({ data: 2, className: 'text-left', render: function (data, type, row) {
+                var project = inventoryProjects[row[0] < 0 ? -1 - row[0] : row[0]];
+                return textLink(row[0] < 0 ? row[1] : project[1] + row[1], data, type);
+            }});
+
+            inventoryColumns.push({ data: 3, className: 'text-left text-nowrap', render: function (data, type, row) {
+                var priority = priorityDetails[data];
+                if (type === 'sort' || type === 'type') {
+                    return priority ? priority[0] : 0;
+                }
+                if (type !== 'display') {
+                    return data;
+                }
+                if (priority) {
+                    return "<span class='dot " + priority[1] + "'></span>" + priority[2] + escapeHtml(data);
+                }
+                return "<span class='dot dot-gray'></span>" + escapeHtml(data);
+            }});
+
+            inventoryColumns.push({ data: 4, className: 'text-left', render: function (data, type, row) {
+                return textLink(row[5], data, type);
+            }});
+
+            inventoryColumns.push({ data: 6, className: 'text-left', render: function (data, type, row) {
+                if (type !== 'display') {
+                    return data;
+                }
+                // Highlight the version if it is old or not analyzed
+                var versionIssue = findComplianceIssue(row, "Old version") || findComplianceIssue(row, "Version not analyzed");
+                if (versionIssue) {
+                    return "<span style='color:red;' title='" + escapeHtml(versionIssue) + "'>" + escapeHtml(data) + "</span>";
+                }
+                return escapeHtml(data);
+            }});
+
+            inventoryColumns.push({ data: 7, className: 'text-left', render: function (data, type, row) {
+                return textLink(inventoryLicenses[data][1], inventoryLicenses[data][0], type);
+            }});
+    ''')
+
+    # Which severity is used for sorting the vulnerabilities
+    if cvssVersion == "3.x":
+        html_ptr.write('''
+            var vulnerabilitySeverities = [["critical", 1], ["high", 2], ["medium", 3], ["low", 4], ["none", 5]];
+        ''')
+    else:
+        html_ptr.write('''
+            var vulnerabilitySeverities = [["high", 2], ["medium", 3], ["low", 4], ["none", 5]];
+        ''')
+
+    html_ptr.write('''
+            inventoryColumns.push({ data: 8, className: 'text-center text-nowrap', render: function (data, type, row) {
+                if (type === 'sort' || type === 'type') {
+                    return data[0] > 0 ? data[vulnerabilitySeverities[0][1]] : -1;
+                }
+                if (type !== 'display') {
+                    return data.join(" ");
+                }
+                if (data[0] === 0) {
+                    return "<span class='btn btn-vuln btn-no-vulns'>None</span>";
+                }
+                var vulnerabilityCell = "";
+                for (var i = 0; i < vulnerabilitySeverities.length; i++) {
+                    vulnerabilityCell += "<span class='btn btn-vuln btn-" + vulnerabilitySeverities[i][0] + "'>" + data[vulnerabilitySeverities[i][1]] + "</span>";
+                }
+                return vulnerabilityCell;
+            }});
+
+            inventoryColumns.push({ data: 9, className: 'text-left text-nowrap', render: function (data, type, row) {
+                if (type !== 'display' || !(data in reviewStatusColors)) {
+                    return data;
+                }
+                return "<span style='color:" + reviewStatusColors[data] + ";'>" + escapeHtml(data) + "</span>";
+            }});
+    ''')
+
+    if includeComplianceInformation:
+        html_ptr.write('''
+            inventoryColumns.push({ data: 10, className: 'text-left text-nowrap', render: function (data, type, row) {
+                var complianceCell = "";
+                for (var i = 0; i < data.length; i++) {
+                    if (type !== 'display') {
+                        complianceCell += complianceText[data[i][0]] + " ";
+                    } else {
+                        complianceCell += "<span class='dot dot-red'></span><span title='" + escapeHtml(complianceText[data[i][1]]) + "'>" + escapeHtml(complianceText[data[i][0]]) + "</span><br/>";
+                    }
+                }
+                if (data.length === 0) {
+                    if (type !== 'display') {
+                        return "None";
+                    }
+                    return "<span title='This item does not have any compliance issues.'><span class='dot dot-green'></span>None</span>";
+                }
+                return complianceCell;
+            }});
+        ''')
+
+    html_ptr.write('''
+            $(document).ready(function (){
+                var table = $('#inventoryData').DataTable({
+                    "data": inventoryRows,
+                    "columns": inventoryColumns,
+                    "deferRender": true,
+                    "order": [[ 2, "desc" ]],
+                    "lengthMenu": [ [25, 50, 100, -1], [25, 50, 100, "All"] ],
+                });
+            });
+        ''')
+
 #----------------------------------------------------------------------------------------#
 def add_default_chart_options(html_ptr):
     # Add commont defaults for display charts
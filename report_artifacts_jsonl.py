@@ -0,0 +1,32 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_artifacts_jsonl.py
+'''
+import logging
+import json
+
+import report_inventory
+
+logger = logging.getLogger(__name__)
+
+#------------------------------------------------------------------#
+def generate_jsonl_report(reportData):
+    logger.info("    Entering generate_jsonl_report")
+
+    reportFileNameBase = reportData["reportFileNameBase"]
+    inventoryData = reportData["inventoryData"]
+
+    jsonlFile = reportFileNameBase + ".jsonl"
+
+    # One json object per inventory item, written as it is built so memory use does not grow with the inventory
+    with open(jsonlFile, "w", encoding="utf-8", buffering=1024*1024) as jsonl_ptr:
+        for exportRow in report_inventory.iter_export_rows(inventoryData):
+            jsonl_ptr.write(json.dumps(dict(zip(report_inventory.exportColumns, exportRow))) + "\n")
+
+    logger.info("    Exiting generate_jsonl_report")
+
+    return jsonlFile
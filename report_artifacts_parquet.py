@@ -0,0 +1,103 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_artifacts_parquet.py
+'''
+import logging
+
+import report_inventory
+
+logger = logging.getLogger(__name__)
+
+rowsPerRowGroup = 50000  # Inventory rows held in memory before they are written out
+
+#------------------------------------------------------------------#
+def generate_parquet_report(reportData):
+    logger.info("    Entering generate_parquet_report")
+
+    # pyarrow is an optional install so leave this report out rather than failing without it
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        logger.warning("    pyarrow is not installed so the parquet report will not be created")
+        print("    pyarrow is not installed so the parquet report will not be created")
+        return []
+
+    reportFileNameBase = reportData["reportFileNameBase"]
+
+    # Identify the report within each file so many reports can be queried together
+    reportMetadata = {"reportName" : reportData["reportName"], "reportVersion" : reportData["reportVersion"], 
+                        "reportTimeStamp" : reportData["reportTimeStamp"], "projectID" : str(reportData["projectID"])}
+
+    inventoryFile = reportFileNameBase + "-inventory.parquet"
+    projectsFile = reportFileNameBase + "-projects.parquet"
+
+    write_inventory_table(pyarrow, reportData["inventoryData"], reportMetadata, inventoryFile)
+    write_projects_table(pyarrow, reportData, reportMetadata, projectsFile)
+
+    logger.info("    Exiting generate_parquet_report")
+
+    return [inventoryFile, projectsFile]
+
+#------------------------------------------------------------------#
+def write_inventory_table(pyarrow, inventoryData, reportMetadata, inventoryFile):
+    logger.info("        Entering write_inventory_table")
+
+    # Same columns as the csv/jsonl reports
+    columnTypes = {"inventoryID" : pyarrow.int64(), "complianceIssues" : pyarrow.list_(pyarrow.string())}
+    for column in report_inventory.exportColumns:
+        if column.startswith("num"):
+            columnTypes[column] = pyarrow.int64()
+    schema = pyarrow.schema([(column, columnTypes.get(column, pyarrow.string())) for column in report_inventory.exportColumns], metadata=reportMetadata)
+
+    # Build the columns up a row group at a time so memory use stays the same however large the inventory is
+    with pyarrow.parquet.ParquetWriter(inventoryFile, schema, compression="zstd") as parquetWriter:
+        columns = [[] for column in report_inventory.exportColumns]
+        numRows = 0
+
+        for exportRow in report_inventory.iter_export_rows(inventoryData):
+            for columnValues, value in zip(columns, exportRow):
+                columnValues.append(value)
+            numRows += 1
+
+            if numRows % rowsPerRowGroup == 0:
+                parquetWriter.write_table(pyarrow.Table.from_arrays(columns, schema=schema))
+                columns = [[] for column in report_inventory.exportColumns]
+
+        if columns[0] or not numRows:
+            parquetWriter.write_table(pyarrow.Table.from_arrays(columns, schema=schema))
+
+    logger.info("        Wrote %s inventory rows to %s" %(numRows, inventoryFile))
+
+#------------------------------------------------------------------#
+def write_projects_table(pyarrow, reportData, reportMetadata, projectsFile):
+    logger.info("        Entering write_projects_table")
+
+    projectSummaryData = reportData["projectSummaryData"]
+    projectInventoryCount = reportData["projectInventoryCount"]
+    projectNames = projectSummaryData["projectNames"]
+
+    projectColumns = {}
+    projectColumns["projectName"] = pyarrow.array(projectNames, pyarrow.string())
+    projectColumns["numInventoryItems"] = pyarrow.array([projectInventoryCount[projectName] for projectName in projectNames], pyarrow.int64())
+
+    # Every per project metric the charts are built from (license, vulnerability and review counts)
+    for metric, metricValues in projectSummaryData.items():
+        if metric != "projectNames" and isinstance(metricValues, list):
+            projectColumns[metric] = pyarrow.array(metricValues, pyarrow.int64())
+
+    # The same metrics for each project along with all of its child projects
+    subtreeSummaryData = reportData["subtreeSummaryData"]
+    for metric in reportData["applicationSummaryData"]:
+        if metric != "cvssVersion":
+            subtreeColumn = "subtree" + metric[0].upper() + metric[1:]
+            projectColumns[subtreeColumn] = pyarrow.array([subtreeSummaryData[projectName][metric] for projectName in projectNames], pyarrow.int64())
+
+    projectsTable = pyarrow.table(projectColumns).replace_schema_metadata(reportMetadata)
+    pyarrow.parquet.write_table(projectsTable, projectsFile, compression="zstd")
+
+    logger.info("        Wrote %s project rows to %s" %(len(projectNames), projectsFile))
@@ -13,6 +13,7 @@ import xlsxwriter
 
 import common.branding.xlsx.xlsx_formatting
 import _version
+import report_inventory
 
 logger = logging.getLogger(__name__)
 #------------------------------------------------------------------#
@@ -31,14 +32,21 @@ def generate_xlsx_report(reportData):
     projectInventoryCount = reportData["projectInventoryCount"]
     totalInventoryCount = reportData["totalInventoryCount"]
     projectReviewStatus = reportData["projectReviewStatus"]
+    degradedProjects = reportData["degradedProjects"]
+    largeReportThreshold = reportData["reportOptions"]["largeReportThreshold"]
     
     cvssVersion = projectSummaryData["cvssVersion"]  # 2.0/3.x
     includeComplianceInformation = projectSummaryData["includeComplianceInformation"]  # True/False
 
     xlsxFile = reportFileNameBase + ".xlsx"
 
-    # Create the workbook/worksheet for storying the data
-    workbook = xlsxwriter.Workbook(xlsxFile)
+    # Create the workbook/worksheet for storying the data.  For large reports each row is written
+    # out to a temporary file as soon as the next one is started rather than holding every cell
+    # in memory until the workbook is closed, so every sheet has to be written in row order
+    useConstantMemory = largeReportThreshold > 0 and totalInventoryCount > largeReportThreshold
+    if useConstantMemory:
+        logger.info("        Writing %s inventory items with constant memory" %totalInventoryCount)
+    workbook = xlsxwriter.Workbook(xlsxFile, {'constant_memory': useConstantMemory})
 
     # If there is more than one project in hierarchy create sep tabs 
     # for summary data and include project hierarchy
@@ -78,64 +86,35 @@ def generate_xlsx_report(reportData):
     # Compliance format
     complianceCellFormat = workbook.add_format(common.branding.xlsx.xlsx_formatting.complianceCellFormat)
 
-    # Populate the summary data for the charts
-    dataWorksheet.write('A8', "Application Summary")
-    dataWorksheet.write_column('A9', projectSummaryData["projectNames"])
-
-    dataWorksheet.merge_range('B6:E6', 'License Summary', tableHeaderFormat)
-    
-    dataWorksheet.write('B7', "P1 Licenses")
-    dataWorksheet.write('B8', applicationSummaryData["numP1Licenses"])
-    dataWorksheet.write_column('B9', projectSummaryData["numP1Licenses"])  
-
-    dataWorksheet.write('C7', "P2 Licenses")
-    dataWorksheet.write('C8', applicationSummaryData["numP2Licenses"])
-    dataWorksheet.write_column('C9', projectSummaryData["numP2Licenses"])  
-
-    dataWorksheet.write('D7', "P3 Licenses")
-    dataWorksheet.write('D8', applicationSummaryData["numP3Licenses"])
-    dataWorksheet.write_column('D9', projectSummaryData["numP3Licenses"]) 
+    # Populate the summary data for the charts.  The cells are written a row at a time
+    # since that is the only order a constant memory workbook will accept
+    chartDataColumns = [["numP1Licenses", "P1 Licenses"], ["numP2Licenses", "P2 Licenses"], ["numP3Licenses", "P3 Licenses"], ["numNALicenses", "NA Licenses"], 
+                        ["numCriticalVulnerabilities", "Critical"], ["numHighVulnerabilities", "High"], ["numMediumVulnerabilities", "Medium"], 
+                        ["numLowVulnerabilities", "Low"], ["numNoneVulnerabilities", "None"], 
+                        ["numApproved", "Approved"], ["numRejected", "Rejected"], ["numDraft", "Draft"]]
 
-    dataWorksheet.write('E7', "NA Licenses")
-    dataWorksheet.write('E8', applicationSummaryData["numNALicenses"])
-    dataWorksheet.write_column('E9', projectSummaryData["numNALicenses"]) 
+    # There is no critical severity for CVSS v2 so column F is left empty
+    if cvssVersion != "3.x":
+        chartDataColumns[4] = None
 
+    dataWorksheet.merge_range('B6:E6', 'License Summary', tableHeaderFormat)
     dataWorksheet.merge_range('F6:J6', 'Vulnerabilities', tableHeaderFormat)
-
-    if cvssVersion == "3.x": 
-        dataWorksheet.write('F7', "Critical")
-        dataWorksheet.write('F8', applicationSummaryData["numCriticalVulnerabilities"])
-        dataWorksheet.write_column('F9', projectSummaryData["numCriticalVulnerabilities"])  
-
-    dataWorksheet.write('G7', "High")
-    dataWorksheet.write('G8', applicationSummaryData["numHighVulnerabilities"])
-    dataWorksheet.write_column('G9', projectSummaryData["numHighVulnerabilities"])  
-
-    dataWorksheet.write('H7', "Medium")
-    dataWorksheet.write('H8', applicationSummaryData["numMediumVulnerabilities"])
-    dataWorksheet.write_column('H9', projectSummaryData["numMediumVulnerabilities"])  
-
-    dataWorksheet.write('I7', "Low")
-    dataWorksheet.write('I8', applicationSummaryData["numLowVulnerabilities"])
-    dataWorksheet.write_column('I9', projectSummaryData["numLowVulnerabilities"])  
-
-    dataWorksheet.write('J7', "None")
-    dataWorksheet.write('J8', applicationSummaryData["numNoneVulnerabilities"])
-    dataWorksheet.write_column('J9', projectSummaryData["numNoneVulnerabilities"])  
-
     dataWorksheet.merge_range('K6:M6', 'Review Status', tableHeaderFormat)
 
-    dataWorksheet.write('K7', "Approved")
-    dataWorksheet.write('K8', applicationSummaryData["numApproved"])
-    dataWorksheet.write_column('K9', projectSummaryData["numApproved"])  
+    for column, chartDataColumn in enumerate(chartDataColumns, start=1):
+        if chartDataColumn is not None:
+            dataWorksheet.write(6, column, chartDataColumn[1])
 
-    dataWorksheet.write('L7', "Rejected")
-    dataWorksheet.write('L8', applicationSummaryData["numRejected"])
-    dataWorksheet.write_column('L9', projectSummaryData["numRejected"])  
+    dataWorksheet.write('A8', "Application Summary")
+    for column, chartDataColumn in enumerate(chartDataColumns, start=1):
+        if chartDataColumn is not None:
+            dataWorksheet.write(7, column, applicationSummaryData[chartDataColumn[0]])
 
-    dataWorksheet.write('M7', "Draft")
-    dataWorksheet.write('M8', applicationSummaryData["numDraft"])
-    dataWorksheet.write_column('M9', projectSummaryData["numDraft"])  
+    for projectIndex, summaryProjectName in enumerate(projectSummaryData["projectNames"]):
+        dataWorksheet.write(8 + projectIndex, 0, summaryProjectName)
+        for column, chartDataColumn in enumerate(chartDataColumns, start=1):
+            if chartDataColumn is not None:
+                dataWorksheet.write(8 + projectIndex, column, projectSummaryData[chartDataColumn[0]][projectIndex])
 
     catagoryHeaderRow = 6
     defaultChartWidth = 700
@@ -175,6 +154,11 @@ def generate_xlsx_report(reportData):
     # Do we need application level summary charts?
     if len(projectList) > 1:
 
+        licenseSummaryWorksheet.merge_range('A1:U1', "Report Generated: %s" %reportTimeStamp)
+        licenseSummaryWorksheet.merge_range('A2:U2', "Report Version: %s" %_version.__version__)
+        if degradedProjects:
+            licenseSummaryWorksheet.merge_range('A3:U3', "Incomplete data for: %s" %", ".join(degradedProjects), rejectedCellFormat)
+
         # Add project hierarchy view for each summary tab
         for summaryWorksheet in [licenseSummaryWorksheet, vulnerabilitySummaryWorksheet, reviewSummaryWorksheet]:
 
@@ -327,14 +311,13 @@ def generate_xlsx_report(reportData):
   
         projectSummaryWorksheet.merge_range('A1:F1', "Report Generated: %s" %reportTimeStamp)
         projectSummaryWorksheet.merge_range('A2:F2', "Report Version: %s" %_version.__version__)
+        if degradedProjects:
+            projectSummaryWorksheet.merge_range('A3:F3', "Incomplete data for: %s" %", ".join(degradedProjects), rejectedCellFormat)
 
         projectSummaryWorksheet.insert_chart('A4', projectLicenseSummaryChart)
         projectSummaryWorksheet.insert_chart('A13', projectVulnerabilitySummaryChart)
         projectSummaryWorksheet.insert_chart('A23', projectReviewStatusSummaryChart)
     else:
-        licenseSummaryWorksheet.merge_range('A1:U1', "Report Generated: %s" %reportTimeStamp)
-        licenseSummaryWorksheet.merge_range('A2:U2', "Report Version: %s" %_version.__version__)
-
         licenseSummaryWorksheet.insert_chart('AA9', projectLicenseSummaryChart)
         vulnerabilitySummaryWorksheet.insert_chart('AA9', projectVulnerabilitySummaryChart)
         reviewSummaryWorksheet.insert_chart('AA9', projectReviewStatusSummaryChart) 
@@ -409,22 +392,22 @@ def generate_xlsx_report(reportData):
     ######################################################
     # Cycle through the inventory to create the 
     # table with the results
-    for inventoryID in sorted(inventoryData):
-        logger.debug("        Reporting for inventory item %s" %inventoryID)
-
-        projectName = inventoryData[inventoryID]["projectName"]
-        inventoryItemName = inventoryData[inventoryID]["inventoryItemName"]
-        componentName = inventoryData[inventoryID]["componentName"]
-        componentVersionName = inventoryData[inventoryID]["componentVersionName"]
-        inventoryPriority = inventoryData[inventoryID]["inventoryPriority"]
-        selectedLicenseName = inventoryData[inventoryID]["selectedLicenseName"]
-        vulnerabilityData = inventoryData[inventoryID]["vulnerabilityData"]
-        componentUrl = inventoryData[inventoryID]["componentUrl"]
-        selectedLicenseUrl = inventoryData[inventoryID]["selectedLicenseUrl"]
-        inventoryReviewStatus = inventoryData[inventoryID]["inventoryReviewStatus"]
-        inventoryLink = inventoryData[inventoryID]["inventoryLink"]
-        projectLink = inventoryData[inventoryID]["projectLink"]
-        complianceIssues = inventoryData[inventoryID]["complianceIssues"]
+    for inventoryRow in report_inventory.iter_inventory_rows(inventoryData):
+        logger.debug("        Reporting for inventory item %s" %inventoryRow["inventoryID"])
+
+        projectName = inventoryRow["projectName"]
+        inventoryItemName = inventoryRow["inventoryItemName"]
+        componentName = inventoryRow["componentName"]
+        componentVersionName = inventoryRow["componentVersionName"]
+        inventoryPriority = inventoryRow["inventoryPriority"]
+        selectedLicenseName = inventoryRow["selectedLicenseName"]
+        vulnerabilityData = inventoryRow["vulnerabilityData"]
+        componentUrl = inventoryRow["componentUrl"]
+        selectedLicenseUrl = inventoryRow["selectedLicenseUrl"]
+        inventoryReviewStatus = inventoryRow["inventoryReviewStatus"]
+        inventoryLink = inventoryRow["inventoryLink"]
+        projectLink = inventoryRow["projectLink"]
+        complianceIssues = inventoryRow["complianceIssues"]
 
         logger.debug("            Project Name:  %s   Inventory Item %s" %(projectName, inventoryItemName))
         # Now write each cell
@@ -498,7 +481,7 @@ def generate_xlsx_report(reportData):
         row+=1
 
     # Automatically create the filter sort options
-    detailsWorksheet.autofilter(0,0, 0 + len(inventoryData)-1, len(tableHeaders)-1)
+    detailsWorksheet.autofilter(0,0, 0 + report_inventory.get_inventory_count(inventoryData)-1, len(tableHeaders)-1)
 
     workbook.close()
 
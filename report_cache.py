@@ -0,0 +1,262 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_cache.py
+'''
+import logging
+import os
+import json
+import time
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+cacheFileName = os.path.dirname(os.path.realpath(__file__)) + "/_project_inventory_report_cache.db"
+cacheTimeoutSeconds = 2  # How long to wait on another report run writing to the cache before treating it as a miss
+
+#------------------------------------------------------------------#
+def open_cache(expirationHours, maxEntries):
+    logger.info("Entering open_cache")
+
+    # A value of 0 turns the cache off
+    if not expirationHours or not maxEntries:
+        logger.info("    Persistent cache disabled")
+        return None
+
+    try:
+        # Every write commits on its own so a report run never holds the file locked while it gathers data
+        connection = sqlite3.connect(cacheFileName, timeout=cacheTimeoutSeconds, isolation_level=None, check_same_thread=False)
+        # Lets other report runs read while this one is writing
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute('''CREATE TABLE IF NOT EXISTS componentVersions (
+                                serverURL TEXT NOT NULL,
+                                componentID TEXT NOT NULL,
+                                versionNames TEXT NOT NULL,
+                                fetchedOn REAL NOT NULL,
+                                lastUsed REAL NOT NULL,
+                                PRIMARY KEY (serverURL, componentID))''')
+        connection.execute('''CREATE TABLE IF NOT EXISTS componentStatistics (
+                                serverURL TEXT NOT NULL,
+                                componentID TEXT NOT NULL,
+                                versionCount INTEGER NOT NULL,
+                                fetchSeconds REAL NOT NULL,
+                                measuredOn REAL NOT NULL,
+                                PRIMARY KEY (serverURL, componentID))''')
+        connection.execute('''CREATE TABLE IF NOT EXISTS licenseDetails (
+                                serverURL TEXT NOT NULL,
+                                licenseID TEXT NOT NULL,
+                                releaseVersion TEXT NOT NULL,
+                                licenseDetails TEXT NOT NULL,
+                                fetchedOn REAL NOT NULL,
+                                PRIMARY KEY (serverURL, licenseID))''')
+        connection.execute('''CREATE TABLE IF NOT EXISTS projectInventory (
+                                serverURL TEXT NOT NULL,
+                                projectID TEXT NOT NULL,
+                                fingerprint TEXT NOT NULL,
+                                projectInventory TEXT NOT NULL,
+                                storedOn REAL NOT NULL,
+                                lastUsed REAL NOT NULL,
+                                PRIMARY KEY (serverURL, projectID))''')
+    except sqlite3.Error as error:
+        logger.warning("    Unable to open cache file %s: %s" %(cacheFileName, error))
+        return None
+
+    cache = {}
+    cache["connection"] = connection
+    cache["lock"] = threading.Lock()  # Calls can come from collection threads
+    cache["expirationSeconds"] = int(expirationHours) * 3600
+    cache["maxEntries"] = int(maxEntries)
+    cache["hits"] = 0
+    cache["misses"] = 0
+
+    logger.info("    Using cache file %s" %cacheFileName)
+
+    return cache
+
+#------------------------------------------------------------------#
+def get_component_versions(cache, baseURL, componentID):
+
+    if cache is None:
+        return None
+
+    with cache["lock"]:
+        try:
+            row = cache["connection"].execute("SELECT versionNames, fetchedOn FROM componentVersions WHERE serverURL = ? AND componentID = ?", (baseURL, str(componentID))).fetchone()
+
+            # Treat anything older than the expiration time as a miss so it is fetched again
+            if row is None or row[1] < time.time() - cache["expirationSeconds"]:
+                cache["misses"] += 1
+                return None
+
+            cache["connection"].execute("UPDATE componentVersions SET lastUsed = ? WHERE serverURL = ? AND componentID = ?", (time.time(), baseURL, str(componentID)))
+        except sqlite3.Error as error:
+            log_cache_error("read component versions", error)
+            cache["misses"] += 1
+            return None
+
+        cache["hits"] += 1
+
+    return json.loads(row[0])
+
+#------------------------------------------------------------------#
+def store_component_versions(cache, baseURL, componentID, versionNames):
+
+    if cache is None:
+        return
+
+    currentTime = time.time()
+
+    with cache["lock"]:
+        try:
+            cache["connection"].execute("INSERT OR REPLACE INTO componentVersions VALUES (?, ?, ?, ?, ?)", (baseURL, str(componentID), json.dumps(versionNames), currentTime, currentTime))
+        except sqlite3.Error as error:
+            log_cache_error("store component versions", error)
+
+#------------------------------------------------------------------#
+def get_component_statistics(cache, baseURL, componentID):
+
+    if cache is None:
+        return None
+
+    with cache["lock"]:
+        try:
+            row = cache["connection"].execute("SELECT versionCount, fetchSeconds FROM componentStatistics WHERE serverURL = ? AND componentID = ?", (baseURL, str(componentID))).fetchone()
+        except sqlite3.Error as error:
+            log_cache_error("read component statistics", error)
+            return None
+
+    if row is None:
+        return None
+
+    return {"versionCount" : row[0], "fetchSeconds" : row[1]}
+
+#------------------------------------------------------------------#
+def store_component_statistics(cache, baseURL, componentID, versionCount, fetchSeconds):
+
+    if cache is None:
+        return
+
+    # Measurements do not expire since they are what lets a later run skip the slow call
+    with cache["lock"]:
+        try:
+            cache["connection"].execute("INSERT OR REPLACE INTO componentStatistics VALUES (?, ?, ?, ?, ?)", (baseURL, str(componentID), versionCount, fetchSeconds, time.time()))
+        except sqlite3.Error as error:
+            log_cache_error("store component statistics", error)
+
+#------------------------------------------------------------------#
+def load_license_details(cache, baseURL, releaseVersion):
+
+    licenseDetails = {}
+
+    if cache is None:
+        return licenseDetails
+
+    with cache["lock"]:
+        try:
+            # License data can change with a new Code Insight release so anything from another release is dropped
+            cache["connection"].execute("DELETE FROM licenseDetails WHERE serverURL = ? AND (releaseVersion != ? OR fetchedOn < ?)", (baseURL, releaseVersion, time.time() - cache["expirationSeconds"]))
+            rows = cache["connection"].execute("SELECT licenseID, licenseDetails FROM licenseDetails WHERE serverURL = ?", (baseURL,)).fetchall()
+        except sqlite3.Error as error:
+            log_cache_error("read license details", error)
+            return licenseDetails
+
+    # IDs are stored as text like the other tables, the inventory summary has them as numbers
+    for licenseID, details in rows:
+        licenseDetails[int(licenseID) if licenseID.isdigit() else licenseID] = json.loads(details)
+
+    return licenseDetails
+
+#------------------------------------------------------------------#
+def store_license_details(cache, baseURL, releaseVersion, licenseDetails):
+
+    if cache is None:
+        return
+
+    currentTime = time.time()
+
+    with cache["lock"]:
+        try:
+            cache["connection"].executemany("INSERT OR REPLACE INTO licenseDetails VALUES (?, ?, ?, ?, ?)", 
+                                                [(baseURL, str(licenseID), releaseVersion, json.dumps(details), currentTime) for licenseID, details in licenseDetails.items()])
+        except sqlite3.Error as error:
+            log_cache_error("store license details", error)
+
+#------------------------------------------------------------------#
+def get_oldest_valid_time(cache):
+    # Anything stored before this has expired
+    return time.time() - cache["expirationSeconds"]
+
+#------------------------------------------------------------------#
+def get_project_inventory(cache, baseURL, projectID, fingerprint):
+
+    if cache is None:
+        return None
+
+    with cache["lock"]:
+        try:
+            row = cache["connection"].execute("SELECT fingerprint, projectInventory, storedOn FROM projectInventory WHERE serverURL = ? AND projectID = ?", (baseURL, str(projectID))).fetchone()
+
+            # The project or the report settings have changed since it was stored, or it has expired
+            if row is None or row[0] != fingerprint or row[2] < get_oldest_valid_time(cache):
+                return None
+
+            cache["connection"].execute("UPDATE projectInventory SET lastUsed = ? WHERE serverURL = ? AND projectID = ?", (time.time(), baseURL, str(projectID)))
+        except sqlite3.Error as error:
+            log_cache_error("read project inventory", error)
+            return None
+
+    return json.loads(row[1])
+
+#------------------------------------------------------------------#
+def store_project_inventory(cache, baseURL, projectID, fingerprint, projectInventory):
+
+    if cache is None:
+        return
+
+    currentTime = time.time()
+
+    with cache["lock"]:
+        try:
+            cache["connection"].execute("INSERT OR REPLACE INTO projectInventory VALUES (?, ?, ?, ?, ?, ?)", (baseURL, str(projectID), fingerprint, json.dumps(projectInventory), currentTime, currentTime))
+        except sqlite3.Error as error:
+            log_cache_error("store project inventory", error)
+
+#------------------------------------------------------------------#
+def close_cache(cache):
+    logger.info("Entering close_cache")
+
+    if cache is None:
+        return
+
+    connection = cache["connection"]
+    evicted = 0
+
+    with cache["lock"]:
+        try:
+            # Drop expired entries and then the least recently used ones until we are under the size cap
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM componentVersions WHERE fetchedOn < ?", (time.time() - cache["expirationSeconds"],))
+            evicted = connection.execute('''DELETE FROM componentVersions WHERE rowid NOT IN
+                                                (SELECT rowid FROM componentVersions ORDER BY lastUsed DESC LIMIT ?)''', (cache["maxEntries"],)).rowcount
+            connection.execute('''DELETE FROM componentStatistics WHERE rowid NOT IN
+                                    (SELECT rowid FROM componentStatistics ORDER BY measuredOn DESC LIMIT ?)''', (cache["maxEntries"],))
+            connection.execute("DELETE FROM projectInventory WHERE storedOn < ?", (time.time() - cache["expirationSeconds"],))
+            connection.execute('''DELETE FROM projectInventory WHERE rowid NOT IN
+                                    (SELECT rowid FROM projectInventory ORDER BY lastUsed DESC LIMIT ?)''', (cache["maxEntries"],))
+            connection.execute("COMMIT")
+        except sqlite3.Error as error:
+            # Closing drops anything half done, another run can trim the cache next time
+            log_cache_error("trim the cache", error)
+        finally:
+            connection.close()
+
+    logger.info("    Component version cache: %s hits, %s misses, %s entries evicted" %(cache["hits"], cache["misses"], evicted))
+
+#------------------------------------------------------------------#
+def log_cache_error(action, error):
+    # The cache only saves API calls, a locked or damaged cache file must never fail the report
+    logger.warning("    Unable to %s in the cache, continuing without it: %s" %(action, error))
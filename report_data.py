@@ -8,14 +8,21 @@ Created On : Fri Aug 07 2020
 File : report_data.py
 '''
 
-import logging, re
+import logging, os, json, time, hashlib
+import concurrent.futures
 
 import common.api.project.get_child_projects
 import common.api.project.get_project_information
-import common.api.project.get_inventory_summary
 import common.api.license.license_lookup
 import common.api.component.get_component_details
 
+import report_cache
+import report_inventory
+import report_inventory_pages
+import report_metrics
+import report_session
+import report_versions
+
 logger = logging.getLogger(__name__)
 
 #-------------------------------------------------------------------#
@@ -28,16 +35,47 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
     includeComplianceInformation = reportOptions["includeComplianceInformation"]  # True/False
     cvssVersion = reportOptions["cvssVersion"]  # 2.0/3.x
     maxVersionsBack = reportOptions["maxVersionsBack"]  # Postive Int value
+    maxConcurrentRequests = reportOptions["maxConcurrentRequests"]  # Postive Int value
+    cacheExpirationHours = reportOptions["cacheExpirationHours"]  # Int value, 0 disables the cache
+    cacheMaxEntries = reportOptions["cacheMaxEntries"]  # Int value, 0 disables the cache
+    maxComponentVersions = reportOptions["maxComponentVersions"]  # Int value, 0 for no limit
+    incrementalReport = reportOptions["incrementalReport"]  # True/False
 
     projectList = [] # List to hold parent/child details for report
-    inventoryData = {}  # Create a dictionary containing the inventory data using inventoryID as keys
+    inventoryData = report_inventory.create_inventory_store()  # Compact store of the inventory data using inventoryID as keys
     projectData = {} # Create a dictionary containing the project level summary data using projectID as keys
-    licenseDetails = {} # Dictionary to store license details to avoid multiple lookups for same id
+    componentVersionIndex = {} # Dictionary to store the sorted versions of a component to avoid multiple lookups for same id
     projectReviewStatus = {}
     totalInventoryCount = 0
 
+    # Component version lists and license details rarely change so keep them between report runs
+    reportCache = report_cache.open_cache(cacheExpirationHours, cacheMaxEntries)
+
+    # Which components are too costly to run version analysis against
+    versionAnalysisPolicy = {}
+    versionAnalysisPolicy["skipList"] = load_version_analysis_skip_list()
+    versionAnalysisPolicy["maxComponentVersions"] = maxComponentVersions
+    versionAnalysisPolicy["fetchTimes"] = {}
+
+    # Reuse the processed inventory of projects that have not changed since an earlier run
+    incrementalState = None
+    if incrementalReport:
+        if reportCache is None:
+            logger.warning("    Incremental report requested but the cache is disabled, processing all projects")
+        else:
+            incrementalState = {}
+            incrementalState["reportCache"] = reportCache
+            incrementalState["reusedItems"] = 0
+            # Anything that changes how the inventory is processed has to be part of each project's fingerprint
+            incrementalState["reportSettings"] = {"cvssVersion" : cvssVersion, "includeComplianceInformation" : includeComplianceInformation, 
+                                                    "maxVersionsBack" : maxVersionsBack, "maxComponentVersions" : maxComponentVersions, 
+                                                    "skipList" : versionAnalysisPolicy["skipList"], "releaseVersion" : reportData["releaseVersion"],
+                                                    "inventoryRecordFields" : report_inventory.InventoryRecord.__slots__}
+            # Items processed before this are too old to reuse, their version checks are refreshed
+            incrementalState["oldestReusableTime"] = report_cache.get_oldest_valid_time(reportCache)
+
     # Get the list of parent/child projects start at the base project
-    projectHierarchy = common.api.project.get_child_projects.get_child_projects_recursively(baseURL, projectID, authToken)
+    projectHierarchy = report_session.call_api("Project hierarchy lookup", common.api.project.get_child_projects.get_child_projects_recursively, baseURL, projectID, authToken, requestType="hierarchy")
 
     # Create a list of project data sorted by the project name at each level for report display  
     # Add details for the parent node
@@ -56,33 +94,35 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
         logger.debug("Child hierarchy disabled")
 
     projectInventoryCount = {}
+    degradedProjects = [] # Projects whose data could not be collected
+
+    # Fetch the project information for all projects up front
+    with report_metrics.phase_timer("Collect project data"):
+        projectDetails = collect_project_data(baseURL, projectList, authToken, maxConcurrentRequests)
+
+    # Start with the licenses that earlier runs against this server and release already looked up,
+    # the rest are looked up a page of inventory at a time
+    licenseDetails = report_cache.load_license_details(reportCache, baseURL, reportData["releaseVersion"])
+    failedLicenseIDs = set()
+    resolve_page_licenses = lambda inventoryPage: resolve_license_details(baseURL, inventoryPage, authToken, maxConcurrentRequests, reportCache, reportData["releaseVersion"], licenseDetails, failedLicenseIDs)
+
+    # The inventory summaries are read a page at a time while the next pages are fetched so only a
+    # few pages are held no matter how large the projects are
+    inventoryStream = report_inventory_pages.open_inventory_stream(baseURL, projectList, authToken, cvssVersion, maxConcurrentRequests)
 
     #  Gather the details for each project and summerize the data
-    for project in projectList:
+    processingStartTime = time.perf_counter()
+    for project, projectDetail in zip(projectList, projectDetails):
+
+        projectInformation = projectDetail["projectInformation"]
 
         projectID = project["projectID"]
         projectName = project["projectName"]
         projectLink = project["projectLink"]
 
-        # Get project information with rollup summary data
-        try:
-            projectInformation = common.api.project.get_project_information.get_project_information_summary(baseURL, projectID, authToken)
-        except:
-            logger.error("    No Project Information Returned for %s!" %projectName)
-            print("No Project Information Returned for %s." %projectName)
-
-        # Get project summary information
-        if cvssVersion == "3.x":
-            projectInventorySummary = common.api.project.get_inventory_summary.get_project_inventory_with_v3_summary(baseURL, projectID, authToken)
-        else:
-            projectInventorySummary = common.api.project.get_inventory_summary.get_project_inventory_with_v2_summary(baseURL, projectID, authToken)
-        
-        if not projectInventorySummary:
-            logger.warning("    Project %s contains no inventory items" %projectName)
-            print("Project %s contains no inventory items." %projectName)
-
-        projectInventoryCount[projectName] = len(projectInventorySummary)
-        totalInventoryCount += len(projectInventorySummary)
+        # Report on whatever could be collected for the project rather than failing the entire report
+        if projectInformation is None:
+            projectInformation = create_empty_project_information()
 
         # Create empty dictionary for project level data for this project
         projectData[projectName] = {}
@@ -93,16 +133,53 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
         numRejected = 0
         numDraft = 0
         currentItem=0
+        reusedItems = 0
+
+        # Items processed by an earlier run, inventoryID : (itemHash, processedOn, recordValues), along with
+        # the hash and time of each item processed by this one to keep for the next run
+        if incrementalState is not None:
+            projectFingerprint = create_project_fingerprint(project, incrementalState["reportSettings"])
+            cachedInventoryItems = get_cached_inventory_items(incrementalState, baseURL, projectID, projectFingerprint)
+            processedItems = []
+
+        projectInventorySummary = report_inventory_pages.iter_project_inventory(inventoryStream, project, resolve_page_licenses)
 
         for inventoryItem in projectInventorySummary:
             currentItem +=1
 
-            complianceIssues = {}
-
             inventoryID = inventoryItem["id"]
+            inventoryReviewStatus = inventoryItem["reviewStatus"] 
+
+            #############################################
+            # Sum up inventory review status data
+            if inventoryReviewStatus == "Approved":
+                numApproved += 1
+            elif inventoryReviewStatus == "Rejected":
+                numRejected += 1
+            elif inventoryReviewStatus == "Draft":
+                numDraft += 1
+            else:
+                logger.error("Unknown inventoryReview Status: %s" %inventoryReviewStatus)
+
+            # An item that is exactly as the server returned it to an earlier run doesn't need to be processed again
+            if incrementalState is not None:
+                itemHash = get_inventory_item_hash(inventoryItem)
+                cachedInventoryItem = cachedInventoryItems.get(inventoryID)
+
+                if cachedInventoryItem is not None and cachedInventoryItem[0] == itemHash:
+                    report_inventory.add_inventory_record(inventoryData, inventoryID, cachedInventoryItem[2])
+                    processedItems.append([inventoryID, itemHash, cachedInventoryItem[1]])
+                    reusedItems += 1
+                    continue
+
+                processedItems.append([inventoryID, itemHash, time.time()])
+
+            complianceIssues = []
+            versionDetails = {}
+
             inventoryItemName = inventoryItem["name"]
 
-            logger.debug("Processing inventory items %s of %s" %(currentItem, len(projectInventorySummary)))
+            logger.debug("Processing inventory item %s" %currentItem)
             logger.debug("    Project:  %s   Inventory Name: %s  Inventory ID: %s" %(projectName, inventoryItemName, inventoryID))
             
             componentName = inventoryItem["componentName"]
@@ -110,51 +187,27 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
             inventoryPriority = inventoryItem["priority"]
             componentVersionName = inventoryItem["componentVersionName"]
             selectedLicenseID = inventoryItem["selectedLicenseId"]
-            selectedLicenseName = inventoryItem["selectedLicenseSPDXIdentifier"]
 
             if selectedLicenseID in licenseDetails.keys():
                 selectedLicenseName = licenseDetails[selectedLicenseID]["selectedLicenseName"]
                 selectedLicenseUrl = licenseDetails[selectedLicenseID]["selectedLicenseUrl"]
                 selectedLicensePriority = licenseDetails[selectedLicenseID]["selectedLicensePriority"]
+            elif selectedLicenseID != "N/A":
+                # The license lookup failed so fall back to what the inventory summary has
+                selectedLicenseName = inventoryItem["selectedLicenseSPDXIdentifier"]
+                selectedLicenseUrl = ""
+                selectedLicensePriority = ""
             else:
-                if selectedLicenseID != "N/A":  
-                    logger.debug("        Fetching license details for %s with ID %s" %(selectedLicenseName, selectedLicenseID ))
-                    licenseInformation = common.api.license.license_lookup.get_license_details(baseURL, selectedLicenseID, authToken)
-                    licenseURL = licenseInformation["url"]
-                    spdxIdentifier = licenseInformation["spdxIdentifier"]
-                    licensePriority = licenseInformation["priority"]
-
-                    if spdxIdentifier != "" and  spdxIdentifier != "N/A":
-                        licenseName = spdxIdentifier
-                    else:
-                        licenseName = licenseInformation["shortName"]
-
-                    # There is not specific selected licesne just let it be blank
-                    if licenseName == "I don't know":
-                        licenseName = ""
-
-                    licenseDetails[selectedLicenseID] = {}
-                    licenseDetails[selectedLicenseID]["selectedLicenseName"] = licenseName
-                    licenseDetails[selectedLicenseID]["selectedLicenseUrl"] = licenseURL
-                    licenseDetails[selectedLicenseID]["selectedLicensePriority"] = licensePriority
-
-                    selectedLicenseName = licenseName
-                    selectedLicenseUrl = licenseURL
-                    selectedLicensePriority = licensePriority
-                     
-                else:
-                    # Typically a WIP item
-                    selectedLicenseName = ""
-                    selectedLicenseUrl = ""     
-                    selectedLicensePriority = ""
+                # Typically a WIP item
+                selectedLicenseName = ""
+                selectedLicenseUrl = ""     
+                selectedLicensePriority = ""
 
             # If there is no specific version just leave it blank
             if componentVersionName == "N/A":
                 componentVersionName = ""
             
             componentUrl = inventoryItem["url"]
-            inventoryReviewStatus = inventoryItem["reviewStatus"] 
-            inventoryLink = baseURL + "/codeinsight/FNCI#myprojectdetails/?id=" + str(projectID) + "&tab=projectInventory&pinv=" + str(inventoryID)
 
             try:
                 if cvssVersion == "3.x":
@@ -178,50 +231,47 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
                 
                 # Check review status
                 if inventoryReviewStatus == "Rejected":
-                    complianceIssues["Item rejected"] = "This item has been rejected for use. Please consult with your legal and/or security team for further guidance."
+                    complianceIssues.append(report_inventory.ComplianceIssue.ITEM_REJECTED)
                 elif inventoryReviewStatus == "Draft":
-                    complianceIssues["Item not reviewed"] =  "This item has not been reviewed for use. Please consult with your legal and/or security team for further guidance."
+                    complianceIssues.append(report_inventory.ComplianceIssue.ITEM_NOT_REVIEWED)
 
 
                 # Check if there is vulnerability data
                 if sum(vulnerabilityData.values()) > 0:
-                    complianceIssues["Security vulnerabilities"] = "This item has associated security vulnerabilites. Please consult with your security team for further guidance."
+                    complianceIssues.append(report_inventory.ComplianceIssue.SECURITY_VULNERABILITIES)
 
                 
                 # License compliance issue
                 if selectedLicensePriority == 1:
-                    complianceIssues["P1 license"] = "This item has a viral or strong copyleft license. Depnding on your usage there may be additional oblilgations. Please consult with your legal team.."
+                    complianceIssues.append(report_inventory.ComplianceIssue.P1_LICENSE)
 
                 # Component version compliance issue
                 if componentVersionName == "":
-                    complianceIssues["Unknown version"] = "This item has an unknown version. Additional analysis is recommended."
+                    complianceIssues.append(report_inventory.ComplianceIssue.UNKNOWN_VERSION)
                 else:
-                    if componentID == "55720":  # Is it the linux kernel?
-                        # The API call for the versions of linux takes a long time due to teh massive number of versions so bypass
-                        logger.debug("Linux kernel so skipping version analysis")
-                        complianceIssues["Version not analyzed"] = "This versions for this component have not beeen analyzed. Manual inspection is suggested"
-                    elif componentID == "6682478":  # Is it the vim-vim?
-                        # The API call for the versions of vim-vim takes a long time due to the massive number of versions so bypass
-                        logger.debug("vim-vim so skipping version analysis")
-                        complianceIssues["Version not analyzed"] = "This versions for this component have not beeen analyzed. Manual inspection is suggested"
-                    else:
                     #    Determine if there are any issues with the version
-                        componentVersionDetails = getVersionDetails(componentVersionName, componentID, baseURL, authToken)
+                    with report_metrics.phase_timer("Version analysis"):
+                        componentVersionDetails = getVersionDetails(componentVersionName, componentID, baseURL, authToken, componentVersionIndex, reportCache, versionAnalysisPolicy)
+
+                    if "versionNotAnalyzed" in componentVersionDetails:
+                        complianceIssues.append(report_inventory.ComplianceIssue.VERSION_NOT_ANALYZED)
+                    else:
                         numberVersionsBack = componentVersionDetails["numberVersionsBack"]
 
                         if int(numberVersionsBack) >= int(maxVersionsBack):
-                            latestVersion = componentVersionDetails["latestVersion"]
-                            complianceIssues["Old version"] = "The latest version is " + latestVersion + ". Your version is " + str(numberVersionsBack) + " versions back from the latest version. You should consider upgrading to a more recent version of this component."
+                            complianceIssues.append(report_inventory.ComplianceIssue.OLD_VERSION)
+                            versionDetails["latestVersion"] = componentVersionDetails["latestVersion"]
+                            versionDetails["numberVersionsBack"] = numberVersionsBack
                         elif numberVersionsBack == -1:
-                            complianceIssues["Invalid Version"] = componentVersionName + " is not a valid version for the current component." 
+                            complianceIssues.append(report_inventory.ComplianceIssue.INVALID_VERSION)
                 
                 # Was there a license selected?
                 if selectedLicenseName == "":
-                    complianceIssues["Unspecified license"] = "This item has does not have a license associated with it. Additional analysis is recommended."
+                    complianceIssues.append(report_inventory.ComplianceIssue.UNSPECIFIED_LICENSE)
 
 
             # Store the data for the inventory item for reporting
-            inventoryData[inventoryID] = {
+            processedInventoryItem = {
                 "projectName" : projectName,
                 "inventoryItemName" : inventoryItemName,
                 "componentName" : componentName,
@@ -232,21 +282,36 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
                 "componentUrl" : componentUrl,
                 "selectedLicenseUrl" : selectedLicenseUrl,
                 "inventoryReviewStatus" : inventoryReviewStatus,
-                "inventoryLink" : inventoryLink,
                 "projectLink" : projectLink,
-                "complianceIssues" : complianceIssues
+                "complianceIssues" : complianceIssues,
+                **versionDetails
             }
+            report_inventory.add_inventory_item(inventoryData, inventoryID, processedInventoryItem)
 
-            #############################################
-            # Sum up inventory review status data
-            if inventoryReviewStatus == "Approved":
-                numApproved += 1
-            elif inventoryReviewStatus == "Rejected":
-                numRejected += 1
-            elif inventoryReviewStatus == "Draft":
-                numDraft += 1
-            else:
-                logger.error("Unknown inventoryReview Status: %s" %inventoryReviewStatus)
+        # A page of the inventory can fail part way through so the item count is only known at the end
+        numInventoryItems = currentItem
+
+        if "projectDegraded" in project:
+            logger.warning("    Project %s is missing data and will be reported as incomplete" %projectName)
+            degradedProjects.append(projectName)
+
+        if not numInventoryItems:
+            logger.warning("    Project %s contains no inventory items" %projectName)
+            print("Project %s contains no inventory items." %projectName)
+
+        projectInventoryCount[projectName] = numInventoryItems
+        totalInventoryCount += numInventoryItems
+
+        # Keep the records of this project so the next incremental run only has to process the items that changed
+        if incrementalState is not None:
+            if reusedItems:
+                logger.info("    Reused %s of %s inventory items processed by an earlier run for %s" %(reusedItems, numInventoryItems, projectName))
+                incrementalState["reusedItems"] += reusedItems
+
+            if "projectDegraded" not in project:
+                cachedProjectInventory = {"inventoryItems" : [[inventoryID, itemHash, processedOn, report_inventory.get_record_values(inventoryData, inventoryID)]
+                                                                for inventoryID, itemHash, processedOn in processedItems]}
+                report_cache.store_project_inventory(reportCache, baseURL, projectID, projectFingerprint, cachedProjectInventory)
 
         # Group all inventory based data into a dict wit the project name as the key
         projectData[projectName]["numApproved"] = numApproved
@@ -258,10 +323,11 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
         projectData[projectName]["numNALicenses"] = projectInformation["licenses"]["Unknown"]
 
         # Determine the state of the project based on the "worst" status of inventory
+        # and if the inventory could not be collected treat the project as not reviewed
         if numRejected > 0:
             project.update({"projectReviewStatus": "Rejected"})
             projectReviewStatus[projectID] = "Rejected"
-        elif numDraft > 0:
+        elif numDraft > 0 or "projectDegraded" in project:
             project.update({"projectReviewStatus": "Draft"})
             projectReviewStatus[projectID] = "Draft"
         else:
@@ -282,7 +348,17 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
 
         projectData[projectName]["projectLink"] = projectLink
 
+    # Includes the version analysis which is also timed on its own
+    report_metrics.record_phase("Process inventory", time.perf_counter() - processingStartTime)
+
+    if incrementalState is not None:
+        logger.info("    Reused %s of %s inventory items processed by an earlier run" %(incrementalState["reusedItems"], totalInventoryCount))
+
+    log_slowest_component_fetches(versionAnalysisPolicy)
+    report_cache.close_cache(reportCache)
+
     # Roll up the inventortory data at a project level for display charts
+    rollUpStartTime = time.perf_counter()
     projectSummaryData = create_project_summary_data_dict(projectData)
     projectSummaryData["includeComplianceInformation"] = includeComplianceInformation
     projectSummaryData["cvssVersion"] = cvssVersion
@@ -290,9 +366,14 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
     # Roll up the individual project data to the application level
     applicationSummaryData = create_application_summary_data_dict(projectSummaryData)
 
+    # Roll up each project along with everything below it in the hierarchy
+    subtreeSummaryData = create_subtree_summary_data_dict(projectHierarchy, projectData)
+
     # Roll up the project review status based on the status of child projects
     projectReviewStatus = roll_up_project_review_level(projectHierarchy, projectReviewStatus, 1)
 
+    report_metrics.record_phase("Summary roll ups", time.perf_counter() - rollUpStartTime)
+
     # Build up the data to return for the
     reportData["topLevelProjectName"] = topLevelProjectName
     reportData["projectHierarchy"] = projectHierarchy
@@ -302,14 +383,157 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
     reportData["projectList"] =projectList
     reportData["projectSummaryData"] = projectSummaryData
     reportData["applicationSummaryData"] = applicationSummaryData
+    reportData["subtreeSummaryData"] = subtreeSummaryData
     reportData["projectInventoryCount"] = projectInventoryCount
     reportData["totalInventoryCount"] = totalInventoryCount
     reportData["projectReviewStatus"] = projectReviewStatus
+    reportData["degradedProjects"] = degradedProjects
 
     logger.info("Exiting gather_data_for_report")
 
     return reportData
   
+#-------------------------------------------------------------------#
+def collect_project_data(baseURL, projectList, authToken, maxConcurrentRequests):
+    logger.info("Entering collect_project_data")
+
+    # Make the API calls for several projects at once since most of the time is spent waiting
+    # on the server. map returns the results in projectList order no matter which project
+    # finishes first so the charts and tables are always built in the same order
+    with concurrent.futures.ThreadPoolExecutor(max_workers=maxConcurrentRequests) as executor:
+        projectDetails = list(executor.map(lambda project: get_project_details(baseURL, project, authToken), projectList))
+
+    logger.info("Exiting collect_project_data")
+
+    return projectDetails
+
+#-------------------------------------------------------------------#
+def get_project_details(baseURL, project, authToken):
+
+    projectID = project["projectID"]
+    projectName = project["projectName"]
+
+    projectDetail = {}
+
+    logger.debug("    Collecting project information for %s" %projectName)
+
+    # Get project information with rollup summary data
+    try:
+        projectInformation = report_session.call_api("Project information for %s" %projectName, common.api.project.get_project_information.get_project_information_summary, baseURL, projectID, authToken, requestType="project")
+    except:
+        logger.error("    No Project Information Returned for %s!" %projectName)
+        print("No Project Information Returned for %s." %projectName)
+        projectInformation = None
+        project["projectDegraded"] = True
+
+    projectDetail["projectInformation"] = projectInformation
+
+    return projectDetail
+
+#-------------------------------------------------------------------#
+def create_project_fingerprint(project, reportSettings):
+    # Everything besides the item itself that goes into a processed record
+
+    fingerprintData = {}
+    fingerprintData["projectName"] = project["projectName"]
+    fingerprintData["projectLink"] = project["projectLink"]
+    fingerprintData["reportSettings"] = reportSettings
+
+    return hashlib.sha256(json.dumps(fingerprintData, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+#-------------------------------------------------------------------#
+def get_cached_inventory_items(incrementalState, baseURL, projectID, projectFingerprint):
+
+    # Code Insight has no change feed and the project summary has no item count or last updated time,
+    # so each item is compared with the one an earlier run processed as it is read from the inventory
+    cachedProjectInventory = report_cache.get_project_inventory(incrementalState["reportCache"], baseURL, projectID, projectFingerprint)
+    if cachedProjectInventory is None:
+        return {}
+
+    cachedInventoryItems = {}
+    for inventoryID, itemHash, processedOn, recordValues in cachedProjectInventory["inventoryItems"]:
+        if processedOn >= incrementalState["oldestReusableTime"]:
+            cachedInventoryItems[inventoryID] = (itemHash, processedOn, recordValues)
+
+    return cachedInventoryItems
+
+#-------------------------------------------------------------------#
+def get_inventory_item_hash(inventoryItem):
+    # Any change to an item as the server returns it changes the hash
+    return hashlib.sha256(json.dumps(inventoryItem, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+#-------------------------------------------------------------------#
+def resolve_license_details(baseURL, inventoryItems, authToken, maxConcurrentRequests, reportCache, releaseVersion, licenseDetails, failedLicenseIDs):
+
+    # Find the distinct licenses on this page that have not been seen yet so each is only looked up once
+    selectedLicenseIDs = {}
+    for inventoryItem in inventoryItems:
+        if inventoryItem["selectedLicenseId"] not in licenseDetails and inventoryItem["selectedLicenseId"] not in failedLicenseIDs:
+            selectedLicenseIDs[inventoryItem["selectedLicenseId"]] = True
+    selectedLicenseIDs.pop("N/A", None)  # Typically a WIP item
+    selectedLicenseIDs = list(selectedLicenseIDs)
+
+    if not selectedLicenseIDs:
+        return
+
+    logger.debug("    %s licenses known, fetching details for %s licenses" %(len(licenseDetails), len(selectedLicenseIDs)))
+
+    # There is no bulk license endpoint so make the individual calls at the same time
+    with report_metrics.phase_timer("License lookups"):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=maxConcurrentRequests) as executor:
+            fetchedLicenseDetails = dict(zip(selectedLicenseIDs, executor.map(lambda selectedLicenseID: get_license_details(baseURL, selectedLicenseID, authToken), selectedLicenseIDs)))
+
+    # Leave out any license that could not be looked up, and don't try it again on later pages
+    for selectedLicenseID in selectedLicenseIDs:
+        if fetchedLicenseDetails[selectedLicenseID] is None:
+            fetchedLicenseDetails.pop(selectedLicenseID)
+            failedLicenseIDs.add(selectedLicenseID)
+
+    report_cache.store_license_details(reportCache, baseURL, releaseVersion, fetchedLicenseDetails)
+    licenseDetails.update(fetchedLicenseDetails)
+
+#-------------------------------------------------------------------#
+def get_license_details(baseURL, selectedLicenseID, authToken):
+
+    logger.debug("        Fetching license details for license ID %s" %selectedLicenseID)
+    try:
+        licenseInformation = report_session.call_api("License lookup for %s" %selectedLicenseID, common.api.license.license_lookup.get_license_details, baseURL, selectedLicenseID, authToken, requestType="license")
+    except:
+        logger.error("    No License Details Returned for license ID %s!" %selectedLicenseID)
+        return None
+
+    licenseURL = licenseInformation["url"]
+    spdxIdentifier = licenseInformation["spdxIdentifier"]
+    licensePriority = licenseInformation["priority"]
+
+    if spdxIdentifier != "" and  spdxIdentifier != "N/A":
+        licenseName = spdxIdentifier
+    else:
+        licenseName = licenseInformation["shortName"]
+
+    # There is not specific selected licesne just let it be blank
+    if licenseName == "I don't know":
+        licenseName = ""
+
+    licenseDetails = {}
+    licenseDetails["selectedLicenseName"] = licenseName
+    licenseDetails["selectedLicenseUrl"] = licenseURL
+    licenseDetails["selectedLicensePriority"] = licensePriority
+
+    return licenseDetails
+
+#-------------------------------------------------------------------#
+def create_empty_project_information():
+
+    # Stand in for the rollup summary data of a project that could not be collected
+    projectInformation = {}
+    projectInformation["licenses"] = {"P1" : 0, "P2" : 0, "P3" : 0, "Unknown" : 0}
+    projectInformation["vulnerabilities"] = {}
+    projectInformation["vulnerabilities"]["CvssV3"] = {"Critical" : 0, "High" : 0, "Medium" : 0, "Low" : 0, "None" : 0}
+    projectInformation["vulnerabilities"]["CvssV2"] = {"High" : 0, "Medium" : 0, "Low" : 0, "Unknown" : 0}
+
+    return projectInformation
+
 #----------------------------------------------------------------------
 def create_inventory_summary_dict(vulnerabilities,cvssVersion):
     logger.info("Entering create_inventory_summary_dict")
@@ -397,7 +621,36 @@ def create_application_summary_data_dict(projectSummaryData):
     return applicationSummaryData
 
 #----------------------------------------------------------------------------------------#
-def getVersionDetails(componentVersionName, componentID, baseURL, authToken):
+def create_subtree_summary_data_dict(projectHierarchy, projectData):
+    logger.debug("Entering create_subtree_summary_data_dict")
+
+    # Total of each metric for every project along with all of the projects below it
+    subtreeSummaryData = {}
+    add_subtree_totals(projectHierarchy, projectData, subtreeSummaryData)
+
+    logger.debug("Exiting create_subtree_summary_data_dict")
+    return subtreeSummaryData
+
+#----------------------------------------------------------------------------------------#
+def add_subtree_totals(projectNode, projectData, subtreeSummaryData):
+
+    # Start from the project's own counts, a project that is not in the report (child projects
+    # were not included) only adds what is below it
+    subtreeTotals = {}
+    for metric, value in projectData.get(projectNode["name"], {}).items():
+        if metric not in  ["P1InventoryItems", "projectLink"]:
+            subtreeTotals[metric] = value
+
+    for childProject in projectNode["childProject"]:
+        for metric, value in add_subtree_totals(childProject, projectData, subtreeSummaryData).items():
+            subtreeTotals[metric] = subtreeTotals.get(metric, 0) + value
+
+    subtreeSummaryData[projectNode["name"]] = subtreeTotals
+
+    return subtreeTotals
+
+#----------------------------------------------------------------------------------------#
+def getVersionDetails(componentVersionName, componentID, baseURL, authToken, componentVersionIndex, reportCache, versionAnalysisPolicy):
     logger.debug("Entering getVersionDetails")
 
     componentVersionDetails = {}
@@ -406,49 +659,34 @@ def getVersionDetails(componentVersionName, componentID, baseURL, authToken):
     if componentID == "N/A":
         return componentVersionDetails
 
-    versionDetails = common.api.component.get_component_details.get_component_details_v3_summary(baseURL, componentID, authToken)
+    # Only fetch and sort the versions the first time this component is seen
+    if componentID not in componentVersionIndex:
+        componentVersionIndex[componentID] = create_component_version_index(componentID, baseURL, authToken, reportCache, versionAnalysisPolicy)
 
-    componentVersionList = versionDetails["data"]["versionList"]
+    versionIndex = componentVersionIndex[componentID]
 
-    # Are there any versions?
-    if not len(componentVersionList):
+    # Was the component too large to analyze?
+    if "versionNotAnalyzed" in versionIndex:
+        componentVersionDetails["versionNotAnalyzed"] = True
+        componentVersionDetails["currentVersion"] = componentVersionName
         return componentVersionDetails
 
-    componentVersions = [] # To hold just the version names that can be processed
-    ignoreVersions = ["unknown", "custom", "any version", "sample"]
-
-    # Extract just the version names for comparison purposes
-    for version in componentVersionList:
-        versionName = version["name"]
-
-        if versionName.lower() not in ignoreVersions:
-            componentVersions.append(versionName)
-        else:
-            logger.warning("        The version %s is contained in the ingnoreVersions list" %versionName)
-
-    componentVersions.sort(key=natural_sort)
-
-    # In case there is a combination of version types 1.2 vs snapshot etc
-    # move the ones starting with text to the begining of the list
-    insertLocation = 0
-    for version in componentVersions:
-        if len(version) and version[0].isalpha():
-            componentVersions.remove(version)
-            componentVersions.insert(insertLocation , version)
-            insertLocation +=1
+    # Are there any versions?
+    if not versionIndex:
+        return componentVersionDetails
 
-    totalNumberVersions = len(componentVersions)
+    totalNumberVersions = versionIndex["totalNumberVersions"]
 
     if totalNumberVersions > 0:
         # There is at least one version available
-        try:
-            selectedVersionIndex = componentVersions.index(componentVersionName)
+        if componentVersionName in versionIndex["versionRank"]:
+            selectedVersionIndex = versionIndex["versionRank"][componentVersionName]
             numberVersionsBack = totalNumberVersions-selectedVersionIndex - 1 # How far back from most recent release
-        except:
+        else:
             logger.error("    versionName %s is not a valid version for the component with ID %s" %(componentVersionName, componentID))
             numberVersionsBack = -1
     
-        componentVersionDetails["latestVersion"] = componentVersions[-1]
+        componentVersionDetails["latestVersion"] = versionIndex["latestVersion"]
         componentVersionDetails["numberVersionsBack"] = numberVersionsBack
 
     else:
@@ -464,6 +702,122 @@ def getVersionDetails(componentVersionName, componentID, baseURL, authToken):
 
     return componentVersionDetails
 
+#----------------------------------------------------------------------------------------#
+def create_component_version_index(componentID, baseURL, authToken, reportCache, versionAnalysisPolicy):
+    logger.debug("Entering create_component_version_index for component ID %s" %componentID)
+
+    versionIndex = {}
+    maxComponentVersions = versionAnalysisPolicy["maxComponentVersions"]
+
+    # Is this a component that is known to be too large to bother with?
+    if is_version_analysis_skipped(componentID, baseURL, reportCache, versionAnalysisPolicy):
+        versionIndex["versionNotAnalyzed"] = True
+        return versionIndex
+
+    # Has this list been fetched by an earlier report run?
+    versionNames = report_cache.get_component_versions(reportCache, baseURL, componentID)
+
+    if versionNames is None:
+        fetchStartTime = time.time()
+        try:
+            versionDetails = report_session.call_api("Component versions for %s" %componentID, common.api.component.get_component_details.get_component_details_v3_summary, baseURL, componentID, authToken, requestType="componentVersions")
+        except:
+            logger.error("    No Component Details Returned for component ID %s!" %componentID)
+            versionIndex["versionNotAnalyzed"] = True
+            return versionIndex
+        fetchSeconds = time.time() - fetchStartTime
+
+        versionNames = [version["name"] for version in versionDetails["data"]["versionList"]]
+
+        # Record the version count so later runs can skip a component over the limit without fetching it.
+        # The fetch time is only kept for the slowest fetches logged at the end of the run
+        versionAnalysisPolicy["fetchTimes"][componentID] = (fetchSeconds, len(versionNames))
+        report_cache.store_component_statistics(reportCache, baseURL, componentID, len(versionNames), fetchSeconds)
+
+        # A list over the limit is never analyzed so there is no point keeping it
+        if not maxComponentVersions or len(versionNames) <= maxComponentVersions:
+            report_cache.store_component_versions(reportCache, baseURL, componentID, versionNames)
+
+    if maxComponentVersions and len(versionNames) > maxComponentVersions:
+        logger.debug("        Component ID %s has %s versions so skipping version analysis" %(componentID, len(versionNames)))
+        versionIndex["versionNotAnalyzed"] = True
+        return versionIndex
+
+    # Are there any versions?
+    if not len(versionNames):
+        return versionIndex
+
+    componentVersions = [] # To hold just the version names that can be processed
+    ignoreVersions = ["unknown", "custom", "any version", "sample"]
+
+    # Extract just the version names for comparison purposes
+    for versionName in versionNames:
+
+        if versionName.lower() not in ignoreVersions:
+            componentVersions.append(versionName)
+        else:
+            logger.warning("        The version %s is contained in the ingnoreVersions list" %versionName)
+
+    # Sort naturally but in case there is a combination of version types 1.2 vs snapshot etc
+    # put the ones starting with text at the begining of the list
+    componentVersions.sort(key=report_versions.version_rank_key)
+
+    # Map each version name to its position so any inventory item can be looked up directly.
+    # Keep the first position if a name is listed more than once
+    versionRank = {}
+    for position, versionName in enumerate(componentVersions):
+        versionRank.setdefault(versionName, position)
+
+    versionIndex["versionRank"] = versionRank
+    versionIndex["totalNumberVersions"] = len(componentVersions)
+    if componentVersions:
+        versionIndex["latestVersion"] = componentVersions[-1]
+
+    return versionIndex
+
+#----------------------------------------------------------------------------------------#
+def is_version_analysis_skipped(componentID, baseURL, reportCache, versionAnalysisPolicy):
+
+    if componentID in versionAnalysisPolicy["skipList"]:
+        logger.debug("        %s is in the skip list so skipping version analysis" %versionAnalysisPolicy["skipList"][componentID])
+        return True
+
+    # Did an earlier run find this component had too many versions?
+    maxComponentVersions = versionAnalysisPolicy["maxComponentVersions"]
+    componentStatistics = report_cache.get_component_statistics(reportCache, baseURL, componentID)
+
+    if maxComponentVersions and componentStatistics and componentStatistics["versionCount"] > maxComponentVersions:
+        logger.debug("        Component ID %s had %s versions when last fetched so skipping version analysis" %(componentID, componentStatistics["versionCount"]))
+        return True
+
+    return False
+
+#----------------------------------------------------------------------------------------#
+def load_version_analysis_skip_list():
+
+    # Components listed here are never analyzed since the API call for their versions takes too long
+    skipListFile = os.path.join(os.path.dirname(os.path.realpath(__file__)), "version_analysis_skip_list.json")
+
+    try:
+        with open(skipListFile, "r") as file_ptr:
+            skipList = json.load(file_ptr)
+    except:
+        logger.warning("Unable to load version analysis skip list %s" %skipListFile)
+        skipList = {}
+
+    return skipList
+
+#----------------------------------------------------------------------------------------#
+def log_slowest_component_fetches(versionAnalysisPolicy):
+
+    fetchTimes = versionAnalysisPolicy["fetchTimes"]
+
+    # Report the most expensive components so they can be added to the skip list if needed
+    logger.info("Slowest component version fetches:")
+    for componentID in sorted(fetchTimes, key=lambda componentID: fetchTimes[componentID][0], reverse=True)[:10]:
+        fetchSeconds, versionCount = fetchTimes[componentID]
+        logger.info("    Component ID %s - %s versions in %.2f seconds" %(componentID, versionCount, fetchSeconds))
+
 #----------------------------------------------------------------------------------------#
 def roll_up_project_review_level(projectHierarchy, projectReviewStatus, recursionLevel):
     recursionIndent = recursionLevel * " "
@@ -503,16 +857,3 @@ def roll_up_project_review_level(projectHierarchy, projectReviewStatus, recursio
     logger.debug("%s %s - Final project review status: %s" %(recursionIndent, parentProjectName, parentProjectReviewStatus))
     
     return projectReviewStatus
-
-#-----------------------------
-#  These two functions are used for naturally sorting the version names
-#  which was pulled from the web
-#  https://www.tutorialspoint.com/How-to-correctly-sort-a-string-with-a-number-inside-in-Python
-
-def atoi(text):
-    return int(text) if text.isdigit() else text
-
-def natural_sort(text):
-    return [ atoi(c) for c in re.split('(\d+)',text) ]
-
-    
\ No newline at end of file
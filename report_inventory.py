@@ -0,0 +1,200 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_inventory.py
+'''
+import logging
+import sys
+import enum
+
+logger = logging.getLogger(__name__)
+
+#----------------------------------------------------------------------------------------#
+class ComplianceIssue(enum.IntEnum):
+    ITEM_REJECTED = 0
+    ITEM_NOT_REVIEWED = 1
+    SECURITY_VULNERABILITIES = 2
+    P1_LICENSE = 3
+    UNKNOWN_VERSION = 4
+    VERSION_NOT_ANALYZED = 5
+    OLD_VERSION = 6
+    INVALID_VERSION = 7
+    UNSPECIFIED_LICENSE = 8
+
+# The title and message for each compliance issue.  Messages are only built when the row is written
+complianceIssueDetails = {
+    ComplianceIssue.ITEM_REJECTED : ("Item rejected", "This item has been rejected for use. Please consult with your legal and/or security team for further guidance."),
+    ComplianceIssue.ITEM_NOT_REVIEWED : ("Item not reviewed", "This item has not been reviewed for use. Please consult with your legal and/or security team for further guidance."),
+    ComplianceIssue.SECURITY_VULNERABILITIES : ("Security vulnerabilities", "This item has associated security vulnerabilites. Please consult with your security team for further guidance."),
+    ComplianceIssue.P1_LICENSE : ("P1 license", "This item has a viral or strong copyleft license. Depnding on your usage there may be additional oblilgations. Please consult with your legal team.."),
+    ComplianceIssue.UNKNOWN_VERSION : ("Unknown version", "This item has an unknown version. Additional analysis is recommended."),
+    ComplianceIssue.VERSION_NOT_ANALYZED : ("Version not analyzed", "This versions for this component have not beeen analyzed. Manual inspection is suggested"),
+    ComplianceIssue.OLD_VERSION : ("Old version", "The latest version is %(latestVersion)s. Your version is %(numberVersionsBack)s versions back from the latest version. You should consider upgrading to a more recent version of this component."),
+    ComplianceIssue.INVALID_VERSION : ("Invalid Version", "%(componentVersionName)s is not a valid version for the current component."),
+    ComplianceIssue.UNSPECIFIED_LICENSE : ("Unspecified license", "This item has does not have a license associated with it. Additional analysis is recommended."),
+}
+
+#----------------------------------------------------------------------------------------#
+class InventoryRecord:
+    # Slots rather than a dict per item since large hierarchies hold a very large number of these
+    __slots__ = ("projectName", "projectLink", "inventoryItemName", "componentName", "componentVersionName", "componentUrl",
+                 "selectedLicenseName", "selectedLicenseUrl", "inventoryPriority", "inventoryReviewStatus",
+                 "vulnerabilityCounts", "complianceIssues", "latestVersion", "numberVersionsBack")
+
+#----------------------------------------------------------------------------------------#
+def create_inventory_store():
+    inventoryStore = {}
+    inventoryStore["records"] = {}  # InventoryRecord for each inventoryID
+    inventoryStore["sharedValues"] = {}  # Tuples that repeat across many items are shared
+    return inventoryStore
+
+#----------------------------------------------------------------------------------------#
+def add_inventory_item(inventoryStore, inventoryID, inventoryItem):
+    # inventoryItem holds the values for the record along with its vulnerabilityData and
+    # list of complianceIssues, the version details are only needed for old versions
+    sharedValues = inventoryStore["sharedValues"]
+    vulnerabilityData = inventoryItem["vulnerabilityData"]
+
+    inventoryRecord = InventoryRecord()
+
+    # Names, links and states repeat across inventory items so keep a single copy of each
+    inventoryRecord.projectName = intern_value(inventoryItem["projectName"])
+    inventoryRecord.projectLink = intern_value(inventoryItem["projectLink"])
+    inventoryRecord.inventoryItemName = inventoryItem["inventoryItemName"]
+    inventoryRecord.componentName = intern_value(inventoryItem["componentName"])
+    inventoryRecord.componentVersionName = intern_value(inventoryItem["componentVersionName"])
+    inventoryRecord.componentUrl = intern_value(inventoryItem["componentUrl"])
+    inventoryRecord.selectedLicenseName = intern_value(inventoryItem["selectedLicenseName"])
+    inventoryRecord.selectedLicenseUrl = intern_value(inventoryItem["selectedLicenseUrl"])
+    inventoryRecord.inventoryPriority = intern_value(inventoryItem["inventoryPriority"])
+    inventoryRecord.inventoryReviewStatus = intern_value(inventoryItem["inventoryReviewStatus"])
+
+    # Critical is None for CVSS v2 data which does not have that severity
+    vulnerabilityCounts = (vulnerabilityData["numTotalVulnerabilities"], vulnerabilityData.get("numCriticalVulnerabilities"),
+                            vulnerabilityData["numHighVulnerabilities"], vulnerabilityData["numMediumVulnerabilities"],
+                            vulnerabilityData["numLowVulnerabilities"], vulnerabilityData["numNoneVulnerabilities"])
+    inventoryRecord.vulnerabilityCounts = sharedValues.setdefault(vulnerabilityCounts, vulnerabilityCounts)
+
+    complianceIssues = tuple(inventoryItem["complianceIssues"])
+    inventoryRecord.complianceIssues = sharedValues.setdefault(complianceIssues, complianceIssues)
+
+    inventoryRecord.latestVersion = inventoryItem.get("latestVersion")
+    inventoryRecord.numberVersionsBack = inventoryItem.get("numberVersionsBack")
+
+    inventoryStore["records"][inventoryID] = inventoryRecord
+
+#----------------------------------------------------------------------------------------#
+def get_record_values(inventoryStore, inventoryID):
+    # The record as a list of JSON safe values, in __slots__ order, to keep between report runs
+    inventoryRecord = inventoryStore["records"][inventoryID]
+    recordValues = [getattr(inventoryRecord, fieldName) for fieldName in InventoryRecord.__slots__]
+    recordValues[InventoryRecord.__slots__.index("complianceIssues")] = [int(complianceIssue) for complianceIssue in inventoryRecord.complianceIssues]
+    return recordValues
+
+#----------------------------------------------------------------------------------------#
+def add_inventory_record(inventoryStore, inventoryID, recordValues):
+    # Restore a record from get_record_values, sharing its values as add_inventory_item does
+    sharedValues = inventoryStore["sharedValues"]
+
+    inventoryRecord = InventoryRecord()
+    for fieldName, fieldValue in zip(InventoryRecord.__slots__, recordValues):
+        setattr(inventoryRecord, fieldName, intern_value(fieldValue))
+
+    vulnerabilityCounts = tuple(inventoryRecord.vulnerabilityCounts)
+    inventoryRecord.vulnerabilityCounts = sharedValues.setdefault(vulnerabilityCounts, vulnerabilityCounts)
+
+    complianceIssues = tuple(ComplianceIssue(complianceIssue) for complianceIssue in inventoryRecord.complianceIssues)
+    inventoryRecord.complianceIssues = sharedValues.setdefault(complianceIssues, complianceIssues)
+
+    inventoryStore["records"][inventoryID] = inventoryRecord
+
+#----------------------------------------------------------------------------------------#
+def intern_value(value):
+    # Values from the API are not always strings (a missing url is None)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+#----------------------------------------------------------------------------------------#
+def get_inventory_count(inventoryStore):
+    return len(inventoryStore["records"])
+
+#----------------------------------------------------------------------------------------#
+def get_compliance_issues(inventoryRecord):
+    # Expand the compliance codes to the title and message text shown in the reports
+    complianceIssues = {}
+
+    for complianceIssue in inventoryRecord.complianceIssues:
+        issueTitle, issueMessage = complianceIssueDetails[complianceIssue]
+        if complianceIssue in (ComplianceIssue.OLD_VERSION, ComplianceIssue.INVALID_VERSION):
+            issueMessage = issueMessage %{"latestVersion" : inventoryRecord.latestVersion, "numberVersionsBack" : inventoryRecord.numberVersionsBack,
+                                            "componentVersionName" : inventoryRecord.componentVersionName}
+        complianceIssues[issueTitle] = issueMessage
+
+    return complianceIssues
+
+#----------------------------------------------------------------------------------------#
+def iter_inventory_rows(inventoryStore):
+    # Shared by the report artifacts to walk the inventory in inventoryID order.  Each row is
+    # built as it is needed so only one expanded item exists at a time
+    records = inventoryStore["records"]
+
+    for inventoryID in sorted(records):
+        inventoryRecord = records[inventoryID]
+        numTotalVulnerabilities, numCriticalVulnerabilities, numHighVulnerabilities, numMediumVulnerabilities, numLowVulnerabilities, numNoneVulnerabilities = inventoryRecord.vulnerabilityCounts
+
+        vulnerabilityData = {}
+        vulnerabilityData["numTotalVulnerabilities"] = numTotalVulnerabilities
+        if numCriticalVulnerabilities is not None:
+            vulnerabilityData["numCriticalVulnerabilities"] = numCriticalVulnerabilities
+        vulnerabilityData["numHighVulnerabilities"] = numHighVulnerabilities
+        vulnerabilityData["numMediumVulnerabilities"] = numMediumVulnerabilities
+        vulnerabilityData["numLowVulnerabilities"] = numLowVulnerabilities
+        vulnerabilityData["numNoneVulnerabilities"] = numNoneVulnerabilities
+
+        yield {
+            "inventoryID" : inventoryID,
+            "projectName" : inventoryRecord.projectName,
+            "inventoryItemName" : inventoryRecord.inventoryItemName,
+            "componentName" : inventoryRecord.componentName,
+            "componentVersionName" : inventoryRecord.componentVersionName,
+            "selectedLicenseName" : inventoryRecord.selectedLicenseName,
+            "vulnerabilityData" : vulnerabilityData,
+            "inventoryPriority" : inventoryRecord.inventoryPriority,
+            "componentUrl" : inventoryRecord.componentUrl,
+            "selectedLicenseUrl" : inventoryRecord.selectedLicenseUrl,
+            "inventoryReviewStatus" : inventoryRecord.inventoryReviewStatus,
+            "inventoryLink" : inventoryRecord.projectLink + "&pinv=" + str(inventoryID),
+            "projectLink" : inventoryRecord.projectLink,
+            "complianceIssues" : get_compliance_issues(inventoryRecord)
+        }
+
+#----------------------------------------------------------------------------------------#
+# Column names for the machine readable exports.  Downstream tools depend on these so only ever add to the end
+exportColumns = ["inventoryID", "projectName", "inventoryItemName", "inventoryPriority", "componentName", "componentVersionName", "componentUrl",
+                    "selectedLicenseName", "selectedLicenseUrl", "numTotalVulnerabilities", "numCriticalVulnerabilities", "numHighVulnerabilities",
+                    "numMediumVulnerabilities", "numLowVulnerabilities", "numNoneVulnerabilities", "inventoryReviewStatus", "complianceIssues",
+                    "inventoryLink", "projectLink"]
+
+#----------------------------------------------------------------------------------------#
+def iter_export_rows(inventoryStore):
+    # Same items and order as the report tables but with the counts as numbers and the
+    # compliance issues as their codes (OLD_VERSION etc) rather than the display text
+    records = inventoryStore["records"]
+
+    for inventoryID in sorted(records):
+        inventoryRecord = records[inventoryID]
+
+        exportRow = [inventoryID, inventoryRecord.projectName, inventoryRecord.inventoryItemName, inventoryRecord.inventoryPriority,
+                        inventoryRecord.componentName, inventoryRecord.componentVersionName, inventoryRecord.componentUrl,
+                        inventoryRecord.selectedLicenseName, inventoryRecord.selectedLicenseUrl]
+        exportRow.extend(inventoryRecord.vulnerabilityCounts)  # Critical is None for CVSS v2
+        exportRow.append(inventoryRecord.inventoryReviewStatus)
+        exportRow.append([complianceIssue.name for complianceIssue in inventoryRecord.complianceIssues])
+        exportRow.append(inventoryRecord.projectLink + "&pinv=" + str(inventoryID))
+        exportRow.append(inventoryRecord.projectLink)
+
+        yield exportRow
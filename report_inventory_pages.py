@@ -0,0 +1,163 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_inventory_pages.py
+'''
+import logging
+import concurrent.futures
+
+import report_session
+
+logger = logging.getLogger(__name__)
+
+# The inventory summary is read a page at a time straight from the REST API rather than through
+# common.api.project.get_inventory_summary, which reads every page before returning any of them.
+# The request is the one that module makes:
+#
+#   GET {baseURL}/codeinsight/api/projects/{projectID}/inventorySummary
+#       offset                page to return, starting at 1
+#       vulnerabilitySummary  true, include the vulnerability counts of each item
+#       cvssVersion           3.0 or 2.0, the CVSS version the counts are for
+#       published             true, only published inventory items
+#
+# The items are in "data" and the page count in the Number-of-pages response header.  The page
+# size is left to the server, as the common module does
+inventorySummaryEndpoint = "/codeinsight/api/projects/%s/inventorySummary"
+inventorySummaryOptions = {
+    "3.x" : {"vulnerabilitySummary" : "true", "cvssVersion" : "3.0", "published" : "true"},
+    "2.0" : {"vulnerabilitySummary" : "true", "cvssVersion" : "2.0", "published" : "true"},
+}
+
+#------------------------------------------------------------------#
+def get_inventory_summary_page(baseURL, projectID, authToken, cvssVersion, pageNumber):
+
+    RESTAPI_URL = baseURL + inventorySummaryEndpoint %projectID
+    headers = {'Content-Type': 'application/json', 'Authorization': 'Bearer ' + authToken}
+    queryParameters = {"offset" : pageNumber}
+    queryParameters.update(inventorySummaryOptions[cvssVersion])
+
+    response = report_session.get_session().get(RESTAPI_URL, headers=headers, params=queryParameters)
+    response.raise_for_status()
+
+    inventoryPage = response.json()["data"]
+
+    # Without the summary every item would be reported with no vulnerabilities
+    if inventoryPage and not any("vulnerabilitySummary" in inventoryItem for inventoryItem in inventoryPage):
+        logger.error("    Inventory summary page %s for project %s has no vulnerability data" %(pageNumber, projectID))
+
+    return inventoryPage, int(response.headers.get("Number-of-pages", 1))
+
+#------------------------------------------------------------------#
+def open_inventory_stream(baseURL, projectList, authToken, cvssVersion, maxPrefetch):
+    logger.info("Entering open_inventory_stream")
+
+    # Pages of every project in projectList order, only the prefetched pages are held at any time
+    inventoryStream = {}
+    inventoryStream["pages"] = iter_inventory_pages(baseURL, projectList, authToken, cvssVersion, maxPrefetch)
+    inventoryStream["nextPage"] = None  # Page read from the stream that belongs to a later project
+
+    return inventoryStream
+
+#------------------------------------------------------------------#
+def iter_project_inventory(inventoryStream, project, pageHandler):
+    # Items of one project, read a page at a time.  pageHandler sees each page before its items
+    # are returned (to look up its licenses).  Projects have to be read in the order they were
+    # given to the stream
+    while True:
+        if inventoryStream["nextPage"] is None:
+            inventoryStream["nextPage"] = next(inventoryStream["pages"], (None, None))
+
+        pageProject, inventoryPage = inventoryStream["nextPage"]
+        if pageProject is not project:
+            return
+
+        inventoryStream["nextPage"] = None
+        pageHandler(inventoryPage)
+        yield from inventoryPage
+
+#------------------------------------------------------------------#
+def iter_inventory_pages(baseURL, projectList, authToken, cvssVersion, maxPrefetch):
+
+    # Page requests that have been made but not yet returned to the caller, (projectIndex, pageNumber) : future
+    pageStream = {"baseURL" : baseURL, "projectList" : projectList, "authToken" : authToken,
+                    "cvssVersion" : cvssVersion, "maxPrefetch" : maxPrefetch, "pageRequests" : {}, "numberOfPages" : {}}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=maxPrefetch) as executor:
+        pageStream["executor"] = executor
+
+        for projectIndex, project in enumerate(projectList):
+            pageNumber = 1
+
+            while pageNumber <= pageStream["numberOfPages"].get(projectIndex, 1):
+                request_pages(pageStream, projectIndex, pageNumber)
+
+                pageRequest = pageStream["pageRequests"].pop((projectIndex, pageNumber), None)
+
+                try:
+                    if pageRequest is None:
+                        # The window is full of later projects' first pages, read this one here rather than
+                        # queue it behind them
+                        inventoryPage, numberOfPages = get_page(pageStream, projectIndex, pageNumber)
+                    else:
+                        inventoryPage, numberOfPages = pageRequest.result()
+                except Exception:
+                    logger.error("    No Inventory Summary Returned for %s (page %s)!" %(project["projectName"], pageNumber))
+                    print("No Inventory Summary Returned for %s." %project["projectName"])
+                    project["projectDegraded"] = True
+                    drop_page_requests(pageStream, projectIndex)
+                    break
+
+                pageStream["numberOfPages"][projectIndex] = numberOfPages
+                logger.debug("    Inventory page %s of %s for %s" %(pageNumber, numberOfPages, project["projectName"]))
+
+                yield project, inventoryPage
+                pageNumber += 1
+
+#------------------------------------------------------------------#
+def request_pages(pageStream, currentProjectIndex, currentPageNumber):
+    # Fill the prefetch window with the pages that will be needed next, in the order they are
+    # needed.  Until the first page of a project arrives its page count is unknown, so the window
+    # moves on to the first page of the projects after it
+    pageRequests = pageStream["pageRequests"]
+    numberOfPages = pageStream["numberOfPages"]
+
+    for projectIndex in range(currentProjectIndex, len(pageStream["projectList"])):
+        if len(pageRequests) >= pageStream["maxPrefetch"]:
+            return
+
+        firstPageRequest = pageRequests.get((projectIndex, 1))
+        if projectIndex not in numberOfPages:
+            if firstPageRequest is None:
+                submit_page_request(pageStream, projectIndex, 1)
+                continue
+            if not firstPageRequest.done() or firstPageRequest.exception() is not None:
+                continue
+            numberOfPages[projectIndex] = firstPageRequest.result()[1]
+
+        # Pages of the current project before the one being read have already been returned
+        firstPageNumber = max(2, currentPageNumber) if projectIndex == currentProjectIndex else 2
+        for pageNumber in range(firstPageNumber, numberOfPages[projectIndex] + 1):
+            if len(pageRequests) >= pageStream["maxPrefetch"]:
+                return
+            if (projectIndex, pageNumber) not in pageRequests:
+                submit_page_request(pageStream, projectIndex, pageNumber)
+
+#------------------------------------------------------------------#
+def submit_page_request(pageStream, projectIndex, pageNumber):
+    pageStream["pageRequests"][(projectIndex, pageNumber)] = pageStream["executor"].submit(get_page, pageStream, projectIndex, pageNumber)
+
+#------------------------------------------------------------------#
+def get_page(pageStream, projectIndex, pageNumber):
+    project = pageStream["projectList"][projectIndex]
+
+    return report_session.call_api("Inventory summary page %s for %s" %(pageNumber, project["projectName"]), get_inventory_summary_page, pageStream["baseURL"], project["projectID"],
+                                    pageStream["authToken"], pageStream["cvssVersion"], pageNumber, requestType="inventory")
+
+#------------------------------------------------------------------#
+def drop_page_requests(pageStream, projectIndex):
+    # A project with a missing page is reported as degraded so the rest of its pages aren't needed
+    for pageKey in [pageKey for pageKey in pageStream["pageRequests"] if pageKey[0] == projectIndex]:
+        pageStream["pageRequests"].pop(pageKey).cancel()
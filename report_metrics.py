@@ -0,0 +1,128 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_metrics.py
+'''
+import logging
+import json
+import time
+import threading
+import contextlib
+
+logger = logging.getLogger(__name__)
+
+# Upper bound in seconds of each latency bucket, anything slower lands in a final overflow bucket
+latencyBuckets = [0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300]
+
+# Timings for each phase of the report and each API call along with byte counts for the run
+reportMetrics = {"phases" : {}, "apiCalls" : {}, "bytes" : {}}
+metricsLock = threading.Lock()  # API calls are recorded from several threads at once
+
+#------------------------------------------------------------------#
+def record_timing(section, name, elapsedSeconds, failed=False):
+
+    bucket = 0
+    while bucket < len(latencyBuckets) and elapsedSeconds > latencyBuckets[bucket]:
+        bucket += 1
+
+    with metricsLock:
+        timing = reportMetrics[section].get(name)
+        if timing is None:
+            timing = {"count" : 0, "failures" : 0, "totalSeconds" : 0.0, "maxSeconds" : 0.0, "latencyHistogram" : [0] * (len(latencyBuckets) + 1)}
+            reportMetrics[section][name] = timing
+
+        timing["count"] += 1
+        timing["totalSeconds"] += elapsedSeconds
+        timing["maxSeconds"] = max(timing["maxSeconds"], elapsedSeconds)
+        timing["latencyHistogram"][bucket] += 1
+        if failed:
+            timing["failures"] += 1
+
+#------------------------------------------------------------------#
+@contextlib.contextmanager
+def phase_timer(phaseName):
+    # Time a block of the report, a phase entered more than once (per item work) is accumulated
+    startTime = time.perf_counter()
+    failed = True
+    try:
+        yield
+        failed = False
+    finally:
+        record_timing("phases", phaseName, time.perf_counter() - startTime, failed)
+
+#------------------------------------------------------------------#
+def record_phase(phaseName, elapsedSeconds):
+    # For phases timed elsewhere such as within a worker process
+    record_timing("phases", phaseName, elapsedSeconds)
+
+#------------------------------------------------------------------#
+def call_timed(apiName, apiFunction, *args):
+    # Make a single API call recording how long it took and whether it failed
+    startTime = time.perf_counter()
+    try:
+        result = apiFunction(*args)
+    except Exception:
+        record_timing("apiCalls", apiName, time.perf_counter() - startTime, failed=True)
+        raise
+
+    record_timing("apiCalls", apiName, time.perf_counter() - startTime)
+    return result
+
+#------------------------------------------------------------------#
+def add_bytes(name, numBytes):
+    with metricsLock:
+        reportMetrics["bytes"][name] = reportMetrics["bytes"].get(name, 0) + numBytes
+
+#------------------------------------------------------------------#
+def get_histogram_labels():
+    histogramLabels = ["<=%ss" %bucketLimit for bucketLimit in latencyBuckets]
+    histogramLabels.append(">%ss" %latencyBuckets[-1])
+    return histogramLabels
+
+#------------------------------------------------------------------#
+def write_metrics_file(metricsFileName):
+    logger.info("Entering write_metrics_file")
+
+    histogramLabels = get_histogram_labels()
+    metricsData = {"phases" : {}, "apiCalls" : {}, "bytes" : {}}
+
+    with metricsLock:
+        for section in ["phases", "apiCalls"]:
+            for name, timing in reportMetrics[section].items():
+                timingData = dict(timing)
+                timingData["totalSeconds"] = round(timing["totalSeconds"], 6)
+                timingData["maxSeconds"] = round(timing["maxSeconds"], 6)
+                timingData["averageSeconds"] = round(timing["totalSeconds"] / timing["count"], 6)
+                timingData["latencyHistogram"] = dict(zip(histogramLabels, timing["latencyHistogram"]))
+                metricsData[section][name] = timingData
+        metricsData["bytes"] = dict(reportMetrics["bytes"])
+
+    try:
+        with open(metricsFileName, "w") as metricsFile:
+            json.dump(metricsData, metricsFile, indent=4)
+        logger.info("    Metrics written to %s" %metricsFileName)
+    except OSError as error:
+        logger.error("    Unable to write metrics file %s: %s" %(metricsFileName, error))
+
+#------------------------------------------------------------------#
+def get_metrics_summary():
+    # Short lines for the end of the run, the metrics file has the full detail
+    summaryLines = []
+
+    with metricsLock:
+        for phaseName, timing in reportMetrics["phases"].items():
+            if timing["count"] == 1:
+                summaryLines.append("%s: %.2f seconds" %(phaseName, timing["totalSeconds"]))
+            else:
+                summaryLines.append("%s: %.2f seconds over %s calls" %(phaseName, timing["totalSeconds"], timing["count"]))
+
+        for apiName, timing in sorted(reportMetrics["apiCalls"].items(), key=lambda apiCall: apiCall[1]["totalSeconds"], reverse=True):
+            summaryLines.append("API %s: %s calls (%s failed), %.3f seconds average, %.3f seconds max" %(apiName, timing["count"], timing["failures"], timing["totalSeconds"] / timing["count"], timing["maxSeconds"]))
+
+        for name, numBytes in reportMetrics["bytes"].items():
+            summaryLines.append("%s: %s bytes" %(name, numBytes))
+
+    return summaryLines
@@ -0,0 +1,174 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_scheduler.py
+'''
+import logging
+import time
+import heapq
+import itertools
+import threading
+import contextlib
+
+import report_metrics
+
+logger = logging.getLogger(__name__)
+
+# Waiting calls are started lowest value first so the calls that everything else depends on go first
+requestPriority = {"hierarchy" : 0, "project" : 1, "inventory" : 1, "license" : 2, "componentVersions" : 3}
+
+latencySmoothing = 0.2        # Weight of the newest call in the average latency for each request type
+latencyBackoffFactor = 2.0    # Back off once the average latency is this many times the best seen
+latencyBackoffMinimum = 0.05  # and at least this many seconds more, small calls vary too much otherwise
+latencyWarmupCalls = 5        # Calls of a request type before its latency is used to back off
+baselineDrift = 0.01          # How quickly a lasting slow down becomes the new normal latency
+
+# The Code Insight server is shared with scanners and users so every report API call waits for a
+# slot here.  Starts with no rate limit and no cap until configure_scheduler is called
+schedulerState = {"ratePerSecond" : 0, "tokens" : 0.0, "lastRefill" : 0.0, "maxInFlight" : None, "inFlightLimit" : None,
+                    "inFlight" : 0, "lastBackoff" : 0.0, "waiting" : [], "latency" : {}}
+schedulerCondition = threading.Condition()
+requestSequence = itertools.count()  # Keeps calls of the same priority in arrival order
+
+#------------------------------------------------------------------#
+def configure_scheduler(maxRequestsPerSecond, maxInFlight):
+    logger.info("Entering configure_scheduler")
+
+    with schedulerCondition:
+        schedulerState["ratePerSecond"] = maxRequestsPerSecond
+        schedulerState["tokens"] = float(max(maxRequestsPerSecond, 1))  # Allow one second's worth at the start
+        schedulerState["lastRefill"] = time.monotonic()
+        schedulerState["maxInFlight"] = maxInFlight
+        schedulerState["inFlightLimit"] = float(maxInFlight)
+        schedulerCondition.notify_all()
+
+    if maxRequestsPerSecond:
+        logger.info("    API calls limited to %s per second with at most %s in flight" %(maxRequestsPerSecond, maxInFlight))
+    else:
+        logger.info("    API calls are not rate limited, at most %s in flight" %maxInFlight)
+
+#------------------------------------------------------------------#
+@contextlib.contextmanager
+def request_slot(requestType):
+    # Hold a slot for a single API call attempt
+    acquire_slot(requestType)
+
+    startTime = time.perf_counter()
+    failed = True
+    try:
+        yield
+        failed = False
+    finally:
+        release_slot(requestType, time.perf_counter() - startTime, failed)
+
+#------------------------------------------------------------------#
+def acquire_slot(requestType):
+
+    waitStartTime = time.perf_counter()
+    requestTicket = (requestPriority.get(requestType, 1), next(requestSequence))
+
+    with schedulerCondition:
+        waiting = schedulerState["waiting"]
+        heapq.heappush(waiting, requestTicket)
+
+        # Only the highest priority waiting call may start, once there is room and a token for it
+        while True:
+            if waiting[0] == requestTicket and has_free_slot():
+                tokenWaitSeconds = take_token()
+                if not tokenWaitSeconds:
+                    break
+                schedulerCondition.wait(tokenWaitSeconds)
+            else:
+                schedulerCondition.wait()
+
+        heapq.heappop(waiting)
+        schedulerState["inFlight"] += 1
+
+        # The next call in line may also be able to start
+        schedulerCondition.notify_all()
+
+    report_metrics.record_timing("phases", "Waiting for an API slot", time.perf_counter() - waitStartTime)
+
+#------------------------------------------------------------------#
+def has_free_slot():
+    inFlightLimit = schedulerState["inFlightLimit"]
+    return inFlightLimit is None or schedulerState["inFlight"] < int(inFlightLimit)
+
+#------------------------------------------------------------------#
+def take_token():
+    # Token bucket refilled at the configured rate, returns how long until a token is available
+    ratePerSecond = schedulerState["ratePerSecond"]
+    if not ratePerSecond:
+        return 0
+
+    currentTime = time.monotonic()
+    schedulerState["tokens"] = min(float(max(ratePerSecond, 1)), schedulerState["tokens"] + (currentTime - schedulerState["lastRefill"]) * ratePerSecond)
+    schedulerState["lastRefill"] = currentTime
+
+    if schedulerState["tokens"] >= 1:
+        schedulerState["tokens"] -= 1
+        return 0
+
+    return (1 - schedulerState["tokens"]) / ratePerSecond
+
+#------------------------------------------------------------------#
+def release_slot(requestType, elapsedSeconds, failed):
+
+    with schedulerCondition:
+        schedulerState["inFlight"] -= 1
+
+        latencyRising = update_latency(requestType, elapsedSeconds)
+
+        if schedulerState["inFlightLimit"] is not None:
+            adjust_in_flight_limit(requestType, failed or latencyRising)
+
+        schedulerCondition.notify_all()
+
+#------------------------------------------------------------------#
+def update_latency(requestType, elapsedSeconds):
+    # Track a smoothed latency for each request type along with the best seen, inventory calls
+    # are naturally much slower than license calls so they can't share a baseline
+    latency = schedulerState["latency"].setdefault(requestType, {"calls" : 0, "average" : elapsedSeconds, "baseline" : None})
+
+    latency["calls"] += 1
+    latency["average"] += latencySmoothing * (elapsedSeconds - latency["average"])
+
+    if latency["calls"] < latencyWarmupCalls:
+        return False
+
+    if latency["baseline"] is None or latency["average"] < latency["baseline"]:
+        latency["baseline"] = latency["average"]
+    else:
+        latency["baseline"] += baselineDrift * (latency["average"] - latency["baseline"])
+
+    return latency["average"] > max(latency["baseline"] * latencyBackoffFactor, latency["baseline"] + latencyBackoffMinimum)
+
+#------------------------------------------------------------------#
+def adjust_in_flight_limit(requestType, backOff):
+    # Additive increase, multiplicative decrease: halve the calls in flight when the server is
+    # failing or slowing down then open back up one call at a time while it keeps up
+    currentTime = time.monotonic()
+    inFlightLimit = schedulerState["inFlightLimit"]
+
+    if backOff:
+        # The calls already in flight when the server slowed down all report it, only back off once for them
+        recentLatency = schedulerState["latency"][requestType]["average"]
+        if inFlightLimit > 1 and currentTime - schedulerState["lastBackoff"] > recentLatency:
+            schedulerState["inFlightLimit"] = max(1.0, inFlightLimit / 2)
+            schedulerState["lastBackoff"] = currentTime
+            logger.warning("    API calls slowing down or failing, now allowing %s in flight" %int(schedulerState["inFlightLimit"]))
+    elif inFlightLimit < schedulerState["maxInFlight"]:
+        schedulerState["inFlightLimit"] = min(float(schedulerState["maxInFlight"]), inFlightLimit + 1.0 / inFlightLimit)
+
+#------------------------------------------------------------------#
+def log_scheduler_statistics():
+    with schedulerCondition:
+        inFlightLimit = schedulerState["inFlightLimit"]
+        for requestType, latency in schedulerState["latency"].items():
+            logger.info("API scheduler: %s %s calls, average latency %.3f seconds (baseline %.3f)" %(latency["calls"], requestType, latency["average"], latency["baseline"] or latency["average"]))
+
+    if inFlightLimit is not None:
+        logger.info("API scheduler: finished allowing %s of %s calls in flight" %(int(inFlightLimit), schedulerState["maxInFlight"]))
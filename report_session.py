@@ -0,0 +1,192 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_session.py
+'''
+import logging
+import sys
+import time
+import random
+import threading
+
+import requests
+import requests.api
+from requests.adapters import HTTPAdapter
+
+import report_metrics
+import report_scheduler
+
+logger = logging.getLogger(__name__)
+
+apiTimeout = (10, 300)     # Connect and read timeout in seconds for each GET call, other calls only have the connect timeout
+apiRetryAttempts = 4       # Attempts made for a call before it is considered failed
+apiRetryBaseDelay = 1.0    # Seconds, doubled after each failed attempt
+apiRetryMaxDelay = 30.0    # Upper limit in seconds for the delay between attempts
+
+# Retryable failures in this run, once there are more than maxApiErrors (0 for no limit) calls are no longer retried
+apiErrors = {"count" : 0, "maxApiErrors" : 25, "budgetExhausted" : False}
+apiErrorLock = threading.Lock()
+
+installedSession = {"session" : None}  # For the calls the report makes itself rather than through the common API modules
+
+#------------------------------------------------------------------#
+class ReportSession(requests.Session):
+
+    def request(self, method, url, **kwargs):
+        # Don't let a single hung read stall the report.  Uploads only get the connect timeout
+        # since posting a large report can take longer than any read should
+        if "timeout" not in kwargs:
+            kwargs["timeout"] = apiTimeout if method.upper() == "GET" else (apiTimeout[0], None)
+        return super().request(method, url, **kwargs)
+
+#------------------------------------------------------------------#
+def create_session(poolSize):
+    logger.info("Entering create_session")
+
+    # The pool needs to hold a connection for each concurrent request so they can all be reused.  Failed
+    # calls are retried by call_api only, the adapter makes a single attempt
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=poolSize)
+
+    session = ReportSession()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Count the bytes sent and received by every call made through the session
+    session.hooks["response"].append(record_transfer_bytes)
+
+    # Server errors have to be raised for call_api to retry them, the common API modules don't all check
+    session.hooks["response"].append(raise_for_server_error)
+
+    logger.info("    Created session with a pool size of %s" %poolSize)
+
+    return session
+
+#------------------------------------------------------------------#
+def install_session(session):
+    logger.info("Entering install_session")
+
+    # The common API modules call requests.get/post etc directly.  Each of those is a call to
+    # requests.api.request, which opens a new session for every call, so that one function is
+    # replaced for the whole process.  This works for common modules imported before or after
+    # this point and leaves the requests module itself, and its exceptions, untouched
+    requestFunctions = {functionName : getattr(requests, functionName) for functionName in ["request", "get", "head", "post", "put", "patch", "delete"]}
+
+    sessionRequest = session.request
+    requests.api.request = sessionRequest
+    requests.request = sessionRequest
+
+    # Fail now rather than quietly open a connection per call if requests stops working this way
+    assert requests.get.__globals__["request"] is sessionRequest, "requests.get is not routed through the pooled session"
+
+    installedSession["session"] = session
+
+    # A module that took its own reference to a requests function would still bypass the session
+    for moduleName, module in list(sys.modules.items()):
+        if not moduleName.startswith("common.") or module is None:
+            continue
+        for functionName, requestFunction in requestFunctions.items():
+            if getattr(module, functionName, None) is requestFunction:
+                logger.warning("    %s imports requests.%s directly, its calls will not use the pooled session" %(moduleName, functionName))
+
+#------------------------------------------------------------------#
+def configure_retries(maxApiErrors):
+    logger.info("Entering configure_retries")
+
+    with apiErrorLock:
+        apiErrors["maxApiErrors"] = maxApiErrors
+
+    if maxApiErrors:
+        logger.info("    Failed API calls are retried until %s calls have failed" %maxApiErrors)
+    else:
+        logger.info("    Failed API calls are always retried")
+
+#------------------------------------------------------------------#
+def get_session():
+    # Fall back to plain requests calls if no session was installed
+    return installedSession["session"] or requests
+
+#------------------------------------------------------------------#
+def call_api(description, apiFunction, *args, requestType="project"):
+
+    attempt = 1
+
+    while True:
+        try:
+            # Every attempt waits its turn with the scheduler, retry delays are spent outside of it
+            with report_scheduler.request_slot(requestType):
+                return report_metrics.call_timed(apiFunction.__name__, apiFunction, *args)
+        except Exception as error:
+            # A 4xx or a response that can't be read will fail the same way again
+            if not is_retryable(error):
+                logger.error("    %s failed: %s" %(description, error))
+                raise
+
+            with apiErrorLock:
+                apiErrors["count"] += 1
+                errorBudgetExceeded = apiErrors["maxApiErrors"] and apiErrors["count"] > apiErrors["maxApiErrors"]
+                firstExceeded = errorBudgetExceeded and not apiErrors["budgetExhausted"]
+                if firstExceeded:
+                    apiErrors["budgetExhausted"] = True
+
+            if firstExceeded:
+                logger.error("    More than %s API calls have failed, failed calls are no longer retried" %apiErrors["maxApiErrors"])
+
+            # Once too many calls have failed in this run stop retrying so the report finishes with what it has
+            if attempt >= apiRetryAttempts or errorBudgetExceeded:
+                logger.error("    %s failed after %s attempt(s): %s" %(description, attempt, error))
+                raise
+
+            # Exponential backoff with full jitter so concurrent calls don't all retry at the same moment
+            retryDelay = random.uniform(0, min(apiRetryMaxDelay, apiRetryBaseDelay * 2 ** attempt))
+            logger.warning("    %s failed on attempt %s (%s), retrying in %.1f seconds" %(description, attempt, error, retryDelay))
+            time.sleep(retryDelay)
+            attempt += 1
+
+#------------------------------------------------------------------#
+def is_retryable(error):
+    # Connection problems, timeouts and server errors can clear up on their own
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500
+
+    return False
+
+#------------------------------------------------------------------#
+def raise_for_server_error(response, *args, **kwargs):
+    # Response hook, only for GET calls so nothing is posted twice
+    if response.request.method == "GET" and response.status_code >= 500:
+        response.raise_for_status()
+
+#------------------------------------------------------------------#
+def record_transfer_bytes(response, *args, **kwargs):
+    # Response hook, runs before the body has been read and must not read it.  The length comes from
+    # the Content-Length header so a chunked response, which has none, isn't counted
+    contentLength = response.headers.get("Content-Length", "")
+    if contentLength.isdigit():
+        report_metrics.add_bytes("API bytes received", int(contentLength))
+
+    requestBody = response.request.body
+    if requestBody is not None:
+        report_metrics.add_bytes("API bytes sent", len(requestBody) if isinstance(requestBody, (bytes, str)) else 0)
+
+#------------------------------------------------------------------#
+def log_session_statistics(session):
+
+    numConnections = 0
+    numRequests = 0
+
+    # Each connection pool tracks how many connections it had to open and how many requests it sent
+    for adapter in set(session.adapters.values()):  # http and https share the same adapter
+        pools = adapter.poolmanager.pools
+        for poolKey in pools.keys():
+            connectionPool = pools[poolKey]
+            numConnections += connectionPool.num_connections
+            numRequests += connectionPool.num_requests
+
+    logger.info("API session: %s requests sent over %s connections (%s reused)" %(numRequests, numConnections, max(numRequests - numConnections, 0)))
+    logger.info("API session: %s failed call attempts" %apiErrors["count"])
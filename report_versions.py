@@ -0,0 +1,31 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Created On : Sun Oct 18 2026
+File : report_versions.py
+'''
+import re
+import functools
+
+# Splitting on a capture group always alternates text/number/text/... starting with text
+# (possibly empty) so the number segments are always at the odd positions
+versionSplitPattern = re.compile(r"(\d+)")
+
+#----------------------------------------------------------------------------------------#
+@functools.lru_cache(maxsize=65536)
+def natural_sort_key(version):
+    # Convert the number segments to ints so 1.10 sorts after 1.9.  Since each position holds
+    # the same type for every version two keys never compare an int against a string
+    segments = versionSplitPattern.split(version)
+    segments[1::2] = map(int, segments[1::2])
+    return tuple(segments)
+
+#----------------------------------------------------------------------------------------#
+@functools.lru_cache(maxsize=65536)
+def version_rank_key(version):
+    # Versions starting with text (snapshot, beta etc) sort ahead of the numbered versions.
+    # A flat tuple keeps the comparisons during the sort cheap
+    startsWithText = len(version) > 0 and version[0].isalpha()
+    return (not startsWithText,) + natural_sort_key(version)
@@ -0,0 +1,23 @@
+import os
+
+import report_artifacts
+
+#------------------------------------------------------------------#
+def create_in_worker(reportData):
+    return "%s from %s" %(len(reportData["inventory"]), "worker" if os.getpid() != reportData["parentPID"] else "parent")
+
+#------------------------------------------------------------------#
+def fail_in_worker(reportData):
+    if os.getpid() != reportData["parentPID"]:
+        raise ValueError("failed in worker")
+    return "created again in parent"
+
+#------------------------------------------------------------------#
+def test_artifacts_created_in_forked_workers(monkeypatch):
+    monkeypatch.setattr(report_artifacts.os, "cpu_count", lambda: 2)
+    reportData = {"inventory" : list(range(1000)), "parentPID" : os.getpid()}
+
+    artifactFiles = report_artifacts.generate_artifacts([create_in_worker, fail_in_worker, create_in_worker], reportData)
+
+    # Results come back in the order of the generators, a worker failure is retried in the parent
+    assert [artifactFile for artifactFile, elapsedSeconds in artifactFiles] == ["1000 from worker", "created again in parent", "1000 from worker"]
@@ -0,0 +1,73 @@
+import report_cache
+
+#------------------------------------------------------------------#
+def open_test_cache(monkeypatch, tmp_path, expirationHours=24, maxEntries=100):
+    monkeypatch.setattr(report_cache, "cacheFileName", str(tmp_path / "cache.db"))
+    return report_cache.open_cache(expirationHours, maxEntries)
+
+#------------------------------------------------------------------#
+def test_license_ids_keep_their_type(monkeypatch, tmp_path):
+    cache = open_test_cache(monkeypatch, tmp_path)
+    licenseDetails = {12 : {"selectedLicenseName" : "MIT"}, "LicenseRef-custom" : {"selectedLicenseName" : "Custom"}}
+
+    report_cache.store_license_details(cache, "http://localhost", "2024R3", licenseDetails)
+
+    assert report_cache.load_license_details(cache, "http://localhost", "2024R3") == licenseDetails
+    assert cache["connection"].execute("SELECT DISTINCT typeof(licenseID) FROM licenseDetails").fetchall() == [("text",)]
+
+    report_cache.close_cache(cache)
+
+#------------------------------------------------------------------#
+def set_clock(monkeypatch, currentTime):
+    monkeypatch.setattr(report_cache.time, "time", lambda: currentTime)
+
+#------------------------------------------------------------------#
+def test_component_versions_expire(monkeypatch, tmp_path):
+    cache = open_test_cache(monkeypatch, tmp_path, expirationHours=1)
+
+    set_clock(monkeypatch, 1000000.0)
+    report_cache.store_component_versions(cache, "http://localhost", 7, ["1.0", "1.1"])
+
+    set_clock(monkeypatch, 1000000.0 + 3599)
+    assert report_cache.get_component_versions(cache, "http://localhost", 7) == ["1.0", "1.1"]
+
+    set_clock(monkeypatch, 1000000.0 + 3601)
+    assert report_cache.get_component_versions(cache, "http://localhost", 7) is None
+    assert (cache["hits"], cache["misses"]) == (1, 1)
+
+    report_cache.close_cache(cache)
+
+#------------------------------------------------------------------#
+def test_close_evicts_least_recently_used(monkeypatch, tmp_path):
+    cache = open_test_cache(monkeypatch, tmp_path, maxEntries=2)
+
+    for componentID in [1, 2, 3]:
+        set_clock(monkeypatch, 1000000.0 + componentID)
+        report_cache.store_component_versions(cache, "http://localhost", componentID, ["1.0"])
+
+    # Reading component 1 makes component 2 the least recently used
+    set_clock(monkeypatch, 1000000.0 + 10)
+    report_cache.get_component_versions(cache, "http://localhost", 1)
+    report_cache.close_cache(cache)
+
+    cache = open_test_cache(monkeypatch, tmp_path, maxEntries=2)
+    assert [report_cache.get_component_versions(cache, "http://localhost", componentID) for componentID in [1, 2, 3]] == [["1.0"], None, ["1.0"]]
+
+    report_cache.close_cache(cache)
+
+#------------------------------------------------------------------#
+def test_close_drops_expired_entries(monkeypatch, tmp_path):
+    cache = open_test_cache(monkeypatch, tmp_path, expirationHours=1)
+
+    set_clock(monkeypatch, 1000000.0)
+    report_cache.store_component_versions(cache, "http://localhost", 1, ["1.0"])
+    report_cache.store_project_inventory(cache, "http://localhost", 5, "fingerprint", {"inventoryItems" : []})
+
+    set_clock(monkeypatch, 1000000.0 + 7200)
+    report_cache.close_cache(cache)
+
+    cache = open_test_cache(monkeypatch, tmp_path, expirationHours=1000)
+    assert cache["connection"].execute("SELECT COUNT(*) FROM componentVersions").fetchone() == (0,)
+    assert cache["connection"].execute("SELECT COUNT(*) FROM projectInventory").fetchone() == (0,)
+
+    report_cache.close_cache(cache)
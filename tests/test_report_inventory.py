@@ -0,0 +1,68 @@
+import json
+
+import report_inventory
+
+#------------------------------------------------------------------#
+def create_inventory_item(projectName, componentVersionName, complianceIssues, **versionDetails):
+    return {
+        "projectName" : projectName,
+        "inventoryItemName" : "Item for %s" %componentVersionName,
+        "componentName" : "zlib",
+        "componentVersionName" : componentVersionName,
+        "selectedLicenseName" : "Zlib",
+        "vulnerabilityData" : {"numTotalVulnerabilities" : 3, "numCriticalVulnerabilities" : 1, "numHighVulnerabilities" : 2,
+                                "numMediumVulnerabilities" : 0, "numLowVulnerabilities" : 0, "numNoneVulnerabilities" : 0},
+        "inventoryPriority" : "P2",
+        "componentUrl" : "https://zlib.net",
+        "selectedLicenseUrl" : None,
+        "inventoryReviewStatus" : "Approved",
+        "projectLink" : "http://localhost/codeinsight/FNCI#myprojectdetails/?id=7&tab=projectInventory",
+        "complianceIssues" : complianceIssues,
+        **versionDetails
+    }
+
+#------------------------------------------------------------------#
+def test_record_values_restore_the_record():
+    inventoryStore = report_inventory.create_inventory_store()
+    report_inventory.add_inventory_item(inventoryStore, 12, create_inventory_item("Project", "1.2.11", [report_inventory.ComplianceIssue.SECURITY_VULNERABILITIES, report_inventory.ComplianceIssue.OLD_VERSION],
+                                                                                    latestVersion="1.3", numberVersionsBack=4))
+
+    # The values are kept between runs as JSON
+    recordValues = json.loads(json.dumps(report_inventory.get_record_values(inventoryStore, 12)))
+
+    restoredStore = report_inventory.create_inventory_store()
+    report_inventory.add_inventory_record(restoredStore, 12, recordValues)
+
+    assert list(report_inventory.iter_inventory_rows(restoredStore)) == list(report_inventory.iter_inventory_rows(inventoryStore))
+    assert restoredStore["records"][12].complianceIssues == (report_inventory.ComplianceIssue.SECURITY_VULNERABILITIES, report_inventory.ComplianceIssue.OLD_VERSION)
+
+#------------------------------------------------------------------#
+def test_export_rows_in_inventory_id_order():
+    inventoryStore = report_inventory.create_inventory_store()
+    report_inventory.add_inventory_item(inventoryStore, 30, create_inventory_item("Project", "1.3", []))
+    report_inventory.add_inventory_item(inventoryStore, 4, create_inventory_item("Project", "1.2.11", [report_inventory.ComplianceIssue.OLD_VERSION, report_inventory.ComplianceIssue.UNSPECIFIED_LICENSE],
+                                                                                    latestVersion="1.3", numberVersionsBack=4))
+
+    exportRows = list(report_inventory.iter_export_rows(inventoryStore))
+
+    assert [exportRow[0] for exportRow in exportRows] == [4, 30]
+    assert all(len(exportRow) == len(report_inventory.exportColumns) for exportRow in exportRows)
+
+    exportRow = dict(zip(report_inventory.exportColumns, exportRows[0]))
+    assert exportRow["componentVersionName"] == "1.2.11"
+    assert exportRow["selectedLicenseUrl"] is None
+    assert [exportRow[column] for column in ["numTotalVulnerabilities", "numCriticalVulnerabilities", "numHighVulnerabilities"]] == [3, 1, 2]
+    assert exportRow["complianceIssues"] == ["OLD_VERSION", "UNSPECIFIED_LICENSE"]
+    assert exportRow["inventoryLink"] == exportRow["projectLink"] + "&pinv=4"
+
+#------------------------------------------------------------------#
+def test_export_rows_without_critical_for_cvss_v2():
+    inventoryItem = create_inventory_item("Project", "1.3", [])
+    inventoryItem["vulnerabilityData"].pop("numCriticalVulnerabilities")
+
+    inventoryStore = report_inventory.create_inventory_store()
+    report_inventory.add_inventory_item(inventoryStore, 1, inventoryItem)
+
+    exportRow = dict(zip(report_inventory.exportColumns, next(report_inventory.iter_export_rows(inventoryStore))))
+    assert exportRow["numCriticalVulnerabilities"] is None
+    assert exportRow["complianceIssues"] == []
@@ -0,0 +1,65 @@
+import concurrent.futures
+
+import report_inventory_pages
+
+#------------------------------------------------------------------#
+class RecordingExecutor:
+    # Keeps the requested pages in the order they were submitted instead of fetching them
+    def __init__(self):
+        self.submittedPages = []
+
+    def submit(self, function, pageStream, projectIndex, pageNumber):
+        self.submittedPages.append((projectIndex, pageNumber))
+        return concurrent.futures.Future()
+
+#------------------------------------------------------------------#
+def create_page_stream(numProjects, maxPrefetch):
+    projectList = [{"projectID" : projectIndex + 1, "projectName" : "Project %s" %(projectIndex + 1)} for projectIndex in range(numProjects)]
+    return {"projectList" : projectList, "maxPrefetch" : maxPrefetch, "pageRequests" : {}, "numberOfPages" : {}, "executor" : RecordingExecutor()}
+
+#------------------------------------------------------------------#
+def complete_page(pageStream, projectIndex, pageNumber, numberOfPages):
+    pageStream["pageRequests"][(projectIndex, pageNumber)].set_result(([], numberOfPages))
+
+#------------------------------------------------------------------#
+def test_request_pages_in_the_order_they_are_read():
+    pageStream = create_page_stream(3, 4)
+    pageStream["numberOfPages"][0] = 3
+
+    report_inventory_pages.request_pages(pageStream, 0, 1)
+
+    # The rest of the current project first, then the first page of each later project
+    assert pageStream["executor"].submittedPages == [(0, 2), (0, 3), (1, 1), (2, 1)]
+
+#------------------------------------------------------------------#
+def test_request_pages_follows_first_page_once_its_count_is_known():
+    pageStream = create_page_stream(3, 3)
+
+    report_inventory_pages.request_pages(pageStream, 0, 1)
+    assert pageStream["executor"].submittedPages == [(0, 1), (1, 1), (2, 1)]
+
+    # Project 1 has three pages and its first page has been read
+    complete_page(pageStream, 0, 1, 3)
+    pageStream["pageRequests"].pop((0, 1))
+    pageStream["numberOfPages"][0] = 3
+
+    report_inventory_pages.request_pages(pageStream, 0, 2)
+    assert pageStream["executor"].submittedPages[3:] == [(0, 2)]
+
+    # With the window full nothing more is requested until a page is read
+    report_inventory_pages.request_pages(pageStream, 0, 2)
+    assert pageStream["executor"].submittedPages[3:] == [(0, 2)]
+
+#------------------------------------------------------------------#
+def test_request_pages_skips_pages_already_requested():
+    pageStream = create_page_stream(2, 4)
+    pageStream["numberOfPages"][0] = 4
+
+    # The first page of project 2 has arrived but not been read yet
+    report_inventory_pages.submit_page_request(pageStream, 1, 1)
+    complete_page(pageStream, 1, 1, 2)
+
+    report_inventory_pages.request_pages(pageStream, 0, 3)
+
+    assert pageStream["executor"].submittedPages == [(1, 1), (0, 3), (0, 4), (1, 2)]
+    assert pageStream["numberOfPages"][1] == 2
@@ -0,0 +1,80 @@
+import io
+import requests
+import requests.api
+
+import report_session
+
+#------------------------------------------------------------------#
+def record_session_requests(monkeypatch):
+    sentRequests = []
+    monkeypatch.setattr(requests.Session, "request", lambda session, method, url, **kwargs: sentRequests.append((method, url, kwargs)))
+    return sentRequests
+
+#------------------------------------------------------------------#
+def test_get_has_read_timeout(monkeypatch):
+    sentRequests = record_session_requests(monkeypatch)
+
+    report_session.create_session(2).get("http://localhost/codeinsight/api/projects/1")
+
+    assert sentRequests[0][2]["timeout"] == report_session.apiTimeout
+
+#------------------------------------------------------------------#
+def test_upload_has_no_read_timeout(monkeypatch):
+    sentRequests = record_session_requests(monkeypatch)
+
+    report_session.create_session(2).post("http://localhost/codeinsight/api/projects/1/reports/2", data=b"report")
+
+    assert sentRequests[0][2]["timeout"] == (report_session.apiTimeout[0], None)
+
+#------------------------------------------------------------------#
+def test_install_session_routes_requests_calls(monkeypatch):
+    sentRequests = record_session_requests(monkeypatch)
+    monkeypatch.setattr(requests.api, "request", requests.api.request)
+    monkeypatch.setattr(requests, "request", requests.request)
+    monkeypatch.setitem(report_session.installedSession, "session", None)
+
+    session = report_session.create_session(2)
+    report_session.install_session(session)
+
+    # Module level calls, as made by the common API modules, go through the session and keep their options
+    requests.get("http://localhost/codeinsight/api/projects/1", headers={"Authorization" : "Bearer token"})
+
+    assert sentRequests[0][0] == "get"
+    assert sentRequests[0][2]["headers"] == {"Authorization" : "Bearer token"}
+    assert sentRequests[0][2]["timeout"] == report_session.apiTimeout
+    assert report_session.get_session() is session
+
+#------------------------------------------------------------------#
+def test_transfer_bytes_from_content_length(monkeypatch):
+    monkeypatch.setitem(report_session.report_metrics.reportMetrics, "bytes", {})
+
+    response = requests.Response()
+    response.headers["Content-Length"] = "1234"
+    response.raw = io.BytesIO(b"not read by the hook")
+    response.request = requests.Request("GET", "http://localhost/codeinsight/api/projects/1").prepare()
+
+    report_session.record_transfer_bytes(response)
+
+    assert report_session.report_metrics.reportMetrics["bytes"] == {"API bytes received" : 1234}
+    assert response.raw.tell() == 0
+
+#------------------------------------------------------------------#
+def create_http_error(statusCode):
+    response = requests.Response()
+    response.status_code = statusCode
+    return requests.HTTPError("%s error" %statusCode, response=response)
+
+#------------------------------------------------------------------#
+def test_is_retryable():
+    # Connection problems, timeouts and server errors can clear up on their own
+    assert report_session.is_retryable(requests.ConnectionError("refused"))
+    assert report_session.is_retryable(requests.Timeout("read timed out"))
+    assert report_session.is_retryable(create_http_error(500))
+    assert report_session.is_retryable(create_http_error(503))
+
+    # Client errors and responses that can't be read fail the same way every time
+    assert not report_session.is_retryable(create_http_error(401))
+    assert not report_session.is_retryable(create_http_error(404))
+    assert not report_session.is_retryable(requests.HTTPError("no response"))
+    assert not report_session.is_retryable(ValueError("not json"))
+    assert not report_session.is_retryable(KeyError("data"))